@@ -33,6 +33,7 @@ from obspy.core.event.resourceid import ResourceIdentifier
 from obspy.core.event.header import DataUsedWaveType, ATTRIBUTE_HAS_ERRORS
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import AttribDict
+from obspy.core.util.misc import _deepcopy_tree
 
 
 class QuantityError(AttribDict):
@@ -202,6 +203,17 @@ def _event_type_class_factory(class_name, class_attributes=[],
         for key, value in _properties:
             _property_dict[key] = value
         _containers = class_contains
+        # Empty containers and error quantities make up most of the memory
+        # of a typical object (e.g. a Pick) and are only created on first
+        # access. Map their names to the callable creating the empty value.
+        _lazy_defaults = {}
+        for key in _property_keys:
+            if key.endswith("_errors"):
+                _lazy_defaults[key] = QuantityError
+        for key in class_contains:
+            _lazy_defaults[key] = list
+        _all_keys = _property_keys + _containers
+        _all_keys_set = set(_all_keys)
         warn_on_non_default_key = True
         defaults = dict.fromkeys(class_contains, [])
         defaults.update(dict.fromkeys(_property_keys, None))
@@ -215,7 +227,8 @@ def _event_type_class_factory(class_name, class_attributes=[],
                 # Use the class_attributes list here because it is not yet
                 # polluted be the error quantities.
                 kwargs[class_attributes[_i][0]] = item
-            # Set all property values to None or the kwarg value.
+            # Set all property values to None or the kwarg value. Errors
+            # which are not given are created on first access.
             for key, _ in self._properties:
                 value = kwargs.get(key, None)
                 # special handling for resource id
@@ -223,18 +236,93 @@ def _event_type_class_factory(class_name, class_attributes=[],
                     if kwargs.get("force_resource_id", False):
                         if value is None:
                             value = ResourceIdentifier()
+                elif value is None and key in self._lazy_defaults:
+                    continue
                 setattr(self, key, value)
-            # Containers currently are simple lists.
+            # Containers currently are simple lists. Empty ones are created
+            # on first access.
             for name in self._containers:
-                setattr(self, name, list(kwargs.get(name, [])))
-            # All errors are QuantityError. If they are not set yet, set them
-            # now.
-            for key, _ in self._properties:
-                if key.endswith("_errors") and getattr(self, key) is None:
-                    setattr(self, key, QuantityError())
+                if kwargs.get(name):
+                    setattr(self, name, list(kwargs[name]))
+
+        def __getitem__(self, name, default=None):
+            try:
+                return self.__dict__[name]
+            except KeyError:
+                factory = self._lazy_defaults.get(name)
+                if factory is None:
+                    return super(AbstractEventType, self).__getitem__(
+                        name, default)
+                # Create and store the empty container or error.
+                value = factory()
+                object.__setattr__(self, name, value)
+                return value
+
+        def _peek(self, name):
+            """
+            Get an attribute without creating lazy attributes.
+
+            Not yet created containers or errors are returned as new empty
+            objects which are not stored on the instance.
+            """
+            try:
+                return self.__dict__[name]
+            except KeyError:
+                factory = self._lazy_defaults.get(name)
+                if factory is None:
+                    return getattr(self, name)
+                return factory()
+
+        def __iter__(self):
+            # Lazy attributes are part of the mapping even if they have not
+            # been created yet. Keep the order of the class definition.
+            keys = self.__dict__
+            for key in self._all_keys:
+                if key in keys or key in self._lazy_defaults:
+                    yield key
+            for key in list(keys):
+                if key not in self._all_keys_set:
+                    yield key
+
+        def __len__(self):
+            return sum(1 for _ in self)
+
+        def update(self, adict={}):
+            # Values of known keys are stored as they are (as done by
+            # AttribDict) but keep the shared key layout of __dict__, see
+            # __setattr__. This is used when copying and unpickling.
+            for key, value in adict.items():
+                if key in self.readonly:
+                    continue
+                if key in self._all_keys_set and not isinstance(value, dict):
+                    object.__setattr__(self, key, value)
+                else:
+                    self.__setitem__(key, value)
+
+        def __deepcopy__(self, memodict=None):
+            # Same result as AttribDict.__deepcopy__ but without running
+            # __init__ (which e.g. creates a throwaway resource id) and with
+            # a fast copy of the attribute values.
+            memodict = {} if memodict is None else memodict
+            cls = self.__class__
+            new = cls.__new__(cls)
+            memodict[id(self)] = new
+            for key, value in self.__dict__.items():
+                object.__setattr__(new, key, _deepcopy_tree(value, memodict))
+            return new
+
+        def __setstate__(self, adict):
+            # Lazy attributes must not be initialized with the shared
+            # defaults.
+            self.__dict__.update(
+                (key, value) for key, value in self.defaults.items()
+                if key not in self._lazy_defaults)
+            self.update(adict)
 
         def clear(self):
-            super(AbstractEventType, self).clear()
+            # MutableMapping.clear() would never finish as lazy attributes
+            # are recreated when popped.
+            self.__dict__.clear()
             self.__init__(force_resource_id=False)
 
         def __str__(self, force_one_line=False):
@@ -251,7 +339,7 @@ def _event_type_class_factory(class_name, class_attributes=[],
             attributes = [_i for _i in self._property_keys if not
                           _i.endswith("_errors") and _bool(getattr(self, _i))]
             containers = [_i for _i in self._containers if
-                          _bool(getattr(self, _i))]
+                          _bool(self._peek(_i))]
 
             # Get the longest attribute/container name to print all of them
             # nicely aligned.
@@ -273,7 +361,7 @@ def _event_type_class_factory(class_name, class_attributes=[],
                 repr_str = value.__repr__()
                 # Print any associated errors.
                 error_key = key + "_errors"
-                if self.get(error_key, False):
+                if self.__dict__.get(error_key, False):
                     err_items = sorted(getattr(self, error_key).items())
                     repr_str += " [%s]" % ', '.join(
                         sorted([str(k) + "=" + str(v) for k, v in err_items
@@ -324,8 +412,8 @@ def _event_type_class_factory(class_name, class_attributes=[],
         def __bool__(self):
             # We use custom _bool() for testing getattr() since we want
             # zero valued int and float and empty string attributes to be True.
-            if any([_bool(getattr(self, _i))
-                    for _i in self._property_keys + self._containers]):
+            if any([_bool(self.__dict__.get(_i))
+                    for _i in self._all_keys]):
                 return True
             return False
 
@@ -336,13 +424,14 @@ def _event_type_class_factory(class_name, class_attributes=[],
             """
             # Looping should be quicker on average than a list comprehension
             # because only the first non-equal attribute will already return.
-            for attrib in self._property_keys:
-                if not hasattr(other, attrib) or \
-                   (getattr(self, attrib) != getattr(other, attrib)):
+            # Do not create lazy attributes just for the comparison.
+            peek = getattr(other, "_peek", None)
+            for attrib in self._all_keys:
+                try:
+                    value = peek(attrib) if peek else getattr(other, attrib)
+                except AttributeError:
                     return False
-            for container in self._containers:
-                if not hasattr(other, container) or \
-                   (getattr(self, container) != getattr(other, container)):
+                if self._peek(attrib) != value:
                     return False
             return True
 
@@ -361,8 +450,12 @@ def _event_type_class_factory(class_name, class_attributes=[],
                 dict.__setattr__(self, name, value)
                 return
             # Pass to the parent method if not a custom property.
-            if name not in self._property_dict.keys():
-                AttribDict.__setattr__(self, name, value)
+            if name not in self._property_dict:
+                if name in self._lazy_defaults and \
+                        isinstance(value, list) and name not in self.readonly:
+                    object.__setattr__(self, name, value)
+                else:
+                    AttribDict.__setattr__(self, name, value)
                 return
             attrib_type = self._property_dict[name]
             # If the value is None or already the correct type just set it.
@@ -390,7 +483,16 @@ def _event_type_class_factory(class_name, class_attributes=[],
 
                     raise ValueError(msg)
 
-            AttribDict.__setattr__(self, name, value)
+            # Properties are default keys and the value has the right type
+            # (no plain dict) at this point, so the checks in
+            # AttribDict.__setitem__ are not needed.
+            if name in self.readonly:
+                # raises the usual read only error
+                AttribDict.__setitem__(self, name, value)
+            # Setting through object.__setattr__ instead of __dict__ lets all
+            # instances of a class share the key layout of their __dict__,
+            # which roughly halves its size.
+            object.__setattr__(self, name, value)
             # if value is a resource id bind or unbind the resource_id
             if isinstance(value, ResourceIdentifier):
                 if name == "resource_id":  # bind the resource_id to self
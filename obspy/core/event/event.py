@@ -21,8 +21,6 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
 
-import copy
-
 from obspy.core.event.header import (
     EventType, EventTypeCertainty, EventDescriptionType)
 from obspy.core.event.resourceid import ResourceIdentifier
@@ -285,12 +283,7 @@ class Event(__Event):
         reset resource_id's object_id after deep copy to allow the
         object specific behavior of get_referred_object
         """
-        memodict = memodict or {}
-        cls = self.__class__
-        result = cls.__new__(cls)
-        memodict[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, memodict))
+        result = super(Event, self).__deepcopy__(memodict)
         result.scope_resource_ids()
         return result
 
@@ -15,6 +15,7 @@ from future.builtins import *  # NOQA
 from future.utils import native_str
 
 import re
+import sys
 import warnings
 from contextlib import contextmanager
 from copy import deepcopy
@@ -34,7 +35,13 @@ class _ResourceKey(object):
     This class allows the python gc to handle cleanup of the
     ResourceIdentifier stored class state rather than manual reference
     counting as was implemented before.
+
+    Instances carry no state of their own, they only need to be weakly
+    referable. Using slots keeps them small, which matters for catalogs with
+    millions of picks and arrivals.
     """
+    __slots__ = ('__weakref__',)
+
     # define a mapping from a resource string to a singleton instance
     _singleton_cache = WeakValueDictionary()
 
@@ -47,10 +54,33 @@ class _ResourceKey(object):
 
     @classmethod
     def get_resource_key(cls, unique_id):
-        if unique_id not in _ResourceKey._singleton_cache:
+        cache = _ResourceKey._singleton_cache
+        # A single lookup is enough in the common case, the returned strong
+        # reference keeps the key alive until it is handed to the caller.
+        single = cache.get(unique_id)
+        if single is None:
             single = _ResourceKey()
-            _ResourceKey._singleton_cache[unique_id] = single
-        return _ResourceKey._singleton_cache[unique_id]
+            cache[unique_id] = single
+        return single
+
+
+_intern_str = getattr(sys, 'intern', None) or intern  # NOQA
+
+
+def _intern(value):
+    """
+    Intern a resource id string.
+
+    Ids read from files are referenced many times (e.g. pick ids by
+    arrivals and amplitudes), interning lets all of them share one string
+    object and speeds up the dictionary lookups done with them.
+    """
+    try:
+        return _intern_str(value)
+    except TypeError:
+        # Only exact str instances can be interned (on Py2 only byte strings,
+        # not the unicode based str of future).
+        return value
 
 
 class _ResourceKeyDescriptor(object):
@@ -428,36 +458,47 @@ class ResourceIdentifier(object):
         :type parent: object, int
         """
 
+        id_order = ResourceIdentifier._id_order
+        id_object_map = ResourceIdentifier._id_object_map
+        resource_key = self._resource_key
         # Get the last object bound to this instance of ResourceIdentifier or
         # if there is None, get the last referred_object assigned the same
-        # resource_id code.
-        id_order = ResourceIdentifier._id_order
-        old = ResourceIdentifier._id_object_map.get(self._object_key, None)
-        if old is None:  # Look for last object with same resource id.
-            try:
-                old_obj_id_key = id_order[self._resource_key][-1]
-                old = ResourceIdentifier._id_object_map[old_obj_id_key]
-            except (KeyError, IndexError):
-                pass
-        if warn and old is not None and old != referred_object:
-            msg = ('Warning, binding object to resource ID %s which '
-                   'is not equal to the last object bound to this '
-                   'resource_id') % self.id
-            warnings.warn(msg, UserWarning)
+        # resource_id code. This is only needed for the warning, so skip the
+        # lookups if no warning is requested.
+        if warn:
+            old = id_object_map.get(self._object_key, None)
+            if old is None:  # Look for last object with same resource id.
+                try:
+                    old_obj_id_key = id_order[resource_key][-1]
+                    old = id_object_map[old_obj_id_key]
+                except (KeyError, IndexError):
+                    pass
+            if old is not None and old != referred_object:
+                msg = ('Warning, binding object to resource ID %s which '
+                       'is not equal to the last object bound to this '
+                       'resource_id') % self.id
+                warnings.warn(msg, UserWarning)
         # Set the object id to the new object, and update parent scoping tree.
         self._object_id = id(referred_object)
+        object_key = self._object_key
         if parent is not None or self._parent_key is not None:
             if parent is not None:
                 self._parent_key = parent
+            parent_key = self._parent_key
             id_tree = ResourceIdentifier._parent_id_tree
-            if self._parent_key not in id_tree:
-                id_tree[self._parent_key] = WeakKeyDictionary()
-            id_tree[self._parent_key][self._resource_key] = self._object_key
+            scope = id_tree.get(parent_key)
+            if scope is None:
+                scope = id_tree[parent_key] = WeakKeyDictionary()
+            scope[resource_key] = object_key
         # Set the new id in id map and append referred_object to id_order.
-        ResourceIdentifier._id_object_map[self._object_key] = referred_object
-        if self._resource_key not in id_order:
-            id_order[self._resource_key] = []
-        id_order[self._resource_key].append(self._object_key)
+        id_object_map[object_key] = referred_object
+        rid_list = id_order.get(resource_key)
+        if rid_list is None:
+            rid_list = id_order[resource_key] = []
+        # Re-binding the newest object again (e.g. when re-scoping an event
+        # after copying or unpickling) must not grow the list.
+        if not rid_list or rid_list[-1] != object_key:
+            rid_list.append(object_key)
 
     def convert_id_to_quakeml_uri(self, authority_id="local"):
         """
@@ -534,6 +575,8 @@ class ResourceIdentifier(object):
         """
         Make sure the resource_key follows the singleton pattern.
         """
+        if 'id' in state:
+            state['id'] = _intern(state['id'])
         self.__dict__ = state
         self._parent_key = None
         self._resource_key = _ResourceKey.get_resource_key(self.id)
@@ -578,7 +621,7 @@ class ResourceIdentifier(object):
                    'object is very dangerous and will raise an exception in '
                    'a future version of obspy')
             warnings.warn(msg, UserWarning)
-        self.__dict__["id"] = value
+        self.__dict__["id"] = _intern(value)
 
     @property
     def prefix(self):
@@ -25,10 +25,11 @@ from obspy.core.util.base import (ENTRY_POINTS, ComparingObject,
                                   _read_from_plugin, NamedTemporaryFile,
                                   download_to_file, sanitize_filename)
 from obspy.core.util.decorator import map_example_filename
-from obspy.core.util.misc import buffered_load_entry_point
+from obspy.core.util.misc import _deepcopy_tree, buffered_load_entry_point
 from obspy.core.util.obspy_types import ObsPyException, ZeroSamplingRate
 
 from .network import Network
+from .response import Response
 from .util import _unified_content_strings, _textwrap
 
 # Make sure this is consistent with obspy.io.stationxml! Importing it
@@ -144,7 +145,7 @@ class Inventory(ComparingObject):
             self.created = created
 
     def __add__(self, other):
-        new = copy.deepcopy(self)
+        new = self.copy()
         new += other
         return new
 
@@ -167,6 +168,41 @@ class Inventory(ComparingObject):
     def __getitem__(self, index):
         return self.networks[index]
 
+    def copy(self, share_responses=False):
+        """
+        Returns a deepcopy of the Inventory object.
+
+        The copy gives the same result as :func:`copy.deepcopy` but is a lot
+        faster for large inventories.
+
+        :type share_responses: bool
+        :param share_responses: If ``True``, the
+            :class:`~obspy.core.inventory.response.Response` objects of the
+            channels are not copied but shared between the original and the
+            copy. This makes copying even faster and saves memory, but any
+            in-place change to a response (e.g. of a stage gain) will show up
+            in both inventories. Replacing the response of a channel is safe.
+        :rtype: :class:`~obspy.core.inventory.inventory.Inventory`
+        :return: Copy of current inventory.
+
+        .. rubric:: Example
+
+        >>> from obspy import read_inventory
+        >>> inv = read_inventory()
+        >>> inv2 = inv.copy()
+        >>> inv is inv2
+        False
+        >>> inv == inv2
+        True
+        >>> inv3 = inv.copy(share_responses=True)
+        >>> inv3 == inv
+        True
+        >>> inv3[0][0][0].response is inv[0][0][0].response
+        True
+        """
+        shared_types = (Response, ) if share_responses else ()
+        return _deepcopy_tree(self, shared_types=shared_types)
+
     def __copy_inventory_metadata(self, other):
         """
         Will be called after two inventory objects have been merged. It
@@ -13,12 +13,12 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
 
-import copy
 import re
 from textwrap import TextWrapper
 
 from obspy import UTCDateTime
 from obspy.core.util.base import ComparingObject
+from obspy.core.util.misc import _deepcopy_tree
 from obspy.core.util.obspy_types import (FloatWithUncertaintiesAndUnit,
                                          FloatWithUncertaintiesFixedUnit)
 
@@ -110,10 +110,19 @@ class BaseNode(ComparingObject):
         else:
             self._historical_code = None
 
-    def copy(self):
+    def copy(self, share_responses=False):
         """
         Returns a deepcopy of the object.
 
+        The copy gives the same result as :func:`copy.deepcopy` but is a lot
+        faster for large networks and stations.
+
+        :type share_responses: bool
+        :param share_responses: If ``True``, channel responses are shared
+            between the original and the copy instead of being copied. See
+            :meth:`Inventory.copy()
+            <obspy.core.inventory.inventory.Inventory.copy>`.
+
         :rtype: same class as original object
         :return: Copy of current object.
 
@@ -145,7 +154,9 @@ class BaseNode(ComparingObject):
             >>> sta == sta3
             True
         """
-        return copy.deepcopy(self)
+        from .response import Response
+        shared_types = (Response, ) if share_responses else ()
+        return _deepcopy_tree(self, shared_types=shared_types)
 
     def is_active(self, time=None, starttime=None, endtime=None):
         """
@@ -770,6 +770,108 @@ class BaseTestCase(unittest.TestCase):
             "On Origin object: Value '-inf' for 'latitude' is "
             "not a finite floating point value.")
 
+    def _get_lazy_and_eager_picks(self):
+        """
+        Helper returning a pick with lazy errors and containers and an
+        identical pick with all of them created.
+        """
+        rid = ResourceIdentifier('smi:local/lazy_pick')
+        lazy = Pick(resource_id=rid, time=UTCDateTime(0), phase_hint='P')
+        eager = Pick(resource_id=rid, time=UTCDateTime(0), phase_hint='P',
+                     time_errors=QuantityError(),
+                     horizontal_slowness_errors=QuantityError(),
+                     backazimuth_errors=QuantityError())
+        eager.comments = []
+        return lazy, eager
+
+    def test_lazy_attributes(self):
+        """
+        Empty errors and containers are only created on first access, a
+        new object is created for every instance.
+        """
+        pick_1, pick_2 = Pick(), Pick()
+        for name in ('time_errors', 'comments'):
+            self.assertNotIn(name, pick_1.__dict__)
+        self.assertEqual(pick_1.time_errors, QuantityError())
+        self.assertIn('time_errors', pick_1.__dict__)
+        pick_1.comments.append(Comment(text='a'))
+        pick_1.time_errors.uncertainty = 0.1
+        self.assertEqual(len(pick_1.comments), 1)
+        self.assertEqual(pick_2.comments, [])
+        self.assertEqual(pick_2.time_errors, QuantityError())
+        self.assertEqual(pick_1['comments'][0].text, 'a')
+        self.assertEqual(pick_1.get('time_errors').uncertainty, 0.1)
+
+    def test_lazy_attributes_mapping_interface(self):
+        """
+        Lazy attributes are part of the mapping before they are created.
+        """
+        lazy, eager = self._get_lazy_and_eager_picks()
+        self.assertEqual(len(lazy), len(eager))
+        self.assertEqual(list(lazy.keys()), list(eager.keys()))
+        self.assertIn('comments', lazy)
+        self.assertIn('backazimuth_errors', lazy)
+        self.assertEqual(dict(lazy.items()), dict(eager.items()))
+
+    def test_lazy_attributes_equality(self):
+        """
+        Comparing does not create lazy attributes and objects compare equal
+        to eagerly created ones.
+        """
+        lazy, eager = self._get_lazy_and_eager_picks()
+        self.assertEqual(lazy, eager)
+        self.assertEqual(eager, lazy)
+        self.assertNotIn('time_errors', lazy.__dict__)
+        self.assertNotIn('comments', lazy.__dict__)
+        self.assertFalse(bool(Pick(force_resource_id=False)))
+        eager.time_errors.uncertainty = 0.1
+        self.assertNotEqual(lazy, eager)
+        self.assertNotEqual(eager, lazy)
+
+    def test_lazy_attributes_copy_and_pickle(self):
+        """
+        Deep copies and unpickled objects compare equal and get their own
+        lazy attributes.
+        """
+        lazy, eager = self._get_lazy_and_eager_picks()
+        for pick in (lazy, eager):
+            for other in (pick.copy(),
+                          pickle.loads(pickle.dumps(pick, protocol=2))):
+                self.assertEqual(other, lazy)
+                self.assertEqual(other, eager)
+                other.comments.append(Comment(text='a'))
+                other.time_errors.uncertainty = 0.1
+                self.assertEqual(lazy.comments, [])
+                self.assertEqual(lazy.time_errors, QuantityError())
+                self.assertNotEqual(other, lazy)
+
+    def test_clear_with_lazy_attributes(self):
+        """
+        Clearing an object resets created lazy attributes.
+        """
+        pick = Pick(phase_hint='P')
+        pick.comments.append(Comment(text='a'))
+        pick.time_errors.uncertainty = 0.1
+        pick.clear()
+        self.assertEqual(pick, Pick(force_resource_id=False))
+        self.assertEqual(pick.comments, [])
+        self.assertEqual(pick.time_errors, QuantityError())
+
+    def test_setting_properties(self):
+        """
+        Properties are stored directly and values given as dict are still
+        converted.
+        """
+        pick = Pick()
+        pick.time_errors = {'uncertainty': 0.1}
+        self.assertIs(type(pick.time_errors), QuantityError)
+        self.assertEqual(pick.time_errors.uncertainty, 0.1)
+        pick.creation_info = {'author': 'me'}
+        self.assertIs(type(pick.creation_info), CreationInfo)
+        pick.update({'phase_hint': 'S', 'time_errors': {'uncertainty': 1}})
+        self.assertEqual(pick.phase_hint, 'S')
+        self.assertEqual(pick.time_errors['uncertainty'], 1)
+
 
 def suite():
     suite = unittest.TestSuite()
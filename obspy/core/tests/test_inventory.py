@@ -254,6 +254,31 @@ class InventoryTestCase(unittest.TestCase):
         self.assertEqual(len(inv), len(inv.networks))
         self.assertEqual(len(inv), 2)
 
+    def test_copy(self):
+        """
+        Tests Inventory.copy() and BaseNode.copy().
+        """
+        inv = read_inventory()
+        for share_responses in (False, True):
+            inv2 = inv.copy(share_responses=share_responses)
+            self.assertEqual(inv, inv2)
+            self.assertIsNot(inv[0], inv2[0])
+            cha, cha2 = inv[0][0][0], inv2[0][0][0]
+            self.assertIsNot(cha, cha2)
+            self.assertIsNot(cha.latitude, cha2.latitude)
+            self.assertEqual(cha.latitude.__dict__, cha2.latitude.__dict__)
+            self.assertEqual(cha.response, cha2.response)
+            self.assertEqual(cha.response is cha2.response, share_responses)
+            sta2 = inv[0][0].copy(share_responses=share_responses)
+            self.assertEqual(inv[0][0], sta2)
+            self.assertEqual(sta2[0].response is cha.response,
+                             share_responses)
+        # changes of the copy do not affect the original
+        inv2 = inv.copy()
+        inv2[0][0][0].response.response_stages[0].stage_gain = 1.0
+        inv2[0][0].channels.pop()
+        self.assertEqual(inv, read_inventory())
+
     def test_inventory_remove(self):
         """
         Test for the Inventory.remove() method.
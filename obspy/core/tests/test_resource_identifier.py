@@ -659,6 +659,42 @@ class ResourceIdentifierTestCase(unittest.TestCase):
             # needs to call get_object_hook to find it
             self.assertIs(rid1.get_referred_object(), new_obj1)
 
+    def test_resource_keys_are_compact(self):
+        """
+        _ResourceKey instances hold no state and must not carry a __dict__.
+        """
+        key = _ResourceKey.get_resource_key('some_compact_key')
+        self.assertFalse(hasattr(key, '__dict__'))
+        self.assertIs(key, _ResourceKey.get_resource_key('some_compact_key'))
+
+    def test_ids_are_interned(self):
+        """
+        Equal ids should share the same string object, also after
+        unpickling.
+        """
+        id_1 = ''.join(['smi:local/', 'interned'])
+        id_2 = ''.join(['smi:local/', 'interned'])
+        self.assertIsNot(id_1, id_2)
+        rid_1 = ResourceIdentifier(id_1)
+        rid_2 = ResourceIdentifier(id_2)
+        self.assertIs(rid_1.id, rid_2.id)
+        rid_3 = pickle.loads(pickle.dumps(rid_1))
+        self.assertIs(rid_3.id, rid_1.id)
+
+    def test_rescoping_does_not_grow_id_order(self):
+        """
+        Repeatedly scoping the resource ids of an event (as done on copying
+        and unpickling) should not keep adding entries to the class state.
+        """
+        ev = create_diverse_catalog()[0]
+        pick = ev.picks[0]
+        rid_list = self.id_order[pick.resource_id._resource_key]
+        length = len(rid_list)
+        for _ in range(5):
+            ev.scope_resource_ids()
+        self.assertEqual(len(rid_list), length)
+        self.assertIs(pick.resource_id.get_referred_object(), pick)
+
 
 def get_instances(obj, cls=None, is_attr=None, has_attr=None):
     """
@@ -10,11 +10,14 @@ import tempfile
 import unittest
 import warnings
 
+import numpy as np
+
 from obspy import UTCDateTime, read
 from obspy.core.compatibility import mock
 from obspy.core.event import ResourceIdentifier as ResId
 from obspy.core.util.misc import CatchOutput, get_window_times, \
-    _ENTRY_POINT_CACHE, _yield_obj_parent_attr
+    _ENTRY_POINT_CACHE, _yield_obj_parent_attr, _deepcopy_tree
+from obspy.core.util.obspy_types import FloatWithUncertainties
 from obspy.core.util.testing import WarningsCapture
 
 
@@ -295,6 +298,43 @@ class UtilMiscTestCase(unittest.TestCase):
             self.assertEqual(attr, 'right')
             self.assertIsInstance(obj, ResId)
 
+    def test_deepcopy_tree(self):
+        """
+        Tests that _deepcopy_tree gives the same result as copy.deepcopy.
+        """
+        class Node(object):
+            def __init__(self, value, children=None):
+                self.value = value
+                self.children = children or []
+
+        shared = Node(FloatWithUncertainties(1.5, lower_uncertainty=0.1))
+        tree = Node(UTCDateTime(0), [
+            shared, shared, Node({'a': [1, 2.0, 'b', None]}),
+            Node(ResId('smi:local/some_id')), Node(np.arange(3))])
+        tree.children.append(Node(tree))  # reference cycle
+        new = _deepcopy_tree(tree)
+        self.assertIsNot(new, tree)
+        self.assertIs(type(new), Node)
+        self.assertEqual(new.value, tree.value)
+        self.assertIsNot(new.value, tree.value)
+        # objects referenced multiple times are copied once
+        self.assertIs(new.children[0], new.children[1])
+        self.assertIsNot(new.children[0], shared)
+        self.assertIs(new.children[-1].value, new)
+        value = new.children[0].value
+        self.assertIs(type(value), FloatWithUncertainties)
+        self.assertEqual(value, 1.5)
+        self.assertEqual(value.lower_uncertainty, 0.1)
+        self.assertEqual(new.children[2].value, {'a': [1, 2.0, 'b', None]})
+        self.assertIsNot(new.children[2].value['a'],
+                         tree.children[2].value['a'])
+        self.assertEqual(new.children[3].value, tree.children[3].value)
+        np.testing.assert_array_equal(new.children[4].value, np.arange(3))
+        self.assertIsNot(new.children[4].value, tree.children[4].value)
+        # shared types are not copied
+        new = _deepcopy_tree(tree, shared_types=(np.ndarray, ))
+        self.assertIs(new.children[4].value, tree.children[4].value)
+
     def test_warning_capture(self):
         """
         Tests for the WarningsCapture class in obspy.core.util.testing
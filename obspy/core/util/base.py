@@ -39,11 +39,11 @@ DEFAULT_MODULES = ['clients.filesystem', 'core', 'db', 'geodetics', 'imaging',
                    'io.cnv', 'io.css', 'io.iaspei', 'io.win', 'io.gcf',
                    'io.gse2', 'io.json', 'io.kinemetrics', 'io.kml',
                    'io.mseed', 'io.ndk', 'io.nied', 'io.nlloc', 'io.nordic',
-                   'io.pdas', 'io.pde', 'io.quakeml', 'io.reftek', 'io.rg16',
-                   'io.sac', 'io.scardec', 'io.seg2', 'io.segy', 'io.seisan',
-                   'io.sh', 'io.shapefile', 'io.seiscomp', 'io.stationtxt',
-                   'io.stationxml', 'io.wav', 'io.xseed', 'io.y', 'io.zmap',
-                   'realtime', 'scripts', 'signal', 'taup']
+                   'io.npz', 'io.pdas', 'io.pde', 'io.quakeml', 'io.reftek',
+                   'io.rg16', 'io.sac', 'io.scardec', 'io.seg2', 'io.segy',
+                   'io.seisan', 'io.sh', 'io.shapefile', 'io.seiscomp',
+                   'io.stationtxt', 'io.stationxml', 'io.wav', 'io.xseed',
+                   'io.y', 'io.zmap', 'realtime', 'scripts', 'signal', 'taup']
 NETWORK_MODULES = ['clients.arclink', 'clients.earthworm', 'clients.fdsn',
                    'clients.iris', 'clients.neic', 'clients.nrl',
                    'clients.seedlink', 'clients.seishub', 'clients.syngine']
@@ -54,7 +54,7 @@ WAVEFORM_PREFERRED_ORDER = ['MSEED', 'SAC', 'GSE2', 'SEISAN', 'SACXY', 'GSE1',
                             'Q', 'SH_ASC', 'SLIST', 'TSPAIR', 'Y', 'PICKLE',
                             'SEGY', 'SU', 'SEG2', 'WAV', 'WIN', 'CSS',
                             'NNSA_KB_CORE', 'AH', 'PDAS', 'KINEMETRICS_EVT',
-                            'GCF']
+                            'GCF', 'OBSPYNPZ']
 EVENT_PREFERRED_ORDER = ['QUAKEML', 'NLLOC_HYP']
 INVENTORY_PREFERRED_ORDER = ['STATIONXML', 'SEED', 'RESP']
 # waveform plugins accepting a byteorder keyword
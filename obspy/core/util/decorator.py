@@ -173,7 +173,10 @@ def uncompress_file(func, filename, *args, **kwargs):
     elif zipfile.is_zipfile(filename):
         try:
             zip = zipfile.ZipFile(filename)
-            obj_list = [zip.read(name) for name in zip.namelist()]
+            names = zip.namelist()
+            # NumPy .npz archives (e.g. OBSPYNPZ) are read as a whole
+            if not all(name.endswith('.npy') for name in names):
+                obj_list = [zip.read(name) for name in names]
         except Exception:
             pass
     elif filename.endswith('.bz2'):
@@ -14,6 +14,7 @@ from future.builtins import *  # NOQA
 from future.utils import PY2
 
 import contextlib
+import copy
 import inspect
 import io
 import itertools
@@ -723,29 +724,137 @@ def _yield_resource_id_parent_attr(obj):
     from obspy.core.event import ResourceIdentifier
 
     ids = set()  # id cache to avoid circular references
-
-    def func(obj, parent=None, attr=None):
+    # Walk the object tree with an explicit stack rather than with nested
+    # generators, which would pass every yielded item up through all levels
+    # of the (potentially deep) tree. Children are pushed in reverse order to
+    # keep the depth first order of the recursive implementation.
+    stack = [(obj, None, None)]
+    while stack:
+        obj, parent, attr = stack.pop()
         if obj is None or not (hasattr(obj, '__dict__') or
                                isinstance(obj, (list, tuple))):
-            return  # stop iteration
+            continue
         id_tuple = (id(obj), id(parent))
-        if id_tuple not in ids:
-            ids.add(id_tuple)
-            # Yield object, parent, and attr if desired conditions are met
-            if isinstance(obj, ResourceIdentifier):
-                yield (obj, parent, attr)
-            # Iterate through basic built-in types.
-            elif isinstance(obj, (list, tuple)):
-                for val in obj:
-                    for out in func(val, obj, attr):
-                        yield out
-            # Iterate through non built-in object attributes.
-            elif hasattr(obj, '__dict__'):
-                for item, val in obj.__dict__.items():
-                    for out in func(val, obj, item):
-                            yield out
+        if id_tuple in ids:
+            continue
+        ids.add(id_tuple)
+        # Yield object, parent, and attr if desired conditions are met
+        if isinstance(obj, ResourceIdentifier):
+            yield (obj, parent, attr)
+        # Iterate through basic built-in types.
+        elif isinstance(obj, (list, tuple)):
+            stack.extend([(val, obj, attr) for val in reversed(obj)])
+        # Iterate through non built-in object attributes.
+        else:
+            items = list(obj.__dict__.items())
+            stack.extend([(val, obj, item) for item, val in reversed(items)])
 
-    return func(obj)
+
+# Types that are returned as they are by _deepcopy_tree.
+_ATOMIC_TYPES = {type(None), bool, int, float, complex, bytes, str,
+                 type(''), type(b'')}
+if PY2:
+    _ATOMIC_TYPES.update((long, unicode))  # NOQA
+# Cache of the copy strategy used for a class in _deepcopy_tree.
+_DEEPCOPY_TREE_STRATEGY = {}
+
+
+def _get_deepcopy_tree_strategy(obj):
+    """
+    Return how _deepcopy_tree copies instances of the class of an object.
+
+    ``"dict"`` means that a new instance can be created with ``__new__``
+    (with the float/complex/int/str value for subclasses of those, returned
+    as the type to convert to) and a copy of the
+    instance dictionary, which is what :func:`copy.deepcopy` does for such
+    classes. Anything else is handed to :func:`copy.deepcopy`.
+    """
+    cls = type(obj)
+    try:
+        return _DEEPCOPY_TREE_STRATEGY[cls]
+    except KeyError:
+        pass
+    strategy = "deepcopy"
+    custom = ("__deepcopy__", "__copy__", "__getstate__", "__setstate__",
+              "__getnewargs__", "__getnewargs_ex__", "__slots__")
+    if isinstance(getattr(obj, "__dict__", None), dict) and \
+            cls.__reduce_ex__ is object.__reduce_ex__ and \
+            cls.__reduce__ is object.__reduce__ and \
+            not any(name in vars(base) for base in cls.__mro__
+                    if base not in (object, float, complex, int, str)
+                    for name in custom):
+        for base in (float, complex, int, str):
+            if issubclass(cls, base):
+                strategy = base
+                break
+        else:
+            if not issubclass(cls, (list, dict, tuple, set, np.ndarray)):
+                strategy = "dict"
+    _DEEPCOPY_TREE_STRATEGY[cls] = strategy
+    return strategy
+
+
+def _deepcopy_tree(obj, memo=None, shared_types=()):
+    """
+    Fast deep copy of trees of simple objects like inventories and catalogs.
+
+    The result is the same as that of :func:`copy.deepcopy` but plain
+    objects, lists and dicts are copied directly instead of going through the
+    generic pickle protocol based machinery. Objects defining their own copy
+    or pickle behavior are copied with :func:`copy.deepcopy` (which in turn
+    may call this function again).
+
+    :param obj: The object to copy.
+    :type memo: dict
+    :param memo: Memo dictionary as used by :func:`copy.deepcopy`. Objects
+        referenced multiple times are only copied once.
+    :type shared_types: tuple of type
+    :param shared_types: Instances of these types are not copied but shared
+        between the original and the copy. Only use this for objects that
+        are not modified in place.
+    """
+    if memo is None:
+        memo = {}
+    cls = type(obj)
+    if cls in _ATOMIC_TYPES:
+        return obj
+    try:
+        return memo[id(obj)]
+    except KeyError:
+        pass
+    if shared_types and isinstance(obj, shared_types):
+        return obj
+    if cls is list:
+        new = []
+        memo[id(obj)] = new
+        new.extend([item if type(item) in _ATOMIC_TYPES
+                    else _deepcopy_tree(item, memo, shared_types)
+                    for item in obj])
+        return new
+    if cls is dict:
+        new = {}
+        memo[id(obj)] = new
+        for key, value in obj.items():
+            new[_deepcopy_tree(key, memo, shared_types)] = \
+                _deepcopy_tree(value, memo, shared_types)
+        return new
+    strategy = _get_deepcopy_tree_strategy(obj)
+    if strategy == "deepcopy":
+        return copy.deepcopy(obj, memo)
+    if strategy == "dict":
+        new = cls.__new__(cls)
+    else:
+        new = cls.__new__(cls, strategy(obj))
+    memo[id(obj)] = new
+    new_dict = new.__dict__
+    for key, value in obj.__dict__.items():
+        # avoid the function call for the many plain values
+        if type(value) not in _ATOMIC_TYPES:
+            value = _deepcopy_tree(value, memo, shared_types)
+        new_dict[key] = value
+    # same as copy.deepcopy, keep the original alive while the memo is used
+    memo.setdefault(id(memo), []).append(obj)
+    return new
 
 
 if __name__ == '__main__':
@@ -44,6 +44,11 @@ from obspy.core import Stats
 from obspy.core.util import AttribDict, loadtxt
 
 
+# number of bytes read at once
+_CHUNK_SIZE = 2 ** 24
+# number of lines written at once
+_CHUNK_ROWS = 2 ** 16
+
 HEADER = ("TIMESERIES {network}_{station}_{location}_{channel}_{dataquality}, "
           "{npts:d} samples, {sampling_rate} sps, {starttime!s:.26s}, "
           "{format}, {dtype}, {unit}\n")
@@ -134,51 +139,7 @@ def _read_slist(filename, headonly=False, **kwargs):  # @UnusedVariable
     >>> from obspy import read
     >>> st = read('/path/to/slist.ascii')
     """
-    with open(filename, 'rt') as fh:
-        # read file and split text into channels
-        buf = []
-        key = False
-        for line in fh:
-            if line.isspace():
-                # blank line
-                continue
-            elif line.startswith('TIMESERIES'):
-                # new header line
-                key = True
-                buf.append((line, io.StringIO()))
-            elif headonly:
-                # skip data for option headonly
-                continue
-            elif key:
-                # data entry - may be written in multiple columns
-                buf[-1][1].write(line.strip() + ' ')
-    # create ObsPy stream object
-    stream = Stream()
-    for header, data in buf:
-        # create Stats
-        stats = Stats()
-        parts = header.replace(',', '').split()
-        temp = parts[1].split('_')
-        stats.network = temp[0]
-        stats.station = temp[1]
-        stats.location = temp[2]
-        stats.channel = temp[3]
-        stats.sampling_rate = parts[4]
-        # quality only used in MSEED
-        # don't put blank quality code into 'mseed' dictionary
-        # (quality code is mentioned as optional by format specs anyway)
-        if temp[4]:
-            stats.mseed = AttribDict({'dataquality': temp[4]})
-        stats.ascii = AttribDict({'unit': parts[-1]})
-        stats.starttime = UTCDateTime(parts[6])
-        stats.npts = parts[2]
-        if headonly:
-            # skip data
-            stream.append(Trace(header=stats))
-        else:
-            data = _parse_data(data, parts[8])
-            stream.append(Trace(data=data, header=stats))
-    return stream
+    return _read_ascii(filename, headonly, tspair=False)
 
 
 def _read_tspair(filename, headonly=False, **kwargs):  # @UnusedVariable
@@ -202,27 +163,49 @@ def _read_tspair(filename, headonly=False, **kwargs):  # @UnusedVariable
     >>> from obspy import read
     >>> st = read('/path/to/tspair.ascii')
     """
-    with open(filename, 'rt') as fh:
-        # read file and split text into channels
-        buf = []
-        key = False
-        for line in fh:
-            if line.isspace():
-                # blank line
-                continue
-            elif line.startswith('TIMESERIES'):
-                # new header line
-                key = True
-                buf.append((line, io.StringIO()))
-            elif headonly:
-                # skip data for option headonly
-                continue
-            elif key:
-                # data entry - may be written in multiple columns
-                buf[-1][1].write(line.strip().split()[-1] + ' ')
+    return _read_ascii(filename, headonly, tspair=True)
+
+
+def _read_ascii(filename, headonly, tspair):
+    """
+    Reads a ASCII SLIST or TSPAIR file and returns an ObsPy Stream object.
+
+    The file is read in blocks of complete lines, data of each block are
+    parsed right away so that the whole text is never held in memory.
+    """
+    # list of [header line, data type, list of data arrays]
+    buf = []
+    rest = b""
+    with open(filename, 'rb') as fh:
+        while True:
+            block = fh.read(_CHUNK_SIZE)
+            text = rest + block
+            if block:
+                # process complete lines only
+                end = text.rfind(b"\n") + 1
+                text, rest = text[:end], text[end:]
+            pos = 0
+            while pos < len(text):
+                if text.startswith(b"TIMESERIES", pos):
+                    # new header line
+                    end = text.find(b"\n", pos) + 1 or len(text)
+                    header = text[pos:end].decode()
+                    buf.append([header, header.replace(',', '').split()[8],
+                                []])
+                    pos = end
+                    continue
+                end = text.find(b"\nTIMESERIES", pos) + 1 or len(text)
+                if buf and not headonly:
+                    data = text[pos:end]
+                    if tspair:
+                        data = _last_column(data)
+                    buf[-1][2].append(_parse_data(data, buf[-1][1]))
+                pos = end
+            if not block:
+                break
     # create ObsPy stream object
     stream = Stream()
-    for header, data in buf:
+    for header, data_type, data in buf:
         # create Stats
         stats = Stats()
         parts = header.replace(',', '').split()
@@ -244,11 +227,30 @@ def _read_tspair(filename, headonly=False, **kwargs):  # @UnusedVariable
             # skip data
             stream.append(Trace(header=stats))
         else:
-            data = _parse_data(data, parts[8])
+            if len(data) == 1:
+                data = data[0]
+            else:
+                data = np.concatenate([_parse_data(b"", data_type)] + data)
             stream.append(Trace(data=data, header=stats))
     return stream
 
 
+def _last_column(data):
+    """
+    Returns the last column of all non-blank lines as whitespace separated
+    bytes.
+    """
+    lines = data.split(b"\n")
+    values = data.split()
+    # fast path for the usual time-sample pairs
+    if len(values) == 2 * (len(lines) - lines.count(b"") -
+                           lines.count(b"\r")):
+        values = values[1::2]
+    else:
+        values = [line.split()[-1] for line in lines if line.strip()]
+    return b" ".join(values)
+
+
 def _write_slist(stream, filename, custom_fmt=None,
                  **kwargs):  # @UnusedVariable
     """
@@ -352,9 +354,15 @@ def _write_slist(stream, filename, custom_fmt=None,
                 data = trace.data[:-rest]
             else:
                 data = trace.data
-            data = data.reshape((-1, 6))
-            np.savetxt(fh, data, delimiter=b'\t',
-                       fmt=fmt.encode('ascii', 'strict'))
+            if fmt.count('%') == 1:
+                row_fmt = '\t'.join([fmt] * 6) + '\n'
+                for i in range(0, len(data), 6 * _CHUNK_ROWS):
+                    values = _format_values(data[i:i + 6 * _CHUNK_ROWS], fmt)
+                    fh.write(((row_fmt * (len(values) // 6)) %
+                              tuple(values)).encode('ascii', 'strict'))
+            else:
+                np.savetxt(fh, data.reshape((-1, 6)), delimiter=b'\t',
+                           fmt=fmt.encode('ascii', 'strict'))
             if rest:
                 fh.write(('\t'.join([fmt % d for d in trace.data[-rest:]]) +
                          '\n').encode('ascii', 'strict'))
@@ -462,10 +470,48 @@ def _write_tspair(stream, filename, custom_fmt=None,
             header = _format_header(stats, 'TSPAIR', dataquality, dtype, unit)
             fh.write(header.encode('ascii', 'strict'))
             # write data
-            for t, d in zip(trace.times(type='utcdatetime'), trace.data):
-                # .26s cuts the Z from the time string
-                line = ('%.26s  ' + fmt + '\n') % (t, d)
-                fh.write(line.encode('ascii', 'strict'))
+            line_fmt = '%s  ' + fmt + '\n'
+            for i in range(0, len(trace.data), _CHUNK_ROWS):
+                values = trace.data[i:i + _CHUNK_ROWS]
+                args = [None] * (2 * len(values))
+                args[::2] = _format_times(stats, i, len(values))
+                args[1::2] = _format_values(values, fmt)
+                fh.write(((line_fmt * len(values)) % tuple(args)).encode(
+                    'ascii', 'strict'))
+
+
+def _format_times(stats, start, npts):
+    """
+    Returns ISO time strings of samples as written by TSPAIR, equivalent to
+    ``'%.26s' % t`` for the times of :meth:`~obspy.core.trace.Trace.times`
+    with ``type='utcdatetime'``.
+
+    :type stats: :class:`~obspy.core.trace.Stats`
+    :param stats: Stats of the trace.
+    :type start: int
+    :param start: Index of first sample.
+    :type npts: int
+    :param npts: Number of samples.
+    :rtype: list of str
+    """
+    offsets = np.arange(start, start + npts) / stats.sampling_rate
+    ns = stats.starttime._ns + np.round(offsets * 1e9).astype(np.int64)
+    # round half to even to microseconds like UTCDateTime.__str__
+    us, remainder = np.divmod(ns, 1000)
+    us += (remainder > 500) | ((remainder == 500) & (us % 2 == 1))
+    return np.datetime_as_string(us.astype('datetime64[us]')).tolist()
+
+
+def _format_values(data, fmt):
+    """
+    Returns samples suitable for old style string formatting with fmt.
+
+    Python scalars are a lot faster to format than NumPy scalars, but their
+    string representation may differ.
+    """
+    if fmt.rstrip()[-1:] in 'rsa':
+        return list(data)
+    return data.tolist()
 
 
 def _determine_dtype(custom_fmt):
@@ -493,10 +539,9 @@ def _determine_dtype(custom_fmt):
 
 def _parse_data(data, data_type):
     """
-    Simple function to read data contained in a StringIO object to a NumPy
-    array.
+    Simple function to read whitespace separated data to a NumPy array.
 
-    :type data: io.StringIO
+    :type data: bytes
     :param data: The actual data.
     :type data_type: str
     :param data_type: The data type of the expected data. Currently supported
@@ -508,14 +553,16 @@ def _parse_data(data, data_type):
         dtype = np.float64
     else:
         raise NotImplementedError
-    # Seek to the beginning of the StringIO.
-    data.seek(0)
-    # Data will always be a StringIO. Avoid to send empty StringIOs to
-    # numpy.readtxt() which raises a warning.
-    if len(data.read(1)) == 0:
+    count = len(data.split())
+    # Avoid to send empty strings to numpy.loadtxt() which raises a warning.
+    if count == 0:
         return np.array([], dtype=dtype)
-    data.seek(0)
-    return loadtxt(data, dtype=dtype, ndmin=1)
+    values = np.fromstring(data, dtype=dtype, sep=' ')
+    if len(values) == count:
+        return values
+    # numpy.fromstring silently stops at anything it can not parse, let
+    # numpy.loadtxt handle all special cases
+    return loadtxt(io.StringIO(data.decode()), dtype=dtype, ndmin=1)
 
 
 if __name__ == '__main__':
@@ -8,10 +8,11 @@ import unittest
 
 import numpy as np
 
-from obspy import Trace, UTCDateTime, read
+from obspy import Stream, Trace, UTCDateTime, read
 from obspy.io.ascii.core import (_determine_dtype, _is_slist, _is_tspair,
                                  _read_slist, _read_tspair, _write_slist,
                                  _write_tspair)
+from obspy.core.compatibility import mock
 from obspy.core.util import NamedTemporaryFile
 
 
@@ -141,6 +142,36 @@ class ASCIITestCase(unittest.TestCase):
         testfile = os.path.join(self.path, 'data', 'slist_unknown.ascii')
         self.assertRaises(NotImplementedError, _read_slist, testfile)
 
+    def test_read_in_small_chunks(self):
+        """
+        Reading files in blocks that split lines, headers and traces at
+        arbitrary positions must give the same result as reading at once.
+        """
+        tr1 = Trace(np.arange(-50, 50, dtype=np.int32),
+                    header={'sampling_rate': 10.0, 'station': 'A'})
+        tr2 = Trace(np.linspace(-1e3, 1e3, 83),
+                    header={'sampling_rate': 0.5, 'station': 'B',
+                            'starttime': UTCDateTime(2010, 1, 1, 0, 0, 1.5)})
+        for format in ('SLIST', 'TSPAIR'):
+            with NamedTemporaryFile() as tf:
+                Stream([tr1, tr2]).write(tf.name, format=format)
+                # add some blank lines and irregular whitespace
+                with open(tf.name, 'rb') as fh:
+                    text = fh.read().replace(b'\n', b' \n\n', 7)
+                with open(tf.name, 'wb') as fh:
+                    fh.write(text)
+                expected = read(tf.name, format=format)
+                for chunk_size in (1, 7, 50, 333):
+                    with mock.patch('obspy.io.ascii.core._CHUNK_SIZE',
+                                    chunk_size):
+                        st = read(tf.name, format=format)
+                    self.assertEqual(st, expected)
+            self.assertEqual(len(expected), 2)
+            np.testing.assert_array_equal(expected[0].data, tr1.data)
+            np.testing.assert_allclose(expected[1].data, tr2.data)
+            self.assertEqual(expected[1].stats.starttime,
+                             tr2.stats.starttime)
+
     def test_is_tspair_file(self):
         """
         Testing TSPAIR file format.
@@ -81,20 +81,13 @@ def _read_gcf(filename, headonly=False, **kwargs):  # @UnusedVariable
     >>> from obspy import read
     >>> st = read("/path/to/20160603_1955n.gcf", format="GCF")
     """
-    traces = []
     with open(filename, 'rb') as f:
-        while True:
-            try:
-                if headonly:
-                    header = libgcf.read_header(f, **kwargs)
-                    if header:
-                        traces.append(Trace(header=header))
-                else:
-                    hd = libgcf.read(f, **kwargs)
-                    if hd:
-                        traces.append(Trace(header=hd[0], data=hd[1]))
-            except EOFError:
-                break
+        segments = libgcf.read_data_blocks(f, headonly=headonly, **kwargs)
+    if headonly:
+        traces = [Trace(header=header) for header, _ in segments]
+    else:
+        traces = [Trace(header=header, data=data)
+                  for header, data in segments]
     st = Stream(traces=traces)
     if headonly:
         st = merge_gcf_stream(st)
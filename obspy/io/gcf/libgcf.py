@@ -34,6 +34,7 @@ COMPRESSION_D = {  # Table 3.2: format field to data type
     1: '>i4',
     2: '>i2',
     4: '>i1'}
+BLOCK_LENGTH = 1024  # 16 bytes header + 1008 bytes data part
 
 
 def is_gcf(f):
@@ -160,3 +161,112 @@ def read(f, **kwargs):
     Reads header and data from GCF file.
     """
     return read_data_block(f, headonly=False, **kwargs)
+
+
+def _ranges(starts, lengths):
+    """
+    Concatenated ``np.arange(start, start + length)`` for all given pairs.
+    """
+    ends = np.cumsum(lengths)
+    return np.arange(ends[-1] if len(ends) else 0, dtype=np.int64) + \
+        np.repeat(starts - ends + lengths, lengths)
+
+
+def read_data_blocks(f, headonly=False, channel_prefix="HH", **kwargs):
+    """
+    Read all data blocks of a GCF file at once.
+
+    All block headers are decoded together, blocks are sorted by stream
+    and time and the first differences of all blocks are integrated in one
+    go. The samples of each contiguous run of blocks of the same stream end
+    up in one array, no per block arrays are created.
+
+    f - file object to read from, read until EOF
+    if headonly is True, data of all segments is None.
+    returns a list of (header, data) tuples, one per contiguous segment.
+    """
+    buff = np.frombuffer(f.read(), dtype=np.uint8)
+    if len(buff) % BLOCK_LENGTH:
+        raise ValueError("File does not contain complete GCF blocks")
+    buff = buff.reshape((-1, BLOCK_LENGTH))
+    # skip blocks that are not data blocks (SPS=0)
+    buff = buff[buff[:, 13] != 0]
+    if not len(buff):
+        return []
+    stid = np.ascontiguousarray(buff[:, 4:8]).view('>u4').ravel()
+    date = np.ascontiguousarray(buff[:, 8:12]).view('>u4').ravel()
+    sps = buff[:, 13].astype(np.int64)
+    compression = (buff[:, 14] & 0b00001111).astype(np.int64)
+    t_offset = (buff[:, 14] >> 4).astype(np.int64)
+    num_records = buff[:, 15].astype(np.int64)
+    npts = num_records * compression  # number of samples
+
+    # start times in nanoseconds, see decode_date_time()
+    starttime = UTCDateTime('1989-11-17')._ns + 10 ** 9 * (
+        (date >> 17).astype(np.int64) * 86400 +
+        (date & 0x1FFFF).astype(np.int64))
+    for code in np.unique(sps[t_offset > 0]):
+        sel = (sps == code) & (t_offset > 0)
+        starttime[sel] += t_offset[sel] * 10 ** 9 // \
+            int(TIME_OFFSETS_D[code])
+    sampling_rate = np.empty(len(sps), dtype=np.float64)
+    for code in np.unique(sps):
+        sampling_rate[sps == code] = float(SPS_D.get(code, code))
+    ids = []
+    id_index = np.empty(len(stid), dtype=np.int64)
+    for value in np.unique(stid):
+        _id = decode36(value)
+        _id = (_id[:4], (channel_prefix[:2] + _id[4]).upper())
+        if _id not in ids:
+            ids.append(_id)
+        id_index[stid == value] = ids.index(_id)
+
+    # sort by stream and time, a new segment starts at every gap
+    order = np.lexsort((starttime, sampling_rate, id_index))
+    buff, npts, starttime = buff[order], npts[order], starttime[order]
+    compression, num_records = compression[order], num_records[order]
+    sampling_rate, id_index = sampling_rate[order], id_index[order]
+    endtime = starttime + np.round(npts * 1e9 / sampling_rate).astype(
+        np.int64)
+    new_segment = np.ones(len(buff), dtype=np.bool_)
+    new_segment[1:] = (id_index[1:] != id_index[:-1]) | \
+        (sampling_rate[1:] != sampling_rate[:-1]) | \
+        (starttime[1:] != endtime[:-1])
+    first = np.flatnonzero(new_segment)
+    offsets = np.cumsum(npts) - npts
+    length = np.add.reduceat(npts, first)
+
+    data = None
+    if not headonly:
+        data = np.empty(npts.sum(), dtype=np.int32)
+        for code in np.unique(compression):
+            sel = compression == code
+            block = buff[sel]
+            # first differences, get FIC and integrate
+            diffs = np.ascontiguousarray(block[:, 20:1020]).view(
+                COMPRESSION_D[code])
+            samples = np.cumsum(diffs, axis=1, dtype=np.int64)
+            samples += np.ascontiguousarray(block[:, 16:20]).view('>i4')
+            samples = samples.astype('i4')
+            # verify last data sample matches RIC
+            _n = npts[sel]
+            ric = block[np.arange(len(block))[:, None],
+                        20 + 4 * num_records[sel][:, None] + np.arange(4)]
+            ric = np.ascontiguousarray(ric).view('>i4').ravel()
+            if np.any(samples[np.arange(len(block)), _n - 1] != ric):
+                raise ValueError("Last sample mismatch with RIC")
+            data[_ranges(offsets[sel], _n)] = \
+                samples[np.arange(samples.shape[1]) < _n[:, None]]
+
+    segments = []
+    for i, n in zip(first, length):
+        header = {}
+        header['starttime'] = UTCDateTime(ns=int(starttime[i]))
+        header['station'], header['channel'] = ids[id_index[i]]
+        header['sampling_rate'] = sampling_rate[i]
+        header['npts'] = int(n)
+        if headonly:
+            segments.append((header, None))
+        else:
+            segments.append((header, data[offsets[i]:offsets[i] + n]))
+    return segments
@@ -13,6 +13,7 @@ import unittest
 import numpy as np
 
 from obspy import read
+from obspy.core.util import NamedTemporaryFile
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.io.gcf.core import _read_gcf, merge_gcf_stream
 
@@ -162,6 +163,36 @@ class CoreTestCase(unittest.TestCase):
         self.assertEqual(st[0].stats.channel, 'HNN')
         self.assertEqual(st[0].stats.station, '6018')
 
+    def test_read_unordered_blocks(self):
+        """
+        Blocks are assembled to contiguous traces regardless of their order
+        in the file, status blocks are skipped and the RIC is verified.
+        """
+        filename = os.path.join(self.path, '20160603_1955n.gcf')
+        expected = read(filename)
+        with open(filename, 'rb') as fh:
+            blocks = [fh.read(1024), fh.read(1024)]
+        # status block, i.e. with SPS=0
+        status = blocks[0][:13] + b'\x00\x00\x01' + b'\x00' * 1008
+        with NamedTemporaryFile() as tf:
+            tf.write(blocks[1] + status + blocks[0])
+            tf.flush()
+            st = read(tf.name)
+            st_head = read(tf.name, headonly=True)
+        self.assertEqual(st, expected)
+        self.assertEqual(len(st_head), 1)
+        self.assertEqual(st_head[0].stats.starttime,
+                         expected[0].stats.starttime)
+        self.assertEqual(st_head[0].stats.npts, 300)
+        # last sample not matching the reverse integration constant
+        with NamedTemporaryFile() as tf:
+            ric = 20 + 4 * bytearray(blocks[0])[15]
+            tf.write(blocks[0][:ric] + b'\x00\x00\x00\x01' +
+                     blocks[0][ric + 4:] + blocks[1])
+            tf.flush()
+            with self.assertRaises(ValueError):
+                _read_gcf(tf.name)
+
 
 def suite():
     return unittest.makeSuite(CoreTestCase, 'test')
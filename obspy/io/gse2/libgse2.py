@@ -13,7 +13,8 @@ Lowlevel module internally used for handling GSE2 files.
 Python wrappers for gse_functions - The GSE2 library of Stefan Stange.
 Currently CM6 compressed GSE2 files are supported, this should be
 sufficient for most cases. Gse_functions is written in C and
-interfaced via python-ctypes.
+interfaced via python-ctypes, the CM6 codec is a vectorized NumPy
+reimplementation of the respective gse_functions routines.
 
 See: http://www.orfeus-eu.org/software/seismo_softwarelibrary.html#gse
 
@@ -41,37 +42,41 @@ from obspy.core.util.libnames import _load_cdll
 # Import shared libgse2
 clibgse2 = _load_cdll("gse2")
 
-clibgse2.decomp_6b_buffer.argtypes = [
-    C.c_int,
-    np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
-                           flags=native_str('C_CONTIGUOUS')),
-    C.CFUNCTYPE(C.c_char_p, C.POINTER(C.c_char), C.c_void_p), C.c_void_p]
-clibgse2.decomp_6b_buffer.restype = C.c_int
-
-clibgse2.rem_2nd_diff.argtypes = [
-    np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
-                           flags=native_str('C_CONTIGUOUS')),
-    C.c_int]
-clibgse2.rem_2nd_diff.restype = C.c_int
-
 clibgse2.check_sum.argtypes = [
     np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
                            flags=native_str('C_CONTIGUOUS')),
     C.c_int, C.c_int32]
 clibgse2.check_sum.restype = C.c_int  # do not know why not C.c_int32
 
-clibgse2.diff_2nd.argtypes = [
-    np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
-                           flags=native_str('C_CONTIGUOUS')),
-    C.c_int, C.c_int]
-clibgse2.diff_2nd.restype = C.c_void_p
-
-clibgse2.compress_6b_buffer.argtypes = [
-    np.ctypeslib.ndpointer(dtype=np.int32, ndim=1,
-                           flags=native_str('C_CONTIGUOUS')),
-    C.c_int,
-    C.CFUNCTYPE(C.c_int, C.c_char)]
-clibgse2.compress_6b_buffer.restype = C.c_int
+# CM6 character set, the index of a character is its 6 bit value (32:
+# continuation flag, 16: sign flag in the first character of a sample)
+_CM6_CHARS = (b"+-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+              b"abcdefghijklmnopqrstuvwxyz")
+# lookup table from byte to 6 bit value, higher bit stripped off and
+# unknown characters (e.g. spaces) mapping to zero as in gse_functions.c
+_CM6_DECODE = np.zeros(256, dtype=np.uint8)
+_CM6_DECODE[np.frombuffer(_CM6_CHARS, dtype=np.uint8)] = np.arange(64)
+_CM6_DECODE[128:] = _CM6_DECODE[:128]
+# masks for the bytes of the last eight characters of a sample, indexed by
+# number of characters in the sample (sign bit of first character cleared)
+_CM6_BYTE_MASKS = np.empty(10, dtype=np.uint64)
+for _i in range(10):
+    _mask = 0x1F1F1F1F1F1F1F1F >> (8 * max(8 - _i, 0))
+    if 0 < _i <= 8:
+        _mask &= ~(0x10 << (8 * (_i - 1)))
+    _CM6_BYTE_MASKS[_i] = _mask
+del _i, _mask
+# steps to squeeze 5 bit digits in byte lanes to a contiguous integer
+_CM6_SQUEEZE = [
+    (np.uint64(0x001F001F001F001F), np.uint64(0x1F001F001F001F00),
+     np.uint64(3)),
+    (np.uint64(0x000003FF000003FF), np.uint64(0x03FF000003FF0000),
+     np.uint64(6)),
+    (np.uint64(0x00000000000FFFFF), np.uint64(0x000FFFFF00000000),
+     np.uint64(12))]
+# isspace() in C locale
+_CM6_SPACE = np.zeros(256, dtype=np.bool_)
+_CM6_SPACE[[9, 10, 11, 12, 13, 32]] = True
 
 
 class ChksumError(Exception):
@@ -234,6 +239,143 @@ def write_header(f, headdict):
         f.write(sta2_line)
 
 
+def _cm6_line_codes(buf, line_ends, first):
+    """
+    Helper function for :func:`_read_cm6_codes` handling arbitrary lines.
+
+    Only the first 80 characters of a line are used and a line ends at the
+    first whitespace. The first character of all lines but the very first
+    data line is always used (see ``decomp_6b_buffer`` in gse_functions.c).
+
+    :type buf: :class:`numpy.ndarray`, dtype=uint8
+    :param buf: Data lines.
+    :type line_ends: :class:`numpy.ndarray`
+    :param line_ends: End offsets of all lines in ``buf``.
+    :type first: bool
+    :param first: Whether ``buf`` starts with the first data line.
+    :returns: The 6 bit values of the characters and the cumulative number
+        of characters at the end of each line.
+    """
+    line_starts = np.empty_like(line_ends)
+    line_starts[0] = 0
+    line_starts[1:] = line_ends[:-1]
+    line = np.repeat(np.arange(len(line_ends)), line_ends - line_starts)
+    column = np.arange(len(buf)) - line_starts[line]
+    space = _CM6_SPACE[buf]
+    if first:
+        space &= (column > 0) | (line == 0)
+    else:
+        space &= column > 0
+    spaces = np.cumsum(space)
+    spaces_before_line = spaces[line_starts] - space[line_starts]
+    keep = (spaces == spaces_before_line[line]) & (column < 80)
+    return _CM6_DECODE[buf[keep]], np.cumsum(keep)[line_ends - 1]
+
+
+def _cm6_codes(buf, line_ends, n_samps):
+    """
+    Decode the characters of CM6 data lines to their 6 bit values.
+
+    Stops after the line which completes n_samps samples, if possible.
+
+    :type buf: :class:`numpy.ndarray`, dtype=uint8
+    :param buf: Data lines, starting with the first data line.
+    :type line_ends: :class:`numpy.ndarray`
+    :param line_ends: End offsets of all (complete) lines in ``buf``.
+    :type n_samps: int
+    :param n_samps: Number of samples.
+    :returns: The 6 bit values of the characters, the cumulative number of
+        characters at the end of each (processed) line and the indices of
+        the characters terminating a sample.
+    """
+    # fast path for a block of lines with 80 characters and line endings of
+    # the same length, as written by any sane program
+    width = line_ends[0]
+    nfull = 0
+    if width > 80:
+        irregular = np.flatnonzero(np.diff(line_ends) != width)
+        nfull = irregular[0] + 1 if len(irregular) else len(line_ends)
+        block = buf[:nfull * width].reshape(nfull, width)[:, :80]
+        if _CM6_SPACE[block].any():
+            nfull = 0
+    codes = [buf[:0]]
+    counts = [line_ends[:0]]
+    if nfull:
+        codes.append(_CM6_DECODE[block.ravel()])
+        counts.append(np.arange(1, nfull + 1) * 80)
+    n_ends = np.count_nonzero(codes[-1] < 32)
+    # remaining lines in general, usually only the last data line is needed
+    start = nfull
+    for stop in (nfull + 8, len(line_ends)):
+        if n_ends >= n_samps or start >= len(line_ends):
+            break
+        stop = min(stop, len(line_ends))
+        offset = start and line_ends[start - 1]
+        codes_, counts_ = _cm6_line_codes(
+            buf[offset:line_ends[stop - 1]],
+            line_ends[start:stop] - offset, first=start == 0)
+        n_ends += np.count_nonzero(codes_ < 32)
+        codes.append(codes_)
+        counts.append(counts_ + (counts[-1][-1] if start else 0))
+        start = stop
+    codes = np.concatenate(codes)
+    return codes, np.concatenate(counts), np.flatnonzero(codes < 32)
+
+
+def _read_cm6_codes(f, n_samps):
+    """
+    Read the 6 bit values of the CM6 characters of n_samps samples from file
+    pointer f.
+
+    Data start after the ``DAT2`` (or ``DAT1``) line. The file pointer is
+    left after the line containing the last sample.
+    """
+    line = f.readline()
+    while not line.startswith((b"DAT2", b"DAT1")):
+        if line == b"":
+            raise GSEUtiError("Neither DAT2 or DAT1 found!")
+        line = f.readline()
+    offset = f.tell()
+    # usually enough for all samples, read more if necessary
+    size = n_samps * 5 + 1024
+    data = b""
+    while True:
+        chunk = f.read(size)
+        data += chunk
+        complete = len(chunk) < size
+        buf = np.frombuffer(data, dtype=np.uint8)
+        line_ends = np.flatnonzero(buf == 10) + 1
+        if complete and len(buf) and (not len(line_ends) or
+                                      line_ends[-1] != len(buf)):
+            line_ends = np.append(line_ends, len(buf))
+        if not len(line_ends):
+            if complete:
+                raise GSEUtiError("No data after DAT2 or DAT1.")
+            size *= 2
+            continue
+        codes, counts, ends = _cm6_codes(buf, line_ends, n_samps)
+        if len(ends) >= n_samps or complete:
+            break
+        size *= 2
+    if len(ends) < n_samps:
+        raise GSEUtiError("Missing input line in CM6 data.")
+    last = ends[n_samps - 1]
+    last_line = np.searchsorted(counts, last, side='right')
+    # a checksum line at the start of a sample means missing data
+    candidates = np.flatnonzero(
+        buf[line_ends[:last_line]] == ord(b"C")) + 1
+    for i in candidates:
+        if not data.startswith((b"CHK2 ", b"CHK1 "),
+                               int(line_ends[i - 1])):
+            continue
+        j = counts[i - 1]
+        if j == 0 or codes[j - 1] < 32:
+            msg = "CHK2 or CHK1 reached prematurely in CM6 data."
+            raise GSEUtiError(msg)
+    f.seek(offset + line_ends[last_line])
+    return codes[:last + 1], ends[:n_samps]
+
+
 def uncompress_cm6(f, n_samps):
     """
     Uncompress n_samps of CM6 compressed data from file pointer fp.
@@ -243,27 +385,56 @@ def uncompress_cm6(f, n_samps):
     :type n_samps: int
     :param n_samps: Number of samples
     """
-    def read83(cbuf, vptr):  # @UnusedVariable
-        line = f.readline()
-        if line == b'':
-            return None
-        # avoid buffer overflow through clipping to 82
-        sb = C.create_string_buffer(line[:82])
-        # copy also null termination "\0", that is max 83 bytes
-        C.memmove(C.addressof(cbuf.contents), C.addressof(sb), len(line) + 1)
-        return C.addressof(sb)
-
-    cread83 = C.CFUNCTYPE(C.c_char_p, C.POINTER(C.c_char), C.c_void_p)(read83)
     if n_samps == 0:
-        data = np.empty(0, dtype=np.int32)
-    else:
-        # aborts with segmentation fault when n_samps == 0
-        data = np.empty(n_samps, dtype=np.int32)
-        n = clibgse2.decomp_6b_buffer(n_samps, data, cread83, None)
-        if n != n_samps:
-            raise GSEUtiError("Mismatching length in lib.decomp_6b")
-        clibgse2.rem_2nd_diff(data, n_samps)
-    return data
+        return np.empty(0, dtype=np.int32)
+    # every character without continuation bit terminates a sample
+    codes, ends = _read_cm6_codes(f, n_samps)
+    nchars = np.empty_like(ends)
+    nchars[0] = ends[0] + 1
+    nchars[1:] = ends[1:] - ends[:-1]
+    # first character holds sign bit and 4 bits, all others 5 bits
+    negative = (codes[ends - nchars + 1] & 16) != 0
+    # view the last eight characters of every sample as one uint64 (the
+    # last character being the least significant byte), more characters
+    # do not contribute to an int32
+    reverse = np.zeros(len(codes) + 7, dtype=np.uint8)
+    reverse[:len(codes)] = codes[::-1]
+    window = np.ndarray(shape=(len(codes),), dtype=native_str('<u8'),
+                        buffer=reverse, strides=(1,))
+    value = window[len(codes) - 1 - ends]
+    value &= _CM6_BYTE_MASKS[np.minimum(nchars, 9)]
+    # squeeze the 5 bit digits together
+    for low, high, shift in _CM6_SQUEEZE:
+        upper = value & high
+        upper >>= shift
+        value &= low
+        value |= upper
+    data = value.astype(np.uint32).view(np.int32)
+    data[negative] = -data[negative]
+    return rem_2nd_diff(data)
+
+
+def rem_2nd_diff(data):
+    """
+    Remove second differences, i.e. integrate twice
+
+    :type data: :class:`numpy.ndarray`, dtype=int32
+    :param data: second differences as stored in CM6 data
+    """
+    return np.cumsum(np.cumsum(data, dtype=np.int32), dtype=np.int32)
+
+
+def diff_2nd(data):
+    """
+    Compute second differences of the data as stored in CM6 data, the first
+    two samples are differenced against zeros.
+
+    :type data: :class:`numpy.ndarray`, dtype=int32
+    :param data: the data to difference
+    """
+    padded = np.zeros(len(data) + 2, dtype=np.int32)
+    padded[2:] = data
+    return np.diff(padded, n=2)
 
 
 def compress_cm6(data):
@@ -275,25 +446,28 @@ def compress_cm6(data):
     :returns: NumPy chararray containing compressed samples
     """
     data = np.ascontiguousarray(data, np.int32)
-    n = len(data)
-    count = [0]  # closure, must be container
-    # 4 character bytes per int32_t
-    carr = np.zeros(n * 4, dtype=native_str('c'))
-
-    def writer(char):
-        carr[count[0]] = char
-        count[0] += 1
-        return 0
-    cwriter = C.CFUNCTYPE(C.c_int, C.c_char)(writer)
-    ierr = clibgse2.compress_6b_buffer(data, n, cwriter)
-    if ierr != 0:
-        msg = "Error status after compress_6b_buffer is NOT 0 but %d"
-        raise GSEUtiError(msg % ierr)
-    cnt = count[0]
+    if np.any(data == np.iinfo(np.int32).min):
+        msg = "Error status after compress_6b_buffer is NOT 0 but -1"
+        raise GSEUtiError(msg)
+    negative = data < 0
+    # clip at 2**27 - 1
+    values = np.minimum(np.abs(data.astype(np.int64)), 2 ** 27 - 1)
+    # one character for the lowest 4 bits, one per 5 further bits
+    nchars = np.frexp(values)[1] // 5 + 1
+    cnt = int(nchars.sum())
+    ends = np.cumsum(nchars)
+    sample = np.repeat(np.arange(len(data)), nchars)
+    shifts = ends[sample] - 1 - np.arange(cnt)
+    codes = (values[sample] >> (5 * shifts)) & 31
+    codes[shifts > 0] |= 32
+    codes[ends[negative] - nchars[negative]] |= 16
+    # pad to full lines of 80 characters
+    carr = np.zeros((cnt // 80 + 1) * 80, dtype=np.uint8)
+    carr[:cnt] = np.frombuffer(_CM6_CHARS, dtype=np.uint8)[codes]
     if cnt < 80:
         return carr[:cnt].view(native_str('|S%d' % cnt))
     else:
-        return carr[:(cnt // 80 + 1) * 80].view(native_str('|S80'))
+        return carr.view(native_str('|S80'))
 
 
 def verify_checksum(fh, data, version=2):
@@ -428,7 +602,7 @@ def write(headdict, data, f, inplace=False):
         data = data.copy()
     if data.max() > 2 ** 26:
         raise OverflowError("Compression Error, data must be less equal 2^26")
-    clibgse2.diff_2nd(data, n, 0)
+    data[:] = diff_2nd(data)
     data_cm6 = compress_cm6(data)
     # set some defaults if not available and convert header entries
     headdict.setdefault('calib', 1.0)
@@ -444,8 +618,7 @@ def write(headdict, data, f, inplace=False):
     # For further details, see the __doc__ of write_header
     write_header(f, headdict)
     f.write(b"DAT2\n")
-    for line in data_cm6:
-        f.write(line + b"\n")
+    f.write(b"\n".join(data_cm6.tolist()) + b"\n")
     f.write(("CHK2 %8ld\n\n" % chksum).encode('ascii', 'strict'))
 
 
@@ -209,6 +209,49 @@ class LibGSE2TestCase(unittest.TestCase):
             # omit C level error "decomp_6b: Neither DAT2 or DAT1 found!"
             self.assertRaises(GSEUtiError, libgse2.read, fout)
 
+    def test_read_irregular_lines(self):
+        """
+        CM6 data lines of varying length and with trailing characters after
+        whitespace are read the same as regular lines of 80 characters.
+        """
+        gse2file = os.path.join(self.path, 'loc_RNON20040609200559.z')
+        with open(gse2file, 'rb') as f:
+            content = f.read()
+        with io.BytesIO(content) as f:
+            header, data = libgse2.read(f)
+        head, rest = content.split(b"DAT2\n", 1)
+        cm6, tail = rest.split(b"\nCHK2", 1)
+        cm6 = cm6.replace(b"\n", b"")
+        lines = []
+        for i, width in enumerate([1, 79, 80, 13, 27, 60] * 200):
+            if not cm6:
+                break
+            lines.append(cm6[:width] + b" ignored" * (i % 3 == 0))
+            cm6 = cm6[width:]
+        content = head + b"DAT2\r\n" + b"\r\n".join(lines) + b"\nCHK2" + tail
+        with io.BytesIO(content) as f:
+            newheader, newdata = libgse2.read(f)
+        self.assertEqual(header, newheader)
+        np.testing.assert_equal(data, newdata)
+
+    def test_read_and_write_large_values(self):
+        """
+        Compression of samples which need more than four characters.
+        """
+        np.random.seed(815)
+        data = np.random.randint(-2 ** 24, 2 ** 24, 1000).astype(np.int32)
+        header = {'station': 'TEST', 'channel': 'SHZ', 'network': '',
+                  'sampling_rate': 100.0, 'npts': 1000,
+                  'starttime': UTCDateTime(2019, 1, 1)}
+        with io.BytesIO() as f:
+            # raises "UserWarning: Bad value in GSE2 header field"
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                libgse2.write(header, data.copy(), f)
+            f.seek(0)
+            _, newdata = libgse2.read(f)
+        np.testing.assert_equal(data, newdata)
+
     def test_parse_sta2(self):
         """
         Tests parsing of STA2 lines on a collection of (modified) real world
@@ -621,9 +621,7 @@ def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
         # and the timing quality. If starttime or sampling rate has a precision
         # of more than 100 microseconds, or if timing quality is set, \
         # Blockette 1001 will be written for every record.
-        starttime = util._convert_datetime_to_mstime(trace.stats.starttime)
-        if starttime % 100 != 0 or \
-           (1.0 / trace.stats.sampling_rate * HPTMODULUS) % 100 != 0:
+        if _needs_blkt_1001(trace):
             use_blkt_1001 = True
 
         if hasattr(trace.stats, 'mseed') and \
@@ -775,17 +773,8 @@ def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
                 trace_attr['encoding'] = None
         # automatically detect encoding if no encoding is given.
         if not trace_attr['encoding']:
-            if trace.data.dtype.type == np.int32:
-                trace_attr['encoding'] = 11
-            elif trace.data.dtype.type == np.float32:
-                trace_attr['encoding'] = 4
-            elif trace.data.dtype.type == np.float64:
-                trace_attr['encoding'] = 5
-            elif trace.data.dtype.type == np.int16:
-                trace_attr['encoding'] = 1
-            elif trace.data.dtype.type == np.dtype(native_str('|S1')).type:
-                trace_attr['encoding'] = 0
-            else:
+            trace_attr['encoding'] = _default_encoding(trace.data.dtype)
+            if trace_attr['encoding'] is None:
                 msg = "Unsupported data type %s in Stream[%i].data" % \
                     (trace.data.dtype, _i)
                 raise Exception(msg)
@@ -830,91 +819,20 @@ def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
         # Initialize packedsamples pointer for the mst_pack function
         packedsamples = C.c_int()
 
-        # Callback function for mst_pack to actually write the file
+        # Callback function for mst_pack collecting the records
+        records = []
+
         def record_handler(record, reclen, _stream):
-            f.write(record[0:reclen])
+            records.append(record[0:reclen])
         # Define Python callback function for use in C function
         rec_handler = C.CFUNCTYPE(C.c_void_p, C.POINTER(C.c_char), C.c_int,
                                   C.c_void_p)(record_handler)
 
         # Fill up msr record structure, this is already contained in
         # mstg, however if blk1001 is set we need it anyway
-        msr = clibmseed.msr_init(None)
-        msr.contents.network = trace.stats.network.encode('ascii', 'strict')
-        msr.contents.station = trace.stats.station.encode('ascii', 'strict')
-        msr.contents.location = trace.stats.location.encode('ascii', 'strict')
-        msr.contents.channel = trace.stats.channel.encode('ascii', 'strict')
-        msr.contents.dataquality = trace_attr['dataquality'].\
-            encode('ascii', 'strict')
-
-        # Set starting sequence number
-        msr.contents.sequence_number = trace_attr['sequence_number']
-
-        # Only use Blockette 1001 if necessary.
-        if use_blkt_1001:
-            # Timing quality has been set in trace_attr
-
-            size = C.sizeof(Blkt1001S)
-            # Only timing quality matters here, other blockette attributes will
-            # be filled by libmseed.msr_normalize_header
-            blkt_value = pack(native_str("BBBB"), trace_attr['timing_quality'],
-                              0, 0, 0)
-            blkt_ptr = C.create_string_buffer(blkt_value, len(blkt_value))
-
-            # Usually returns a pointer to the added blockette in the
-            # blockette link chain and a NULL pointer if it fails.
-            # NULL pointers have a false boolean value according to the
-            # ctypes manual.
-            ret_val = clibmseed.msr_addblockette(msr, blkt_ptr,
-                                                 size, 1001, 0)
-
-            if bool(ret_val) is False:
-                clibmseed.msr_free(C.pointer(msr))
-                del msr
-                raise Exception('Error in msr_addblockette')
-
-        # Only use Blockette 100 if necessary.
-        # Determine if a blockette 100 will be needed to represent the input
-        # sample rate or if the sample rate in the fixed section of the data
-        # header will suffice (see ms_genfactmult in libmseed/genutils.c)
-        use_blkt_100 = False
-
-        _factor = C.c_int16()
-        _multiplier = C.c_int16()
-        _retval = clibmseed.ms_genfactmult(
-            trace.stats.sampling_rate, C.pointer(_factor),
-            C.pointer(_multiplier))
-        # Use blockette 100 if ms_genfactmult() failed.
-        if _retval != 0:
-            use_blkt_100 = True
-        # Otherwise figure out if ms_genfactmult() found exact factors.
-        # Otherwise write blockette 100.
-        else:
-            ms_sr = clibmseed.ms_nomsamprate(_factor.value, _multiplier.value)
-
-            # It is also necessary if the libmseed calculated sampling rate
-            # would result in a loss of accuracy - the floating point
-            # comparision is on purpose here as it will always try to
-            # preserve all accuracy.
-            # Cast to float32 to not add blockette 100 for values
-            # that cannot be represented with 32bits.
-            if np.float32(ms_sr) != np.float32(trace.stats.sampling_rate):
-                use_blkt_100 = True
-
-        if use_blkt_100:
-            size = C.sizeof(Blkt100S)
-            blkt100 = C.c_char(b' ')
-            C.memset(C.pointer(blkt100), 0, size)
-            ret_val = clibmseed.msr_addblockette(
-                msr, C.pointer(blkt100), size, 100, 0)  # NOQA
-            # Usually returns a pointer to the added blockette in the
-            # blockette link chain and a NULL pointer if it fails.
-            # NULL pointers have a false boolean value according to the
-            # ctypes manual.
-            if bool(ret_val) is False:
-                clibmseed.msr_free(C.pointer(msr))  # NOQA
-                del msr  # NOQA
-                raise Exception('Error in msr_addblockette')
+        msr = _create_msr_template(
+            trace, trace_attr['dataquality'], trace_attr['sequence_number'],
+            trace_attr['timing_quality'] if use_blkt_1001 else None)
 
         # Pack mstg into a MSEED file using the callback record_handler as
         # write method.
@@ -931,6 +849,7 @@ def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
             clibmseed.msr_free(C.pointer(msr))  # NOQA
             del mst, msr  # NOQA
             raise Exception('Error in mst_pack')
+        f.write(b''.join(records))
         # Deallocate any allocated memory.
         clibmseed.msr_free(C.pointer(msr))  # NOQA
         del mst, msr  # NOQA
@@ -939,6 +858,414 @@ def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
         f.close()
 
 
+class MSEEDWriter(object):
+    """
+    Write Mini-SEED records of continuously arriving data, e.g. for archiving
+    real-time data.
+
+    The packing state of every channel is kept between calls of
+    :meth:`write`: samples not yet packed, the Steim integration constant and
+    the record sequence number. Only completely filled records are written,
+    so the records are the same as the ones written at once for all data of
+    a channel. Remaining samples are packed into partially filled records by
+    :meth:`flush` and :meth:`close`. A gap, an overlap or a change of the
+    sampling rate or data type flushes a channel and starts a new one.
+
+    Data quality, timing quality and the sequence number of the first record
+    of a channel are taken from ``stats.mseed`` of its first trace, see
+    :func:`_write_mseed`.
+
+    :type filename: str or file-like object
+    :param filename: Name of the output file or a file-like object. Files are
+        opened in append mode. If the name contains any of the fields
+        ``{network}``, ``{station}``, ``{location}`` or ``{channel}`` every
+        channel is appended to its own file, which is only opened while
+        writing records.
+    :type encoding: int or str, optional
+    :param encoding: Data encoding, see :func:`_write_mseed`. If not given it
+        will be derived from the dtype of the data of each channel.
+    :type reclen: int, optional
+    :param reclen: Record length in bytes. Defaults to 4096.
+    :type byteorder: int or str, optional
+    :param byteorder: Byte order, see :func:`_write_mseed`. Defaults to big
+        endian.
+    :type verbose: int, optional
+    :param verbose: Controls verbosity, a value of ``0`` will result in no
+        diagnostic output.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> from obspy.core.util import NamedTemporaryFile
+    >>> st = read()
+    >>> t = st[0].stats.starttime
+    >>> with NamedTemporaryFile() as tf:
+    ...     with MSEEDWriter(tf.name) as writer:
+    ...         for i in range(3):
+    ...             writer.write(st.slice(t + i * 10, t + i * 10 + 9.99))
+    ...     print(read(tf.name))  # doctest: +ELLIPSIS
+    3 Trace(s) in Stream:
+    BW.RJOB..EHZ | 2009-08-24T00:20:03.000000Z - ... | 100.0 Hz, 3000 samples
+    BW.RJOB..EHN | 2009-08-24T00:20:03.000000Z - ... | 100.0 Hz, 3000 samples
+    BW.RJOB..EHE | 2009-08-24T00:20:03.000000Z - ... | 100.0 Hz, 3000 samples
+    """
+    def __init__(self, filename, encoding=None, reclen=4096, byteorder='>',
+                 verbose=0):
+        if reclen not in VALID_RECORD_LENGTHS:
+            msg = 'Invalid record length. The record length must be a ' + \
+                'value\nof 2 to the power of X where 8 <= X <= 20.'
+            raise ValueError(msg)
+        if byteorder == '=':
+            byteorder = NATIVE_BYTEORDER
+        byteorder = {'<': 0, '>': 1, 0: 0, 1: 1,
+                     -1: int(NATIVE_BYTEORDER == '>')}.get(byteorder)
+        if byteorder is None:
+            msg = "Invalid byte order. It must be either '<', '>', '=', " + \
+                  "0, 1 or -1"
+            raise ValueError(msg)
+        if encoding is not None:
+            encoding = util._convert_and_check_encoding_for_writing(encoding)
+        self.encoding = encoding
+        self.reclen = reclen
+        self.byteorder = byteorder
+        self.verbose = int(verbose)
+
+        self._own_file = False
+        self._template = None
+        if hasattr(filename, 'write'):
+            self._file = filename
+        elif '{' in filename:
+            self._file = None
+            self._template = filename
+        else:
+            self._file = open(filename, 'ab')
+            self._own_file = True
+
+        # per channel packing state, keyed by SEED id
+        self._channels = {}
+        # Callback function for mst_pack collecting the records
+        records = self._records = []
+
+        def record_handler(record, reclen, _stream):
+            records.append(record[0:reclen])
+        self._rec_handler = C.CFUNCTYPE(
+            C.c_void_p, C.POINTER(C.c_char), C.c_int,
+            C.c_void_p)(record_handler)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        self.close()
+
+    def write(self, stream):
+        """
+        Append the data of all traces to their channels and write all
+        completely filled records.
+
+        :type stream: :class:`~obspy.core.stream.Stream` or
+            :class:`~obspy.core.trace.Trace`
+        :param stream: New data.
+        """
+        if isinstance(stream, Trace):
+            stream = [stream]
+        for trace in stream:
+            if not len(trace.data):
+                continue
+            channel = self._channels.get(trace.id)
+            if channel is not None and not self._is_continuation(channel,
+                                                                 trace):
+                self._pack(channel, flush=True)
+                self._free(channel)
+                channel = None
+            if channel is None:
+                channel = self._channels[trace.id] = self._open(trace)
+            data = np.require(trace.data, dtype=channel['dtype'],
+                              requirements=native_str('C'))
+            if data.dtype.byteorder not in ('=', '|'):
+                data = data.astype(data.dtype.newbyteorder('='))
+            errcode = clibmseed.mst_addspan(
+                channel['mst'],
+                util._convert_datetime_to_mstime(trace.stats.starttime),
+                util._convert_datetime_to_mstime(trace.stats.endtime),
+                data.ctypes.data, len(data), channel['sampletype'], 1)
+            if errcode != 0:
+                raise Exception('Error in mst_addspan')
+            channel['endtime'] = trace.stats.endtime
+            self._pack(channel, flush=False)
+
+    def flush(self):
+        """
+        Write all remaining samples of all channels into partially filled
+        records.
+        """
+        for channel in self._channels.values():
+            self._pack(channel, flush=True)
+
+    def close(self):
+        """
+        Flush all channels, release their packing state and close the file.
+        """
+        try:
+            self.flush()
+        finally:
+            for channel in self._channels.values():
+                self._free(channel)
+            self._channels = {}
+            if self._own_file:
+                self._file.close()
+                self._own_file = False
+
+    def _open(self, trace):
+        """
+        Create the packing state of a new channel starting with trace.
+        """
+        stats = trace.stats
+        mseed = stats.get('mseed', {})
+        encoding = self.encoding
+        if encoding is None:
+            encoding = _default_encoding(trace.data.dtype)
+            if encoding is None:
+                msg = "Unsupported data type %s of %s" % (
+                    trace.data.dtype, trace.id)
+                raise Exception(msg)
+        elif trace.data.dtype.type != ENCODINGS[encoding][2]:
+            msg = "Wrong dtype %s of %s for encoding %s." % (
+                trace.data.dtype, trace.id, ENCODINGS[encoding][0])
+            raise Exception(msg)
+        # INT16 needs INT32 data type
+        dtype = np.int32 if encoding == 1 else trace.data.dtype.type
+        dataquality = mseed.get('dataquality', 'D').upper()
+        if dataquality not in ['D', 'R', 'Q', 'M']:
+            msg = 'Invalid dataquality of %s.' % trace.id + \
+                  'The dataquality for Mini-SEED must be either D, R, Q ' + \
+                  'or M. See the SEED manual for further information.'
+            raise ValueError(msg)
+        timing_quality = mseed.get('blkt1001', {}).get('timing_quality')
+        if timing_quality is None and _needs_blkt_1001(trace):
+            timing_quality = 0
+
+        sampletype = SAMPLETYPE[np.dtype(dtype).type].encode('ascii',
+                                                             'strict')
+        mst = clibmseed.mst_init(None)
+        mst.contents.network = stats.network.encode('ascii', 'strict')
+        mst.contents.station = stats.station.encode('ascii', 'strict')
+        mst.contents.location = stats.location.encode('ascii', 'strict')
+        mst.contents.channel = stats.channel.encode('ascii', 'strict')
+        mst.contents.dataquality = dataquality.encode('ascii', 'strict')
+        mst.contents.type = b'\x00'
+        mst.contents.starttime = \
+            util._convert_datetime_to_mstime(stats.starttime)
+        mst.contents.endtime = mst.contents.starttime
+        mst.contents.samprate = stats.sampling_rate
+        mst.contents.sampletype = sampletype
+        try:
+            msr = _create_msr_template(
+                trace, dataquality, int(mseed.get('sequence_number', 1)),
+                timing_quality)
+        except Exception:
+            clibmseed.mst_free(C.pointer(mst))
+            raise
+        if self._template is not None:
+            filename = self._template.format(
+                network=stats.network, station=stats.station,
+                location=stats.location, channel=stats.channel)
+        else:
+            filename = None
+        if encoding == 1:
+            # Number of INT16 samples in a record: fixed header, blockette
+            # 1000 and the blockettes of the template.
+            headerlen = 48 + 8
+            blkt = msr.contents.blkts
+            while blkt:
+                headerlen += 4 + blkt.contents.blktdatalen
+                blkt = blkt.contents.next
+            record_samples = (self.reclen - headerlen) // 2
+        else:
+            record_samples = None
+        return {'mst': mst, 'msr': msr, 'encoding': encoding,
+                'dtype': dtype, 'sampletype': sampletype,
+                'sampling_rate': stats.sampling_rate,
+                'endtime': stats.endtime, 'filename': filename,
+                'record_samples': record_samples}
+
+    def _is_continuation(self, channel, trace):
+        """
+        Whether trace continues the data of channel.
+        """
+        if trace.stats.sampling_rate != channel['sampling_rate'] or \
+                (self.encoding is None and
+                 _default_encoding(trace.data.dtype) != channel['encoding']):
+            return False
+        delta = trace.stats.delta
+        gap = trace.stats.starttime - (channel['endtime'] + delta)
+        return abs(gap) <= 0.5 * delta
+
+    def _pack(self, channel, flush):
+        """
+        Pack samples of a channel and write the records. Without flush only
+        completely filled records are written.
+        """
+        mst = channel['mst']
+        numsamples = mst.contents.numsamples
+        if not numsamples:
+            return
+        tail = None
+        if not flush and channel['record_samples']:
+            # libmseed determines full records from the size of the 32 bit
+            # input samples and would write partially filled INT16 records.
+            # Pack the samples of full records only and add the others
+            # again afterwards.
+            n = numsamples // channel['record_samples'] * \
+                channel['record_samples']
+            if not n:
+                return
+            tail = C.string_at(mst.contents.datasamples + n * 4,
+                               (numsamples - n) * 4)
+            mst.contents.numsamples = mst.contents.samplecnt = n
+            flush = True
+        packedsamples = C.c_int64()
+        errcode = clibmseed.mst_pack(
+            mst, self._rec_handler, None, self.reclen, channel['encoding'],
+            self.byteorder, C.byref(packedsamples), 1 if flush else 0,
+            self.verbose, channel['msr'])
+        if tail:
+            clibmseed.mst_addspan(
+                mst, mst.contents.starttime,
+                util._convert_datetime_to_mstime(channel['endtime']), tail,
+                len(tail) // 4, channel['sampletype'], 1)
+        if errcode == -1:
+            raise Exception('Error in mst_pack')
+        if self._records:
+            data = b''.join(self._records)
+            del self._records[:]
+            if channel['filename'] is None:
+                self._file.write(data)
+            else:
+                with open(channel['filename'], 'ab') as fh:
+                    fh.write(data)
+
+    def _free(self, channel):
+        """
+        Release the packing state of a channel.
+        """
+        clibmseed.mst_free(C.pointer(channel['mst']))
+        clibmseed.msr_free(C.pointer(channel['msr']))
+        channel['mst'] = channel['msr'] = None
+
+
+def _needs_blkt_1001(trace):
+    """
+    Whether start time or sampling interval of a trace have a precision of
+    more than 100 microseconds, requiring Blockette 1001.
+    """
+    starttime = util._convert_datetime_to_mstime(trace.stats.starttime)
+    return starttime % 100 != 0 or \
+        (1.0 / trace.stats.sampling_rate * HPTMODULUS) % 100 != 0
+
+
+def _default_encoding(dtype):
+    """
+    Default encoding for writing data of the given dtype, None if the dtype
+    is not supported.
+    """
+    if dtype.type == np.int32:
+        return 11
+    elif dtype.type == np.float32:
+        return 4
+    elif dtype.type == np.float64:
+        return 5
+    elif dtype.type == np.int16:
+        return 1
+    elif dtype.type == np.dtype(native_str('|S1')).type:
+        return 0
+    return None
+
+
+def _create_msr_template(trace, dataquality, sequence_number,
+                         timing_quality=None):
+    """
+    Create the MSRecord template used by mst_pack for packing the records of
+    a trace. It has to be freed with msr_free.
+
+    :param timing_quality: If not None, Blockette 1001 with this timing
+        quality is added to every record.
+    """
+    msr = clibmseed.msr_init(None)
+    msr.contents.network = trace.stats.network.encode('ascii', 'strict')
+    msr.contents.station = trace.stats.station.encode('ascii', 'strict')
+    msr.contents.location = trace.stats.location.encode('ascii', 'strict')
+    msr.contents.channel = trace.stats.channel.encode('ascii', 'strict')
+    msr.contents.dataquality = dataquality.encode('ascii', 'strict')
+
+    # Set starting sequence number
+    msr.contents.sequence_number = sequence_number
+
+    # Only use Blockette 1001 if necessary.
+    if timing_quality is not None:
+        size = C.sizeof(Blkt1001S)
+        # Only timing quality matters here, other blockette attributes will
+        # be filled by libmseed.msr_normalize_header
+        blkt_value = pack(native_str("BBBB"), timing_quality, 0, 0, 0)
+        blkt_ptr = C.create_string_buffer(blkt_value, len(blkt_value))
+
+        # Usually returns a pointer to the added blockette in the
+        # blockette link chain and a NULL pointer if it fails.
+        # NULL pointers have a false boolean value according to the
+        # ctypes manual.
+        ret_val = clibmseed.msr_addblockette(msr, blkt_ptr,
+                                             size, 1001, 0)
+
+        if bool(ret_val) is False:
+            clibmseed.msr_free(C.pointer(msr))
+            del msr
+            raise Exception('Error in msr_addblockette')
+
+    # Only use Blockette 100 if necessary.
+    # Determine if a blockette 100 will be needed to represent the input
+    # sample rate or if the sample rate in the fixed section of the data
+    # header will suffice (see ms_genfactmult in libmseed/genutils.c)
+    use_blkt_100 = False
+
+    _factor = C.c_int16()
+    _multiplier = C.c_int16()
+    _retval = clibmseed.ms_genfactmult(
+        trace.stats.sampling_rate, C.pointer(_factor),
+        C.pointer(_multiplier))
+    # Use blockette 100 if ms_genfactmult() failed.
+    if _retval != 0:
+        use_blkt_100 = True
+    # Otherwise figure out if ms_genfactmult() found exact factors.
+    # Otherwise write blockette 100.
+    else:
+        ms_sr = clibmseed.ms_nomsamprate(_factor.value, _multiplier.value)
+
+        # It is also necessary if the libmseed calculated sampling rate
+        # would result in a loss of accuracy - the floating point
+        # comparision is on purpose here as it will always try to
+        # preserve all accuracy.
+        # Cast to float32 to not add blockette 100 for values
+        # that cannot be represented with 32bits.
+        if np.float32(ms_sr) != np.float32(trace.stats.sampling_rate):
+            use_blkt_100 = True
+
+    if use_blkt_100:
+        size = C.sizeof(Blkt100S)
+        blkt100 = C.c_char(b' ')
+        C.memset(C.pointer(blkt100), 0, size)
+        ret_val = clibmseed.msr_addblockette(
+            msr, C.pointer(blkt100), size, 100, 0)  # NOQA
+        # Usually returns a pointer to the added blockette in the
+        # blockette link chain and a NULL pointer if it fails.
+        # NULL pointers have a false boolean value according to the
+        # ctypes manual.
+        if bool(ret_val) is False:
+            clibmseed.msr_free(C.pointer(msr))  # NOQA
+            del msr  # NOQA
+            raise Exception('Error in msr_addblockette')
+    return msr
+
+
 class MST(object):
     """
     Class that transforms a ObsPy Trace object to a libmseed internal MSTrace
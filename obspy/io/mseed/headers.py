@@ -712,6 +712,11 @@ __clibmseed.mst_packgroup.argtypes = [
     C.c_short, C.POINTER(MSRecord)]
 __clibmseed.mst_packgroup.restype = C.c_int
 
+__clibmseed.mst_addspan.argtypes = [
+    C.POINTER(MSTrace), C.c_longlong, C.c_longlong, C.c_void_p, C.c_int64,
+    C.c_char, C.c_int8]
+__clibmseed.mst_addspan.restype = C.c_int
+
 __clibmseed.msr_addblockette.argtypes = [C.POINTER(MSRecord),
                                          C.POINTER(C.c_char),
                                          C.c_int, C.c_int, C.c_int]
@@ -20,9 +20,11 @@ from obspy import Stream, Trace, UTCDateTime, read
 from obspy.core import AttribDict
 from obspy.core.compatibility import from_buffer
 from obspy.core.util import CatchOutput, NamedTemporaryFile
+from obspy.core.util.misc import TemporaryWorkingDirectory
 from obspy.io.mseed import (util, InternalMSEEDWarning,
                             InternalMSEEDError)
-from obspy.io.mseed.core import _is_mseed, _read_mseed, _write_mseed
+from obspy.io.mseed.core import (MSEEDWriter, _is_mseed, _read_mseed,
+                                 _write_mseed)
 from obspy.io.mseed.headers import ENCODINGS, clibmseed
 from obspy.io.mseed.msstruct import _MSStruct
 
@@ -1566,6 +1568,50 @@ class MSEEDReadingAndWritingTestCase(unittest.TestCase):
         self.assertEqual(''.join(tr.data.astype(str)),
                          '001:00:00:00 REF TEK 130\r\n')
 
+    def test_mseed_writer(self):
+        """
+        Records written in chunks with the MSEEDWriter are the same as the
+        ones written at once.
+        """
+        np.random.seed(815)
+        for encoding, dtype in (('STEIM2', np.int32), ('INT16', np.int16),
+                                ('FLOAT32', np.float32)):
+            data = np.random.randint(-1000, 1000, 20000).astype(dtype)
+            tr = Trace(data=data, header={'station': 'TEST',
+                                          'channel': 'HHZ',
+                                          'sampling_rate': 100.0})
+            expected = io.BytesIO()
+            tr.write(expected, format='MSEED', encoding=encoding,
+                     reclen=512)
+            got = io.BytesIO()
+            with MSEEDWriter(got, encoding=encoding, reclen=512) as writer:
+                for i in range(0, 20000, 777):
+                    chunk = tr.copy()
+                    chunk.data = data[i:i + 777]
+                    chunk.stats.starttime += i / 100.0
+                    writer.write(chunk)
+            self.assertEqual(got.getvalue(), expected.getvalue())
+
+        # A gap starts a new segment, every channel gets its own file.
+        tr1 = Trace(data=np.arange(1000, dtype=np.int32),
+                    header={'station': 'A', 'channel': 'HHZ'})
+        tr2 = tr1.copy()
+        tr2.stats.starttime += 20
+        tr3 = tr1.copy()
+        tr3.stats.channel = 'HHN'
+        with TemporaryWorkingDirectory():
+            with MSEEDWriter('{station}.{channel}.mseed') as writer:
+                writer.write(Stream([tr1, tr3]))
+                writer.write(tr2)
+            st = read('A.HHZ.mseed')
+            self.assertEqual(len(st), 2)
+            for tr, expected in zip(st, (tr1, tr2)):
+                self.assertEqual(tr.stats.starttime, expected.stats.starttime)
+                np.testing.assert_array_equal(tr.data, expected.data)
+            st = read('A.HHN.mseed')
+            self.assertEqual(len(st), 1)
+            np.testing.assert_array_equal(st[0].data, tr3.data)
+
 
 def suite():
     return unittest.makeSuite(MSEEDReadingAndWritingTestCase, 'test')
@@ -22,9 +22,15 @@ from future.builtins import *  # NOQA @UnusedWildImport
 import warnings
 from collections import defaultdict
 import datetime
+import functools
+import math
+import multiprocessing
 import os
 import io
 
+import numpy as np
+from future.utils import native_str
+
 from obspy import UTCDateTime, read
 from obspy.geodetics import kilometers2degrees, degrees2kilometers
 from obspy.core.event import (
@@ -42,6 +48,19 @@ onsets = {'I': 'impulsive', 'E': 'emergent'}
 # info in that line will be.
 accepted_tags = ['1', '6', '7', 'E', ' ', 'F', 'M', '3']
 
+_POLARITIES = {"C": "positive", "D": "negative"}
+_NS_PER_DAY = 86400 * 1000000000
+# Columns of the table returned by read_pick_table()
+_PICK_TABLE_DTYPE = np.dtype([
+    (native_str(name), native_str(dtype)) for name, dtype in [
+        ('event', 'i8'), ('origin_time', 'f8'), ('station', 'U5'),
+        ('channel', 'U2'), ('phase', 'U7'), ('onset', 'U9'),
+        ('polarity', 'U11'), ('evaluation_mode', 'U9'), ('time', 'f8'),
+        ('backazimuth', 'f8'), ('amplitude', 'f8'), ('amplitude_type', 'U3'),
+        ('period', 'f8'), ('snr', 'f8'), ('time_weight', 'f8'),
+        ('backazimuth_residual', 'f8'), ('time_residual', 'f8'),
+        ('distance', 'f8'), ('azimuth', 'f8')]])
+
 
 class NordicParsingError(Exception):
     """
@@ -111,8 +130,17 @@ def _get_line_tags(f, report=True):
         raise NordicParsingError(
             "Lines are not 80 characters long: not a nordic file")
     f.seek(0)
+    return _tag_lines(f, report=report)
+
+
+def _tag_lines(lines, report=True):
+    """
+    Associate lines with a known line-type
+    :param lines: Iterable of lines
+    :param report: Whether to report warnings about lines not implemented
+    """
     tags = defaultdict(list)
-    for i, line in enumerate(f):
+    for i, line in enumerate(lines):
         try:
             line_id = line.rstrip()[79]
         except IndexError:
@@ -162,6 +190,13 @@ def _float_conv(string):
     return floatstring
 
 
+# Arrival attributes read from pick lines without amplitude
+_ARRIVAL_COLUMNS = [('backazimuth_residual', _int_conv, slice(60, 63)),
+                    ('time_residual', _float_conv, slice(63, 68)),
+                    ('distance', _float_conv, slice(70, 75)),
+                    ('azimuth', _int_conv, slice(76, 79))]
+
+
 def _str_conv(number, rounded=False):
     """
     Convenience tool to convert a number, either float or int into a string.
@@ -280,10 +315,8 @@ def _readheader(head_lines):
     head_lines.sort(key=lambda tup: tup[1])
     # Construct a rough catalog, then merge events together to cope with
     # multiple origins
-    _cat = Catalog()
-    for line in head_lines:
-        _cat.append(_read_origin(line=line[0]))
-    new_event = _cat.events.pop(0)
+    _cat = [_read_origin(line=line[0]) for line in head_lines]
+    new_event = _cat.pop(0)
     for event in _cat:
         matched = False
         origin_times = [origin.time for origin in new_event.origins]
@@ -327,18 +360,8 @@ def _read_origin(line):
     :return: `~obspy.core.event.Event`
     """
     new_event = Event()
-    try:
-        sfile_seconds = line[16:20].strip()
-        if len(sfile_seconds) == 0:
-            sfile_seconds = 0.0
-        else:
-            sfile_seconds = float(sfile_seconds)
-        new_event.origins.append(Origin())
-        new_event.origins[0].time = UTCDateTime(
-            int(line[1:5]), int(line[6:8]), int(line[8:10]),
-            int(line[11:13]), int(line[13:15]), 0, 0) + sfile_seconds
-    except Exception:
-        raise NordicParsingError("Couldn't read a date from sfile")
+    new_event.origins.append(Origin())
+    new_event.origins[0].time = _read_origin_time(line)
     # new_event.loc_mod_ind=line[20]
     new_event.event_descriptions.append(EventDescription(text=line[21:23]))
     for key, _slice in [('latitude', slice(23, 30)),
@@ -371,6 +394,26 @@ def _read_origin(line):
     return new_event
 
 
+def _read_origin_time(line):
+    """
+    Read the origin time of an origin (type 1) line.
+
+    :param str line: Origin format (type 1) line
+    :rtype: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    """
+    try:
+        sfile_seconds = line[16:20].strip()
+        if len(sfile_seconds) == 0:
+            sfile_seconds = 0.0
+        else:
+            sfile_seconds = float(sfile_seconds)
+        return UTCDateTime(
+            int(line[1:5]), int(line[6:8]), int(line[8:10]),
+            int(line[11:13]), int(line[13:15]), 0, 0) + sfile_seconds
+    except Exception:
+        raise NordicParsingError("Couldn't read a date from sfile")
+
+
 def _read_mags(line, event):
     """
     Read the magnitude info from a Nordic header line. Convenience function
@@ -564,16 +607,17 @@ def _extract_event(event_str, catalog, wav_names, return_wavnames=False):
 
     :return: Adds event to catalog and returns. Works in place on catalog.
     """
-    tmp_sfile = io.StringIO()
-    for event_line in event_str:
-        tmp_sfile.write(event_line)
-    tagged_lines = _get_line_tags(f=tmp_sfile)
+    if len(event_str[0].rstrip()) != 80:
+        # Cannot be Nordic
+        raise NordicParsingError(
+            "Lines are not 80 characters long: not a nordic file")
+    tagged_lines = _tag_lines(event_str)
     new_event = _readheader(head_lines=tagged_lines['1'])
     new_event = _read_uncertainty(tagged_lines, new_event)
     new_event = _read_focal_mechanisms(tagged_lines, new_event)
     new_event = _read_moment_tensors(tagged_lines, new_event)
     if return_wavnames:
-        wav_names.append(_readwavename(f=tmp_sfile))
+        wav_names.append(_readwavename(f=event_str))
     new_event = _read_picks(tagged_lines=tagged_lines, new_event=new_event)
     catalog += new_event
     return catalog, wav_names
@@ -723,34 +767,8 @@ def _read_picks(tagged_lines, new_event):
             polarity = line[16]
             if weight == ' ':
                 weight = 0
-        polarity_maps = {"": "undecidable", "C": "positive", "D": "negative"}
-        try:
-            polarity = polarity_maps[polarity]
-        except KeyError:
-            polarity = "undecidable"
-        # It is valid nordic for the origin to be hour 23 and picks to be hour
-        # 00 or 24: this signifies a pick over a day boundary.
-        if int(line[18:20]) == 0 and evtime.hour == 23:
-            day_add = 86400
-            pick_hour = 0
-        elif int(line[18:20]) == 24:
-            day_add = 86400
-            pick_hour = 0
-        else:
-            day_add = 0
-            pick_hour = int(line[18:20])
-        try:
-            time = UTCDateTime(evtime.year, evtime.month, evtime.day,
-                               pick_hour, int(line[20:22]),
-                               float(line[23:28])) + day_add
-        except ValueError:
-            time = UTCDateTime(evtime.year, evtime.month, evtime.day,
-                               int(line[18:20]), pick_hour,
-                               float("0." + line[23:38].split('.')[1])) +\
-                60 + day_add
-            # Add 60 seconds on to the time, this copes with s-file
-            # preference to write seconds in 1-60 rather than 0-59 which
-            # datetime objects accept
+        polarity = _POLARITIES.get(polarity, "undecidable")
+        time = _read_pick_time(line, evtime)
         if header[57:60] == 'AIN':
             ain = _float_conv(line[57:60])
             warnings.warn('AIN: %s in header, currently unsupported' % ain)
@@ -777,12 +795,14 @@ def _read_picks(tagged_lines, new_event):
         # implemented, needs to be converted from km/s to s/deg
         # if not velocity == 999.0:
             # new_event.picks[pick_index].horizontal_slowness = 1.0 / velocity
-        if _float_conv(line[46:51]) is not None:
-            pick.backazimuth = _float_conv(line[46:51])
+        backazimuth = _float_conv(line[46:51])
+        if backazimuth is not None:
+            pick.backazimuth = backazimuth
         # Create new obspy.event.Amplitude class which references above Pick
         # only if there is an amplitude picked.
-        if _float_conv(line[33:40]) is not None:
-            _amplitude = Amplitude(generic_amplitude=_float_conv(line[33:40]),
+        amplitude = _float_conv(line[33:40])
+        if amplitude is not None:
+            _amplitude = Amplitude(generic_amplitude=amplitude,
                                    period=_float_conv(line[41:45]),
                                    pick_id=pick.resource_id,
                                    waveform_id=pick.waveform_id)
@@ -817,23 +837,278 @@ def _read_picks(tagged_lines, new_event):
                 _amplitude.snr = snr
             new_event.amplitudes.append(_amplitude)
         # Create new obspy.event.Arrival class referencing above Pick
-        if _float_conv(line[33:40]) is None:
+        if amplitude is None:
             arrival = Arrival(phase=pick.phase_hint, pick_id=pick.resource_id)
             if weight is not None:
                 arrival.time_weight = weight
-            if _int_conv(line[60:63]) is not None:
-                arrival.backazimuth_residual = _int_conv(line[60:63])
-            if _float_conv(line[63:68]) is not None:
-                arrival.time_residual = _float_conv(line[63:68])
-            if _float_conv(line[70:75]) is not None:
-                arrival.distance = kilometers2degrees(_float_conv(line[70:75]))
-            if _int_conv(line[76:79]) is not None:
-                arrival.azimuth = _int_conv(line[76:79])
+            for key, conv, _slice in _ARRIVAL_COLUMNS:
+                value = conv(line[_slice])
+                if value is not None:
+                    if key == 'distance':
+                        value = kilometers2degrees(value)
+                    setattr(arrival, key, value)
             new_event.origins[0].arrivals.append(arrival)
         new_event.picks.append(pick)
     return new_event
 
 
+def _read_pick_time(line, evtime):
+    """
+    Read the time of a pick line of an event with origin time evtime.
+
+    :type line: str
+    :param line: Pick line
+    :type evtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :param evtime: Origin time of the event
+
+    :rtype: :class:`~obspy.core.utcdatetime.UTCDateTime`
+    """
+    # It is valid nordic for the origin to be hour 23 and picks to be hour
+    # 00 or 24: this signifies a pick over a day boundary.
+    if int(line[18:20]) == 0 and evtime.hour == 23:
+        day_add = 86400
+        pick_hour = 0
+    elif int(line[18:20]) == 24:
+        day_add = 86400
+        pick_hour = 0
+    else:
+        day_add = 0
+        pick_hour = int(line[18:20])
+    try:
+        minute = int(line[20:22])
+        second = float(line[23:28])
+    except ValueError:
+        pass
+    else:
+        if 0 <= pick_hour < 24 and 0 <= minute < 60 and 0 <= second < 60:
+            # same rounding to microseconds as UTCDateTime, but without
+            # going through datetime objects
+            frac, second = math.modf(round(second, 6))
+            microsecond = int(round(frac * 1e6))
+            if microsecond < 1000000:
+                seconds = day_add + pick_hour * 3600 + minute * 60 + \
+                    int(second)
+                return UTCDateTime(
+                    ns=evtime._ns - evtime._ns % _NS_PER_DAY +
+                    seconds * 1000000000 + microsecond * 1000)
+    try:
+        time = UTCDateTime(evtime.year, evtime.month, evtime.day,
+                           pick_hour, int(line[20:22]),
+                           float(line[23:28])) + day_add
+    except ValueError:
+        time = UTCDateTime(evtime.year, evtime.month, evtime.day,
+                           int(line[18:20]), pick_hour,
+                           float("0." + line[23:38].split('.')[1])) +\
+            60 + day_add
+        # Add 60 seconds on to the time, this copes with s-file
+        # preference to write seconds in 1-60 rather than 0-59 which
+        # datetime objects accept
+    return time
+
+
+def read_pick_table(sfiles, processes=None, encoding='latin-1'):
+    """
+    Read the picks of many Nordic files into one table.
+
+    Much faster than :func:`read_nordic` for large bulletins, e.g. all S-files
+    of a SEISAN REA directory tree, as no event objects are created. Lines of
+    a file are classified and pick lines are converted column by column for
+    all events of the file at once. Values are the same as the ones of the
+    picks, amplitudes and arrivals created by :func:`read_nordic`, values not
+    set there are NaN or empty strings.
+
+    :type sfiles: list of str
+    :param sfiles: Paths of S-files or select files.
+    :type processes: int
+    :param processes: If given, parse the files in a pool of that many
+        processes.
+    :type encoding: str
+    :param encoding: Encoding for file, used to decode from bytes to string
+
+    :rtype: :class:`numpy.ndarray`
+    :returns: Structured array with one record per pick and the fields
+
+        ``event``
+            Index of the event the pick belongs to, counting the events of
+            all files in the given order.
+        ``origin_time``, ``time``
+            Timestamps of the first origin and the pick.
+        ``station``, ``channel``, ``phase``, ``onset``, ``polarity``,
+        ``evaluation_mode``, ``backazimuth``
+            Pick information.
+        ``amplitude``, ``amplitude_type``, ``period``, ``snr``
+            Generic amplitude, type, period and signal-to-noise ratio of the
+            pick's amplitude.
+        ``time_weight``, ``backazimuth_residual``, ``time_residual``,
+        ``distance``, ``azimuth``
+            Arrival information, distance in degrees.
+
+    .. rubric:: Example
+
+    >>> import glob
+    >>> files = sorted(glob.glob('/path/to/REA/*/*/*/*.S*'))  # doctest: +SKIP
+    >>> picks = read_pick_table(files, processes=4)  # doctest: +SKIP
+    >>> p_picks = picks[picks['phase'] == 'P']  # doctest: +SKIP
+    """
+    sfiles = list(sfiles)
+    if processes and processes > 1 and len(sfiles) > 1:
+        pool = multiprocessing.Pool(min(processes, len(sfiles)))
+        try:
+            tables = pool.map(
+                functools.partial(_read_pick_table, encoding=encoding), sfiles)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        tables = [_read_pick_table(sfile, encoding=encoding)
+                  for sfile in sfiles]
+    n_events = 0
+    for table, _n_events in tables:
+        table['event'] += n_events
+        n_events += _n_events
+    return np.concatenate(
+        [np.empty(0, dtype=_PICK_TABLE_DTYPE)] +
+        [table for table, _ in tables])
+
+
+def _read_pick_table(sfile, encoding='latin-1'):
+    """
+    Read the picks of one Nordic file into a table, see
+    :func:`read_pick_table`.
+
+    :returns: Pick table and number of events in the file
+    """
+    with io.open(sfile, 'r', encoding=encoding) as f:
+        lines = [line.rstrip().ljust(80)[:80]
+                 for line in f.read().split('\n')]
+    chars = np.array(lines, dtype=native_str('U80'))
+    chars = chars.view(native_str('U1')).reshape(-1, 80)
+    # events are separated by blank lines
+    blank = (chars == ' ').all(axis=1)
+    event = np.cumsum(~blank & np.concatenate([[True], blank[:-1]])) - 1
+    n_events = event[-1] + 1
+    tags = chars[:, 79]
+    # first origin line of each event
+    rows = np.flatnonzero(~blank & (tags == '1'))
+    events, index = np.unique(event[rows], return_index=True)
+    if len(events) < n_events:
+        raise NordicParsingError("No header lines found")
+    evtimes = [_read_origin_time(lines[i]) for i in rows[index]]
+    # events where the pick header line (type 7) announces SNR values
+    is_snr = np.zeros(n_events, dtype=np.bool_)
+    rows = np.flatnonzero(~blank & (tags == '7'))
+    events, index = np.unique(event[rows], return_index=True)
+    is_snr[events] = _str_column(chars[rows[index]], 57, 60) == 'SNR'
+
+    rows = np.flatnonzero(~blank & (tags == ' ') &
+                          (chars[:, 18:28] != ' ').any(axis=1))
+    chars = chars[rows]
+    event = event[rows]
+    table = np.zeros(len(rows), dtype=_PICK_TABLE_DTYPE)
+    table['event'] = event
+    table['origin_time'] = np.array(
+        [evtime._ns for evtime in evtimes], dtype=np.int64)[event] / 1e9
+    table['station'] = np.char.strip(_str_column(chars, 1, 6))
+    table['channel'] = np.char.strip(_str_column(chars, 6, 8))
+    weight = chars[:, 14]
+    underscore = weight == '_'
+    table['phase'] = np.where(underscore, _str_column(chars, 10, 17),
+                              np.char.strip(_str_column(chars, 10, 14)))
+    table['polarity'] = 'undecidable'
+    for key, value in _POLARITIES.items():
+        table['polarity'][~underscore & (chars[:, 16] == key)] = value
+    for key, value in onsets.items():
+        table['onset'][chars[:, 9] == key] = value
+    table['evaluation_mode'] = np.where(chars[:, 15] == 'A', 'automatic',
+                                        'manual')
+    table['time'] = _pick_time_column(chars, evtimes, event)
+    table['backazimuth'] = _number_column(chars, 46, 51)
+
+    amplitude = _number_column(chars, 33, 40)
+    coda = _number_column(chars, 28, 33, int)
+    snr = _number_column(chars, 57, 60)
+    snr[~is_snr[event]] = np.nan
+    has_amplitude = ~np.isnan(amplitude)
+    has_coda = ~has_amplitude & ~np.isnan(coda)
+    is_aml = has_amplitude & (table['phase'] == 'IAML')
+    # Default AML unit in seisan is nm
+    amplitude[is_aml] /= 1e9
+    table['amplitude'] = np.where(has_coda, coda, amplitude)
+    table['amplitude_type'][has_amplitude] = 'A'
+    table['amplitude_type'][is_aml] = 'AML'
+    table['amplitude_type'][has_coda] = 'END'
+    table['period'] = np.where(has_amplitude, _number_column(chars, 41, 45),
+                               np.nan)
+    table['snr'] = np.where(
+        (has_amplitude & (snr != 0)) | has_coda, snr, np.nan)
+
+    weight = np.where(underscore | (weight == ' '), 0,
+                      _number_column(chars, 14, 15))
+    table['time_weight'] = np.where(has_amplitude, np.nan, weight)
+    for key, conv, _slice in _ARRIVAL_COLUMNS:
+        values = _number_column(chars, _slice.start, _slice.stop,
+                                float if conv is _float_conv else int)
+        if key == 'distance':
+            values = kilometers2degrees(values)
+        table[key] = np.where(has_amplitude, np.nan, values)
+    return table, n_events
+
+
+def _str_column(chars, start, stop):
+    """
+    Strings of columns start to stop of lines given as array of characters.
+    """
+    return np.ascontiguousarray(chars[:, start:stop]).view(
+        native_str('U%d' % (stop - start)))[:, 0]
+
+
+def _number_column(chars, start, stop, conv=float):
+    """
+    Numbers in columns start to stop of lines given as array of characters,
+    NaN where _float_conv or _int_conv would return None.
+    """
+    strings = np.char.strip(_str_column(chars, start, stop))
+    values = np.empty(len(strings), dtype=np.float64)
+    values.fill(np.nan)
+    mask = strings != ''
+    try:
+        values[mask] = strings[mask].astype(
+            np.float64 if conv is float else np.int64)
+    except ValueError:
+        conv = _float_conv if conv is float else _int_conv
+        values[mask] = [np.nan if value is None else value
+                        for value in map(conv, strings[mask])]
+    return values
+
+
+def _pick_time_column(chars, evtimes, event):
+    """
+    Timestamps of pick lines given as array of characters, same as
+    _read_pick_time.
+    """
+    hour = _number_column(chars, 18, 20, int)
+    minute = _number_column(chars, 20, 22, int)
+    second = _number_column(chars, 23, 28)
+    evhour = np.array([evtime.hour for evtime in evtimes])[event]
+    day_add = ((hour == 0) & (evhour == 23)) | (hour == 24)
+    hour[day_add] = 0
+    microseconds = np.round(second * 1e6)
+    with np.errstate(invalid='ignore'):
+        fast = (0 <= hour) & (hour < 24) & (0 <= minute) & (minute < 60) & \
+            (0 <= microseconds) & (microseconds < 60000000)
+    midnight = np.array([evtime._ns - evtime._ns % _NS_PER_DAY
+                         for evtime in evtimes], dtype=np.int64)[event]
+    seconds = day_add * 86400 + hour * 3600 + minute * 60
+    ns = midnight[fast] + seconds[fast].astype(np.int64) * 1000000000 + \
+        microseconds[fast].astype(np.int64) * 1000
+    times = np.empty(len(chars), dtype=np.float64)
+    times[fast] = ns / 1e9
+    for i in np.flatnonzero(~fast):
+        times[i] = _read_pick_time(
+            ''.join(chars[i]), evtimes[event[i]]).timestamp
+    return times
+
+
 def readwavename(sfile, encoding='latin-1'):
     """
     Extract the waveform filename from the s-file.
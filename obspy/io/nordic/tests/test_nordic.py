@@ -13,6 +13,8 @@ import os
 import unittest
 import warnings
 
+import numpy as np
+
 from obspy import read_events, Catalog, UTCDateTime, read
 from obspy.core.event import (
     Pick, WaveformStreamID, Arrival, Amplitude, Event, Origin, Magnitude,
@@ -25,7 +27,7 @@ from obspy.io.nordic.core import (
     _is_sfile, read_spectral_info, read_nordic, readwavename, blanksfile,
     _write_nordic, nordpick, readheader, _int_conv, _readheader, _evmagtonor,
     write_select, NordicParsingError, _float_conv, _nortoevmag, _str_conv,
-    _get_line_tags)
+    _get_line_tags, read_pick_table)
 
 
 class TestNordicMethods(unittest.TestCase):
@@ -589,6 +591,57 @@ class TestNordicMethods(unittest.TestCase):
             self.assertTrue(pick.time in pick_times)
         self.assertEqual(event_2.origins[0].time, event.origins[0].time)
 
+    def test_read_pick_table(self):
+        """
+        Pick tables hold the same values as the events read by read_nordic.
+        """
+        filenames = [os.path.join(self.testing_path, filename) for filename in
+                     ('select.out', 'sfile_over_day_zeros', 'automag.out',
+                      'dos-file.sfile')]
+        # raises "UserWarning: AIN in header, currently unsupported"
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            events = [event for filename in filenames
+                      for event in read_nordic(filename)]
+        for processes in (None, 2):
+            table = read_pick_table(filenames, processes=processes)
+            self.assertEqual(len(table), sum(len(e.picks) for e in events))
+            self.assertEqual(table['event'][-1], len(events) - 1)
+            for row, (i, event, pick) in zip(table, [
+                    (i, event, pick) for i, event in enumerate(events)
+                    for pick in event.picks]):
+                self.assertEqual(row['event'], i)
+                self.assertEqual(row['origin_time'],
+                                 event.origins[0].time.timestamp)
+                self.assertEqual(row['time'], pick.time.timestamp)
+                self.assertEqual(row['station'],
+                                 pick.waveform_id.station_code)
+                self.assertEqual(row['phase'], pick.phase_hint)
+                self.assertEqual(row['onset'], pick.onset or '')
+                self.assertEqual(row['polarity'], pick.polarity)
+                amplitudes = [a for a in event.amplitudes
+                              if a.pick_id == pick.resource_id]
+                arrivals = [a for a in event.origins[0].arrivals
+                            if a.pick_id == pick.resource_id]
+                if amplitudes:
+                    self.assertEqual(row['amplitude_type'],
+                                     amplitudes[0].type)
+                    self.assertEqual(row['amplitude'],
+                                     amplitudes[0].generic_amplitude)
+                else:
+                    self.assertEqual(row['amplitude_type'], '')
+                if not arrivals:
+                    self.assertTrue(np.isnan(row['time_residual']))
+                else:
+                    for key in ('time_residual', 'distance'):
+                        value = arrivals[0][key]
+                        np.testing.assert_allclose(
+                            row[key], np.nan if value is None else value)
+        self.assertEqual(len(read_pick_table([])), 0)
+        with self.assertRaises(NordicParsingError):
+            read_pick_table([os.path.join(self.testing_path,
+                                          'Sfile_no_header')])
+
     def test_distance_conversion(self):
         """
         Check that distances are converted properly.
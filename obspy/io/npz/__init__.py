@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+obspy.io.npz - Columnar NumPy archive support for ObsPy
+=======================================================
+
+This module provides read and write support for the ``OBSPYNPZ`` format, a
+fast scratch format for passing waveforms between processing stages.
+
+A file is a plain NumPy ``.npz`` archive (see :func:`numpy.savez`). The
+headers of all traces are stored in a single structured array, the samples
+of every trace in an array of their own. Other than with the ``PICKLE``
+format no Python objects have to be created for the samples and other than
+with e.g. the ``MSEED`` format no encoding or compression is involved, the
+samples are stored as they are in memory.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+
+Writing
+-------
+Streams are written with the
+:meth:`~obspy.core.stream.Stream.write` method of a Stream object.
+
+>>> from obspy import read
+>>> st = read()
+>>> st.write("example.npz", format="OBSPYNPZ")  # doctest: +SKIP
+
+The samples are stored uncompressed by default. With ``compress=True`` they
+are compressed with zlib, which makes the files smaller but writing and
+reading slower.
+
+>>> st.write("example.npz", format="OBSPYNPZ",
+...          compress=True)  # doctest: +SKIP
+
+Any extra information in the ``stats`` of the traces, e.g. the processing
+history or format specific headers, is kept.
+
+Reading
+-------
+Files are read with the :func:`~obspy.core.stream.read` function. Only the
+requested samples are read from disk if the ``starttime`` and ``endtime``
+arguments are given and traces can be selected by their SEED id (which can
+contain wildcards) with the ``sourcename`` argument.
+
+>>> st = read("example.npz", sourcename="BW.RJOB..EH?",
+...           starttime=st[0].stats.starttime + 10)  # doctest: +SKIP
+
+With ``mmap=True`` the samples of uncompressed files are memory mapped
+instead of read, see :class:`numpy.memmap`. The file is mapped copy on
+write, changing the samples of the traces does not change the file.
+
+>>> st = read("example.npz", mmap=True)  # doctest: +SKIP
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
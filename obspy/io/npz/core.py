@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+OBSPYNPZ bindings to ObsPy core module.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import native_str
+
+import fnmatch
+import pickle
+import struct
+import zipfile
+
+import numpy as np
+
+from obspy import Stream, Trace, UTCDateTime
+from obspy.core.trace import Stats
+
+
+FORMAT_VERSION = 1
+
+# members of the archive besides the data arrays ``data_0``, ``data_1``, ...
+_VERSION_KEY = 'obspynpz_version'
+_HEADERS_KEY = 'headers'
+_EXTRA_KEY = 'extra_stats'
+
+_SEED_KEYS = ('network', 'station', 'location', 'channel')
+
+
+class _SampleWindow(Trace):
+    """
+    Trace without samples used to determine the samples a trim selects.
+    """
+    _always_contiguous = False
+
+
+def _is_obspynpz(filename):
+    """
+    Checks whether a file is an OBSPYNPZ file or not.
+
+    :type filename: str or file-like object
+    :param filename: OBSPYNPZ file to be checked.
+    :rtype: bool
+    :return: ``True`` if a OBSPYNPZ file.
+
+    .. rubric:: Example
+
+    >>> _is_obspynpz("/path/to/example.npz")  # doctest: +SKIP
+    True
+    """
+    try:
+        if not zipfile.is_zipfile(filename):
+            return False
+        if hasattr(filename, 'seek'):
+            filename.seek(0, 0)
+        with zipfile.ZipFile(filename) as zf:
+            names = zf.namelist()
+    except Exception:
+        return False
+    return _VERSION_KEY + '.npy' in names and _HEADERS_KEY + '.npy' in names
+
+
+def _read_obspynpz(filename, headonly=False, starttime=None, endtime=None,
+                   nearest_sample=True, sourcename=None, mmap=False,
+                   **kwargs):  # @UnusedVariable
+    """
+    Reads an OBSPYNPZ file and returns an ObsPy Stream object.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.stream.read` function, call this instead.
+
+    :type filename: str or file-like object
+    :param filename: OBSPYNPZ file to be read.
+    :type headonly: bool, optional
+    :param headonly: If set to ``True``, read only the headers.
+    :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
+    :param starttime: Only read samples starting at this time.
+    :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
+    :param endtime: Only read samples up to this time.
+    :type nearest_sample: bool, optional
+    :param nearest_sample: Only applied if ``starttime`` or ``endtime`` is
+        given, see :meth:`~obspy.core.trace.Trace.trim`.
+    :type sourcename: str, optional
+    :param sourcename: Only read traces with matching SEED ID (can contain
+        wildcards "?" and "*", e.g. "BW.UH2.*" or "*.??Z").
+    :type mmap: bool, optional
+    :param mmap: If set to ``True`` the samples of uncompressed files are
+        memory mapped (copy on write) instead of read. Ignored for
+        file-like objects, compressed files and samples not stored in native
+        byte order.
+    :rtype: :class:`~obspy.core.stream.Stream`
+    :return: A ObsPy Stream object.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> st = read("/path/to/example.npz")  # doctest: +SKIP
+    """
+    if headonly:
+        starttime = endtime = None
+    with np.load(filename) as npz:
+        version = int(npz[_VERSION_KEY])
+        if version > FORMAT_VERSION:
+            msg = 'OBSPYNPZ format version %d is not supported.' % version
+            raise NotImplementedError(msg)
+        headers = npz[_HEADERS_KEY]
+        extra = pickle.loads(npz[_EXTRA_KEY].tobytes())
+
+        if sourcename is not None:
+            if not isinstance(sourcename, (str, native_str)):
+                msg = 'sourcename needs to be a string'
+                raise ValueError(msg)
+            pattern = sourcename.upper()
+            ids = ['.'.join(row).upper() for row in
+                   zip(*[headers[key] for key in _SEED_KEYS])]
+            indices = [i for i, id_ in enumerate(ids)
+                       if fnmatch.fnmatch(id_, pattern)]
+        else:
+            indices = range(len(headers))
+
+        traces = []
+        fh = None
+        try:
+            for i in indices:
+                row = headers[i]
+                header = dict(extra[i])
+                for key in _SEED_KEYS:
+                    header[key] = str(row[key])
+                header['starttime'] = UTCDateTime(ns=int(row['starttime']))
+                header['sampling_rate'] = float(row['sampling_rate'])
+                header['calib'] = float(row['calib'])
+                npts = int(row['npts'])
+                if headonly:
+                    header['npts'] = npts
+                    traces.append(Trace(header=header))
+                    continue
+                start, npts, header['starttime'] = _sample_window(
+                    header, npts, starttime, endtime, nearest_sample)
+                name = 'data_%d.npy' % i
+                info = npz.zip.getinfo(name)
+                if info.compress_type != zipfile.ZIP_STORED:
+                    data = npz['data_%d' % i][start:start + npts]
+                    if not data.dtype.isnative:
+                        data = data.astype(data.dtype.newbyteorder('='))
+                else:
+                    if fh is None:
+                        fh = _open_raw(filename)
+                    data = _read_stored_array(
+                        fh, info, np.dtype(native_str(row['dtype'])), start,
+                        npts, filename if mmap else None)
+                traces.append(Trace(data=data, header=header))
+        finally:
+            if fh is not None and fh is not filename:
+                fh.close()
+    return Stream(traces=traces)
+
+
+def _sample_window(header, npts, starttime, endtime, nearest_sample):
+    """
+    Returns first sample, number of samples and start time of the samples of
+    a trace selected by trimming it to the given times, exactly like
+    :meth:`~obspy.core.trace.Trace.trim` would on the complete trace.
+    """
+    if starttime is None and endtime is None:
+        return 0, npts, header['starttime']
+    window = _SampleWindow(
+        data=np.broadcast_to(np.int8(0), (npts,)),
+        header={'starttime': header['starttime'],
+                'sampling_rate': header['sampling_rate']})
+    if starttime is not None:
+        window._ltrim(starttime, nearest_sample=nearest_sample)
+    if endtime is not None:
+        window._rtrim(endtime, nearest_sample=nearest_sample)
+    count = len(window.data)
+    if not count:
+        return 0, 0, window.stats.starttime
+    start = int(round((window.stats.starttime - header['starttime']) *
+                      header['sampling_rate']))
+    return start, count, window.stats.starttime
+
+
+def _open_raw(filename):
+    if hasattr(filename, 'read'):
+        return filename
+    return open(filename, 'rb')
+
+
+def _read_stored_array(fh, info, dtype, start, npts, mmap_filename=None):
+    """
+    Reads samples of an uncompressed array of the archive directly from the
+    file, without reading the samples outside the requested window.
+    """
+    if not npts:
+        return np.empty(0, dtype=dtype)
+    # local file header of the zip member, followed by the npy file whose
+    # header is skipped, its dtype is known from the header table
+    fh.seek(info.header_offset + 26, 0)
+    name_length, extra_length = struct.unpack(native_str('<2H'), fh.read(4))
+    fh.seek(name_length + extra_length, 1)
+    npy_header = fh.read(12)
+    if npy_header[6:7] == b'\x01':
+        offset = 10 + struct.unpack(native_str('<H'), npy_header[8:10])[0]
+    else:
+        offset = 12 + struct.unpack(native_str('<I'), npy_header[8:12])[0]
+    offset += fh.tell() - 12 + start * dtype.itemsize
+    if mmap_filename is not None and not hasattr(mmap_filename, 'read') \
+            and dtype.isnative:
+        return np.memmap(mmap_filename, dtype=dtype, mode='c', offset=offset,
+                         shape=(npts,))
+    data = np.empty(npts, dtype=dtype)
+    fh.seek(offset, 0)
+    if fh.readinto(data.view(np.uint8)) != data.nbytes:
+        msg = 'Unexpected end of file.'
+        raise IOError(msg)
+    if not dtype.isnative:
+        data = data.byteswap(True).view(dtype.newbyteorder('='))
+    return data
+
+
+def _write_obspynpz(stream, filename, compress=False,
+                    **kwargs):  # @UnusedVariable
+    """
+    Writes an OBSPYNPZ file from given ObsPy Stream object.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        the :meth:`~obspy.core.stream.Stream.write` method of an
+        ObsPy :class:`~obspy.core.stream.Stream` object, call this instead.
+
+    :type stream: :class:`~obspy.core.stream.Stream`
+    :param stream: The ObsPy Stream object to write.
+    :type filename: str or file-like object
+    :param filename: Name of file to write.
+    :type compress: bool, optional
+    :param compress: If set to ``True`` the samples are compressed with zlib,
+        see :func:`numpy.savez_compressed`. Defaults to ``False``.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> st = read()
+    >>> st.write("example.npz", format="OBSPYNPZ")  # doctest: +SKIP
+    """
+    headers = np.empty(len(stream), dtype=_header_dtype(stream))
+    arrays = {}
+    extra = []
+    for i, tr in enumerate(stream):
+        stats = tr.stats
+        for key in _SEED_KEYS:
+            headers[key][i] = stats[key]
+        headers['starttime'][i] = stats.starttime.ns
+        headers['sampling_rate'][i] = stats.sampling_rate
+        headers['calib'][i] = stats.calib
+        headers['npts'][i] = len(tr.data)
+        headers['dtype'][i] = tr.data.dtype.str
+        extra.append({key: value for key, value in stats.items()
+                      if key not in Stats.defaults})
+        arrays['data_%d' % i] = np.require(tr.data,
+                                           requirements=['C_CONTIGUOUS'])
+    arrays[_VERSION_KEY] = np.array(FORMAT_VERSION)
+    arrays[_HEADERS_KEY] = headers
+    arrays[_EXTRA_KEY] = np.frombuffer(pickle.dumps(extra, protocol=2),
+                                       dtype=np.uint8)
+    savez = np.savez_compressed if compress else np.savez
+    if hasattr(filename, 'write'):
+        savez(filename, **arrays)
+    else:
+        # numpy would append ".npz" to file names without that extension
+        with open(filename, 'wb') as fh:
+            savez(fh, **arrays)
+
+
+def _header_dtype(stream):
+    """
+    Returns the dtype of the header table, with string fields just long
+    enough for the longest code in the stream.
+    """
+    fields = []
+    for key in _SEED_KEYS:
+        length = max([len(tr.stats[key]) for tr in stream] + [1])
+        fields.append((native_str(key), native_str('U%d' % length)))
+    fields += [(native_str('starttime'), np.int64),
+               (native_str('sampling_rate'), np.float64),
+               (native_str('calib'), np.float64),
+               (native_str('npts'), np.int64),
+               (native_str('dtype'), native_str('U8'))]
+    return np.dtype(fields)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
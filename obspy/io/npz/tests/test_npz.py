@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import unittest
+import zipfile
+
+import numpy as np
+
+from obspy import Stream, Trace, UTCDateTime, read
+from obspy.core.util import NamedTemporaryFile
+from obspy.io.npz.core import _is_obspynpz
+
+
+class NPZTestCase(unittest.TestCase):
+    """
+    Test cases for the OBSPYNPZ format.
+    """
+    def setUp(self):
+        self.stream = read()
+        self.stream[0].stats.mseed = {'dataquality': 'Q'}
+        self.stream[1].stats.processing = ['some processing']
+        tr = Trace(data=np.arange(1000, dtype=np.int32),
+                   header={'network': 'XX', 'station': 'LONGNAME',
+                           'location': '00', 'channel': 'HHZ',
+                           'sampling_rate': 20.0,
+                           'starttime': UTCDateTime(2018, 1, 1, 0, 0, 0,
+                                                    123456)})
+        self.stream.append(tr)
+
+    def _assert_streams_equal(self, st1, st2):
+        self.assertEqual(len(st1), len(st2))
+        for tr1, tr2 in zip(st1, st2):
+            self.assertEqual(tr1.stats, tr2.stats)
+            self.assertEqual(tr1.data.dtype, tr2.data.dtype)
+            np.testing.assert_array_equal(tr1.data, tr2.data)
+
+    def test_read_and_write(self):
+        """
+        Writing and reading again keeps samples and all headers, with and
+        without compression, for files and file-like objects.
+        """
+        for compress in (False, True):
+            with NamedTemporaryFile() as tf:
+                self.stream.write(tf.name, format='OBSPYNPZ',
+                                  compress=compress)
+                self.assertTrue(_is_obspynpz(tf.name))
+                st = read(tf.name)
+            for tr in st:
+                self.assertEqual(tr.stats.pop('_format'), 'OBSPYNPZ')
+            self._assert_streams_equal(st, self.stream)
+
+            buf = io.BytesIO()
+            self.stream.write(buf, format='OBSPYNPZ', compress=compress)
+            buf.seek(0)
+            st = read(buf, format='OBSPYNPZ')
+            for tr in st:
+                del tr.stats._format
+            self._assert_streams_equal(st, self.stream)
+
+    def test_is_obspynpz(self):
+        """
+        Other zip and npz files are no OBSPYNPZ files.
+        """
+        with NamedTemporaryFile() as tf:
+            np.savez(tf, data=np.arange(10))
+            tf.flush()
+            self.assertFalse(_is_obspynpz(tf.name))
+        with NamedTemporaryFile() as tf:
+            with zipfile.ZipFile(tf, 'w') as zf:
+                zf.writestr('headers.npy', b'')
+            tf.flush()
+            self.assertFalse(_is_obspynpz(tf.name))
+        self.assertFalse(_is_obspynpz(io.BytesIO(b'PK' + b'\x00' * 100)))
+
+    def test_partial_reads(self):
+        """
+        Reading with start and end time or a SEED id selects the same samples
+        as reading everything and trimming afterwards.
+        """
+        t = self.stream[0].stats.starttime
+        windows = [(t + 3.333, t + 10.1), (t - 5, t + 2.005), (t + 40, None),
+                   (None, t + 5.5), (t + 29.99, None), (t + 0.005, t + 0.005)]
+        for compress in (False, True):
+            with NamedTemporaryFile() as tf:
+                self.stream.write(tf.name, format='OBSPYNPZ',
+                                  compress=compress)
+                for starttime, endtime in windows:
+                    for nearest_sample in (True, False):
+                        expected = read(tf.name)
+                        if starttime:
+                            expected._ltrim(starttime,
+                                            nearest_sample=nearest_sample)
+                        if endtime:
+                            expected._rtrim(endtime,
+                                            nearest_sample=nearest_sample)
+                        for mmap in (False, True):
+                            st = read(tf.name, starttime=starttime,
+                                      endtime=endtime, mmap=mmap,
+                                      nearest_sample=nearest_sample)
+                            self._assert_streams_equal(st, expected)
+
+                st = read(tf.name, sourcename='bw.*.EH?')
+                self.assertEqual([tr.id for tr in st],
+                                 [tr.id for tr in self.stream[:3]])
+                st = read(tf.name, sourcename='*.??Z', headonly=True)
+                self.assertEqual([tr.id for tr in st],
+                                 ['BW.RJOB..EHZ', 'XX.LONGNAME.00.HHZ'])
+                self.assertEqual([tr.stats.npts for tr in st], [3000, 1000])
+                self.assertEqual([len(tr.data) for tr in st], [0, 0])
+
+    def test_mmap(self):
+        """
+        Memory mapped samples can be changed without changing the file.
+        """
+        with NamedTemporaryFile() as tf:
+            self.stream.write(tf.name, format='OBSPYNPZ')
+            st = read(tf.name, mmap=True)
+            self.assertTrue(isinstance(st[0].data, np.memmap))
+            st[0].data[:] = 0
+            st[0].detrend('linear')
+            del st
+            st = read(tf.name)
+        for tr in st:
+            del tr.stats._format
+        self._assert_streams_equal(st, self.stream)
+
+    def test_empty_traces(self):
+        """
+        Traces without samples can be written and read.
+        """
+        st = Stream([Trace(), Trace(data=np.arange(3.0))])
+        buf = io.BytesIO()
+        st.write(buf, format='OBSPYNPZ')
+        buf.seek(0)
+        got = read(buf, format='OBSPYNPZ')
+        for tr in got:
+            del tr.stats._format
+        self._assert_streams_equal(got, st)
+
+
+def suite():
+    return unittest.makeSuite(NPZTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -8,18 +8,19 @@ from future.builtins import *  # NOQA
 from future.utils import native_str
 
 import copy
-import io
 import os
 import warnings
 
 import numpy as np
 
 from obspy import Trace, Stream, UTCDateTime
+from obspy.core.util import AttribDict
 from obspy.core.util.obspy_types import ObsPyException
 
 from .packet import (Packet, EHPacket, _initial_unpack_packets, PACKET_TYPES,
                      PACKET_TYPES_IMPLEMENTED, PACKET_FINAL_DTYPE,
-                     Reftek130UnpackPacketError, _unpack_C0_C2_data)
+                     Reftek130UnpackPacketError, _unpack_C0_C2_data,
+                     _unpack_16_32_data)
 
 
 NOW = UTCDateTime()
@@ -116,6 +117,16 @@ def _read_reftek130(filename, network="", location="", component_codes=None,
         raise Reftek130Exception(msg.format(filename))
 
 
+def _split_by_field(data, field):
+    """
+    Split packet array into arrays of packets with the same value in given
+    field, sorted by that value and keeping the order of packets otherwise.
+    """
+    order = np.argsort(data[field], kind="mergesort")
+    splits = np.flatnonzero(np.diff(data[field][order])) + 1
+    return [data[inds] for inds in np.split(order, splits)]
+
+
 class Reftek130(object):
     _info_header = "Reftek130 ({:d} packets{})"
     _info_compact_header = [
@@ -146,11 +157,15 @@ class Reftek130(object):
 
     @staticmethod
     def from_file(filename):
-        with io.open(filename, "rb") as fh:
-            string = fh.read()
+        # memory map the file, only the unpacked packets are held in memory
+        if os.path.getsize(filename):
+            data = np.memmap(filename, dtype=np.uint8, mode="r")
+        else:
+            data = b""
         rt = Reftek130()
-        rt._data = _initial_unpack_packets(string)
+        rt._data = _initial_unpack_packets(data)
         rt._filename = filename
+        del data
         return rt
 
     def check_packet_sequence_and_sort(self, sort_permuted_package_sequence):
@@ -226,8 +241,7 @@ class Reftek130(object):
                    "non-implemented packets (file: {})").format(self._filename)
             raise Reftek130Exception(msg)
         st = Stream()
-        for event_number in np.unique(self._data['event_number']):
-            data = self._data[self._data['event_number'] == event_number]
+        for data in _split_by_field(self._data, 'event_number'):
             # we should have exactly one EH and one ET packet, truncated data
             # sometimes misses the header or trailer packet.
             eh_packets = data[data['packet_type'] == b"EH"]
@@ -276,18 +290,15 @@ class Reftek130(object):
                 "network": network,
                 "station": (eh.station_name +
                             eh.station_name_extension).strip(),
-                "location": location, "sampling_rate": eh.sampling_rate,
-                "reftek130": eh._to_dict()}
+                "location": location, "sampling_rate": eh.sampling_rate}
+            reftek130 = AttribDict(eh._to_dict())
             delta = 1.0 / eh.sampling_rate
             delta_nanoseconds = int(delta * 1e9)
-            inds_dt = data['packet_type'] == b"DT"
-            data_channels = np.unique(data[inds_dt]['channel_number'])
-            for channel_number in data_channels:
-                inds = data['channel_number'] == channel_number
-                # channel number of EH/ET packets also equals zero (one of the
-                # three unused bytes in the extended header of EH/ET packets)
-                inds &= data['packet_type'] == b"DT"
-                packets = data[inds]
+            # channel number of EH/ET packets also equals zero (one of the
+            # three unused bytes in the extended header of EH/ET packets)
+            data = data[data['packet_type'] == b"DT"]
+            for packets in _split_by_field(data, 'channel_number'):
+                channel_number = packets[0]['channel_number']
 
                 # split into contiguous blocks, i.e. find gaps. packet sequence
                 # was sorted already..
@@ -319,18 +330,16 @@ class Reftek130(object):
                             sample_data = _unpack_C0_C2_data(packets_,
                                                              encoding)
                         elif encoding in ('16', '32'):
-                            dtype = {'16': np.int16, '32': np.int32}[encoding]
-                            # just fix endianness and use correct dtype
-                            sample_data = np.require(
-                                packets_['payload'],
-                                requirements=['C_CONTIGUOUS'])
-                            # either int16 or int32
-                            sample_data = sample_data.flatten().view(dtype)
-                            # switch endianness, rt130 stores in big endian
-                            sample_data = sample_data.byteswap()
+                            sample_data = _unpack_16_32_data(packets_,
+                                                             encoding)
                         npts = len(sample_data)
 
-                    tr = Trace(data=sample_data, header=copy.deepcopy(header))
+                    tr = Trace(data=sample_data, header=header)
+                    # EH payload values are immutable and already went through
+                    # AttribDict's checks, so a plain shallow copy is enough
+                    # (Trace would make a deep copy of the header)
+                    tr.stats.reftek130 = AttribDict()
+                    tr.stats.reftek130.__dict__.update(reftek130.__dict__)
                     # channel number is not included in the EH/ET packet
                     # payload, so add it to stats as well..
                     tr.stats.reftek130['channel_number'] = channel_number
@@ -229,6 +229,9 @@ def _initial_unpack_packets(bytestring):
     First unpack data with dtype matching itemsize of storage in the reftek
     file, than allocate result array with dtypes for storage of python
     objects/arrays and fill it with the unpacked data.
+
+    ``bytestring`` can also be an ``uint8`` array (e.g. a memory mapped
+    file), it is used without making a copy of it.
     """
     if not len(bytestring):
         return np.array([], dtype=PACKET_FINAL_DTYPE)
@@ -239,8 +242,11 @@ def _initial_unpack_packets(bytestring):
         msg = ("Length of data not a multiple of 1024. Data might be "
                "truncated. Dropping {:d} byte(s) at the end.").format(tail)
         warnings.warn(msg)
-    data = from_buffer(
-        bytestring, dtype=PACKET_INITIAL_UNPACK_DTYPE)
+    if isinstance(bytestring, np.ndarray):
+        data = bytestring.view(PACKET_INITIAL_UNPACK_DTYPE)
+    else:
+        data = from_buffer(
+            bytestring, dtype=PACKET_INITIAL_UNPACK_DTYPE)
     result = np.empty_like(data, dtype=PACKET_FINAL_DTYPE)
 
     for name, dtype_initial, converter, dtype_final in PACKET:
@@ -254,11 +260,42 @@ def _initial_unpack_packets(bytestring):
     # time unpacking is special and needs some additional work.
     # we need to add the POSIX timestamp of the start of respective year to the
     # already unpacked seconds into the respective year..
-    result['time'][:] += [_get_nanoseconds_for_start_of_year(y)
-                          for y in result['year']]
+    for year in np.unique(result['year']):
+        result['time'][result['year'] == year] += \
+            _get_nanoseconds_for_start_of_year(int(year))
     return result
 
 
+def _unpack_16_32_data(packets, encoding):
+    """
+    Unpacks sample data from a packet array that uses uncompressed '16' or
+    '32' bit integer data encoding.
+
+    The samples of all packets are unpacked at once into a single array,
+    only the first ``number_of_samples`` samples of each packet's payload are
+    used.
+
+    :type packets: :class:`numpy.ndarray` (dtype ``PACKET_FINAL_DTYPE``)
+    :param packets: Array of data packets (``packet_type`` ``'DT'``) from which
+        to unpack the sample data (with data encoding '16' or '32').
+    :type encoding: str
+    :param encoding: Reftek data encoding as specified in event header (EH)
+        packet, either ``'16'`` or ``'32'``.
+    """
+    if encoding == '16':
+        dtype = np.int16
+    elif encoding == '32':
+        dtype = np.int32
+    else:
+        msg = "Unregonized encoding: '{}'".format(encoding)
+        raise ValueError(msg)
+    # rt130 stores in big endian
+    samples = np.ascontiguousarray(packets['payload']).view(
+        np.dtype(dtype).newbyteorder('>'))
+    npts = packets['number_of_samples'].astype(np.int64)
+    return samples[np.arange(samples.shape[1]) < npts[:, None]].astype(dtype)
+
+
 def _unpack_C0_C2_data(packets, encoding):  # noqa
     """
     Unpacks sample data from a packet array that uses 'C0' or 'C2' data
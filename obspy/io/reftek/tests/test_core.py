@@ -19,7 +19,7 @@ from obspy.io.reftek.core import (
     _read_reftek130, _is_reftek130, Reftek130, Reftek130Exception)
 from obspy.io.reftek.packet import (
     _unpack_C0_C2_data_fast, _unpack_C0_C2_data_safe, _unpack_C0_C2_data,
-    EHPacket, _initial_unpack_packets)
+    _unpack_16_32_data, EHPacket, _initial_unpack_packets)
 
 
 class ReftekTestCase(unittest.TestCase):
@@ -598,6 +598,26 @@ class ReftekTestCase(unittest.TestCase):
         for tr, (_, expected) in zip(st, sorted(npz.items())):
             np.testing.assert_array_equal(expected, tr.data)
 
+    def test_data_unpacking_16_32(self):
+        """
+        Test vectorized unpacking of uncompressed data, including packets
+        with a differing number of samples.
+        """
+        rt = Reftek130.from_file(self.reftek_file_32)
+        packets = rt._data[rt._data['packet_type'] == b'DT'][:10].copy()
+        packets['number_of_samples'][1] = 7
+        packets['number_of_samples'][-1] = 0
+        for encoding, dtype in (('32', np.int32), ('16', np.int16)):
+            big_endian = np.dtype(dtype).newbyteorder('>')
+            expected = np.concatenate([
+                np.frombuffer(p['payload'].tobytes(), dtype=big_endian)[
+                    :p['number_of_samples']]
+                for p in packets]).astype(dtype)
+            got = _unpack_16_32_data(packets, encoding=encoding)
+            self.assertEqual(got.dtype, np.dtype(dtype))
+            np.testing.assert_array_equal(got, expected)
+        self.assertRaises(ValueError, _unpack_16_32_data, packets, 'C0')
+
 
 def suite():
     return unittest.makeSuite(ReftekTestCase, "test")
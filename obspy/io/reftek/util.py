@@ -26,13 +26,36 @@ def bcd_hex(_i):
     return from_buffer(_bcd, dtype="|S%d" % (m * 2))
 
 
+_8BIT_HEX = np.array(["{:X}".format(x) for x in range(256)], dtype="|S2")
+
+
 def bcd_8bit_hex(_i):
-    return np.array(["{:X}".format(int(x)) for x in _i], dtype="|S2")
+    return _8BIT_HEX[_i]
 
 
 def bcd_julian_day_string_to_nanoseconds_of_year(_i):
-    timestrings = bcd_hex(_i)
-    return _timestrings_to_nanoseconds(timestrings)
+    """
+    Helper routine to convert BCD encoded time strings of form
+    "DDDHHMMSSsss" (six bytes per row) to array of integer nanoseconds since
+    start of year.
+
+    :param _i: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+    digits = np.empty((len(_i), 12), dtype=np.int64)
+    digits[:, 0::2] = _i >> 4
+    digits[:, 1::2] = _i & 0xF
+    if np.any(digits > 9):
+        msg = "Invalid BCD digits in time string(s): {}".format(
+            bcd_hex(_i[np.any(digits > 9, axis=1)][:1])[0])
+        raise ValueError(msg)
+    day = digits[:, 0] * 100 + digits[:, 1] * 10 + digits[:, 2]
+    hour = digits[:, 3] * 10 + digits[:, 4]
+    minute = digits[:, 5] * 10 + digits[:, 6]
+    second = digits[:, 7] * 10 + digits[:, 8]
+    millisecond = digits[:, 9] * 100 + digits[:, 10] * 10 + digits[:, 11]
+    seconds = (((day - 1) * 24 + hour) * 60 + minute) * 60 + second
+    return seconds * 1000000000 + millisecond * 1000000
 
 
 _timegm_cache = {}
@@ -56,32 +79,6 @@ def _get_nanoseconds_for_start_of_year(year):
     return ns
 
 
-def _timestrings_to_nanoseconds(timestrings):
-    """
-    Helper routine to convert timestrings of form "DDDHHMMSSsss" to array of
-    integer nanosecond POSIX timestamp.
-
-    :param timestring: numpy.ndarray
-    :rtype: numpy.ndarray
-    """
-    # split up the time string into tuple of
-    # (day of year, hours, minutes, seconds, milliseconds), still as string
-    nanoseconds = [(string[:3], string[3:5], string[5:7],
-                    string[7:9], string[9:]) for string in timestrings]
-    nanoseconds = np.array(nanoseconds, dtype="S3").astype(np.int64)
-    # now scale the columns of the array, so that everything is in nanoseconds
-    to_nano = 1000000000
-    nanoseconds[:, 0] -= 1
-    nanoseconds[:, 0] *= 86400 * to_nano
-    nanoseconds[:, 1] *= 3600 * to_nano
-    nanoseconds[:, 2] *= 60 * to_nano
-    nanoseconds[:, 3] *= to_nano
-    nanoseconds[:, 4] *= 1000000
-    # sum up days, hours, minutes etc. for every row of the array
-    nanoseconds = nanoseconds.sum(axis=1)
-    return nanoseconds
-
-
 def _decode_ascii(chars):
     return chars.decode("ASCII")
 
@@ -21,6 +21,7 @@ from future.builtins import *  # NOQA
 import os
 import sys
 import warnings
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
@@ -196,6 +197,128 @@ def read_sac(source, headonly=False, byteorder=None, checksize=False):
     return hf, hi, hs, data
 
 
+def header_dtype(byteorder='='):
+    """
+    Structured dtype of the complete binary SAC header.
+
+    One field per header in the order of the float, integer and string header
+    arrays, see :data:`~obspy.io.sac.header.FLOATHDRS`,
+    :data:`~obspy.io.sac.header.INTHDRS` and
+    :data:`~obspy.io.sac.header.STRHDRS`. As in the string header array,
+    ``kevnm`` is split into ``kevnm`` and ``kevnm2``.
+
+    :param byteorder: Byte order of the float and integer fields.
+    :type byteorder: str {'<', '=', '>'}
+    :rtype: :class:`numpy.dtype`
+    """
+    fields = \
+        [(native_str(hdr), native_str(byteorder + 'f4'))
+         for hdr in HD.FLOATHDRS] + \
+        [(native_str(hdr), native_str(byteorder + 'i4'))
+         for hdr in HD.INTHDRS] + \
+        [(native_str(hdr), native_str('S8')) for hdr in HD.STRHDRS]
+    return np.dtype(fields)
+
+
+def _read_header_bytes(source, ignore_errors=False):
+    try:
+        with open(source, 'rb') as fh:
+            return fh.read(632)
+    except (IOError, OSError):
+        if not ignore_errors:
+            raise
+        return b''
+
+
+def read_sac_headers(sources, threads=None, ignore_errors=False):
+    """
+    Read the binary headers of many SAC files into one structured array.
+
+    Only the first 632 bytes of each file are read, the data is never touched.
+    Files of both byte orders can be mixed, all values are returned in native
+    byte order. Header values are returned as stored in the files, i.e.
+    unset headers have their null values (``-12345``) and strings are
+    padded, undecoded bytes.
+
+    :param sources: Paths of binary SAC files.
+    :type sources: iterable of str
+    :param threads: If given, read the files with a pool of that many
+        threads. This helps mostly on network file systems.
+    :type threads: int
+    :param ignore_errors: If True, files that cannot be opened or do not have
+        a valid SAC header are skipped with a warning instead of raising a
+        :class:`~obspy.io.sac.util.SacIOError`.
+    :type ignore_errors: bool
+
+    :return: One record per file with the file's path in the ``'path'``
+        field and one field per header value, see :func:`header_dtype`.
+    :rtype: :class:`numpy.ndarray`
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import get_example_file
+    >>> from obspy.io.sac.arrayio import read_sac_headers
+    >>> filenames = [get_example_file("test.sac"),
+    ...              get_example_file("test.sac.swap")]
+    >>> headers = read_sac_headers(filenames)
+    >>> print(headers['npts'])
+    [100 100]
+    >>> print(headers['b'])
+    [ 10.  10.]
+    >>> headers['path'][headers['b'] == 10.0].tolist() == filenames
+    True
+    """
+    sources = list(sources)
+    if threads and threads > 1 and len(sources) > 1:
+        pool = ThreadPool(min(threads, len(sources)))
+        try:
+            raw = pool.map(
+                lambda source: _read_header_bytes(source, ignore_errors),
+                sources)
+        finally:
+            pool.close()
+    else:
+        raw = [_read_header_bytes(source, ignore_errors) for source in sources]
+
+    complete = [len(_i) == 632 for _i in raw]
+    raw = from_buffer(b''.join(_i for _i, ok in zip(raw, complete) if ok),
+                      dtype=np.uint8)
+    little = raw.view(header_dtype('<'))
+    big = raw.view(header_dtype('>'))
+    # same test as is_valid_byteorder(), for all files at once
+    nvhdr = little['nvhdr']
+    is_little = (0 < nvhdr) & (nvhdr < 20)
+    nvhdr = big['nvhdr']
+    is_big = (0 < nvhdr) & (nvhdr < 20) & ~is_little
+    valid = np.zeros(len(sources), dtype=np.bool_)
+    valid[np.array(complete, dtype=np.bool_)] = is_little | is_big
+
+    if not valid.all():
+        invalid = [source for source, ok in zip(sources, valid) if not ok]
+        if not ignore_errors:
+            msg = "Cannot read a valid SAC header from {}".format(invalid[0])
+            raise SacIOError(msg)
+        msg = "Skipping {} file(s) without a valid SAC header: {}"
+        warnings.warn(msg.format(len(invalid), ", ".join(invalid[:5]) +
+                                 (", ..." if len(invalid) > 5 else "")))
+        little = little[is_little | is_big]
+        big = big[is_little | is_big]
+        is_big = is_big[is_little | is_big]
+        sources = [source for source, ok in zip(sources, valid) if ok]
+
+    length = max([len(source) for source in sources] or [1])
+    dtype = header_dtype('=')
+    dtype = np.dtype([(native_str('path'), native_str('U%d' % length))] +
+                     [(name, dtype[name]) for name in dtype.names])
+    headers = np.empty(len(sources), dtype=dtype)
+    headers['path'] = sources
+    for name in dtype.names[1:]:
+        values = headers[name]
+        values[:] = little[name]
+        values[is_big] = big[name][is_big]
+    return headers
+
+
 def read_sac_ascii(source, headonly=False):
     """
     Read a SAC ASCII/Alphanumeric file.
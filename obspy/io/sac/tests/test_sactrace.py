@@ -15,9 +15,10 @@ from obspy import UTCDateTime, read
 from obspy.core.util import NamedTemporaryFile
 from obspy.geodetics import gps2dist_azimuth, kilometer2degrees
 
+from .. import arrayio
 from .. import header as _hd
 from ..sactrace import SACTrace
-from ..util import SacHeaderError, SacHeaderTimeError
+from ..util import SacHeaderError, SacHeaderTimeError, SacIOError
 
 
 class SACTraceTestCase(unittest.TestCase):
@@ -83,6 +84,45 @@ class SACTraceTestCase(unittest.TestCase):
         sac = SACTrace.read(self.filebe)
         self.assertEqual(sac.byteorder, 'big')
 
+    def test_read_sac_headers(self):
+        """
+        Headers of many files in both byte orders read into one table should
+        match the headers of the single files.
+        """
+        files = [self.file, self.filebe, self.fileseis]
+        for threads in (None, 3):
+            headers = arrayio.read_sac_headers(files, threads=threads)
+            self.assertEqual(headers.dtype.names[0], 'path')
+            self.assertEqual(headers['path'].tolist(), files)
+            for filename, header in zip(files, headers):
+                sac = SACTrace.read(filename, headonly=True)
+                for hdr in _hd.FLOATHDRS:
+                    np.testing.assert_equal(
+                        header[hdr], sac._hf[_hd.FLOATHDRS.index(hdr)])
+                for hdr in _hd.INTHDRS:
+                    self.assertEqual(header[hdr],
+                                     sac._hi[_hd.INTHDRS.index(hdr)])
+                for hdr in _hd.STRHDRS:
+                    self.assertEqual(header[hdr],
+                                     sac._hs[_hd.STRHDRS.index(hdr)])
+        self.assertEqual(len(arrayio.read_sac_headers([])), 0)
+        # missing files and files that are not binary SAC files
+        other_file = os.path.join(self.path, 'data', 'LMOW.BHE.SAC')
+        bad_files = [os.path.join(self.path, 'data', 'does_not_exist.sac'),
+                     self.filexy]
+        with self.assertRaises(IOError):
+            arrayio.read_sac_headers(files + bad_files[:1])
+        with self.assertRaises(SacIOError):
+            arrayio.read_sac_headers(files + bad_files[1:])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            headers = arrayio.read_sac_headers(
+                bad_files[:1] + [other_file] + bad_files[1:],
+                ignore_errors=True)
+        self.assertEqual(len(w), 1)
+        self.assertEqual(headers['path'].tolist(), [other_file])
+        self.assertEqual(headers['kstnm'][0], b'LMOW    ')
+
     def test_write_sac(self):
         """
         A trace you've written and read in again should look the same as the
@@ -29,7 +29,7 @@ file formats usually used in observatories (GSE2, MiniSEED, ...). The
 of ObsPy are therefore not fully suited to handle them. Nonetheless they work
 well enough if some potential problems are kept in mind.
 
-SEG Y files can be read in four different ways that have different
+SEG Y files can be read in five different ways that have different
 advantages/disadvantages. Most of the following also applies to SU files with
 some changes (keep in mind that SU files have no file wide headers).
 
@@ -40,6 +40,9 @@ some changes (keep in mind that SU files have no file wide headers).
 4. Some SEG-Y files are too large to be read into memory. The
    :func:`obspy.io.segy.segy.iread_segy` function reads a large file trace
    by trace circumventing this problem.
+5. Random access to single traces of large files is possible with the memory
+   mapped :class:`obspy.io.segy.segy.MemmapSEGYFile` and
+   :class:`obspy.io.segy.segy.MemmapSUFile` classes.
 
 Reading using methods 1 and 2
 ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
@@ -143,6 +146,23 @@ methods do), read the file trace by trace using the
 -5
 
 
+Random access using method 5
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+:class:`~obspy.io.segy.segy.MemmapSEGYFile` memory maps the file and decodes
+all trace headers at once into a NumPy structured array. Traces can then be
+selected by index or by trace header values and only the data of the requested
+traces is read:
+
+>>> from obspy.io.segy.segy import MemmapSEGYFile
+>>> segy = MemmapSEGYFile(filename)
+>>> segy.headers['trace_sequence_number_within_line']
+array([1], dtype=int32)
+>>> for index in segy.find(trace_sequence_number_within_line=1):
+...     print(segy[index])  # doctest: +ELLIPSIS
+Seq. No. in line:    1 | 2009-06-22T14:47:37.000000Z - ... 2001 samples
+
+
 Writing
 -------
 
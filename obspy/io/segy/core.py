@@ -25,7 +25,7 @@ from .header import (BINARY_FILE_HEADER_FORMAT, DATA_SAMPLE_FORMAT_CODE_DTYPE,
 from .segy import _read_segy as _read_segyrev1
 from .segy import _read_su as _read_su_file
 from .segy import (SEGYBinaryFileHeader, SEGYError, SEGYFile, SEGYTrace,
-                   SEGYTraceHeader, SUFile,
+                   SEGYTraceHeader, SUFile, _pack_trace_headers,
                    autodetect_endian_and_sanity_check_su)
 from .util import unpack_header_value
 
@@ -348,11 +348,8 @@ def _write_segy(stream, filename, data_encoding=None, byteorder=None,
     # Set the data encoding.
     binary_header.data_sample_format_code = data_encoding
     segy_file.binary_file_header = binary_header
-    # Add all traces.
+    # Create empty trace header if none is there.
     for trace in stream:
-        new_trace = SEGYTrace()
-        new_trace.data = trace.data
-        # Create empty trace header if none is there.
         if not hasattr(trace.stats, 'segy'):
             warnings.warn("CREATING TRACE HEADER")
             trace.stats.segy = {}
@@ -360,31 +357,19 @@ def _write_segy(stream, filename, data_encoding=None, byteorder=None,
         elif not hasattr(trace.stats.segy, 'trace_header'):
             warnings.warn("CREATING TRACE HEADER")
             trace.stats.segy.trace_header = SEGYTraceHeader()
-        this_trace_header = trace.stats.segy.trace_header
-        new_trace_header = new_trace.header
-        # Again loop over all field of the trace header and if they exists, set
-        # them. Ignore all additional attributes.
-        for _, item, _, _ in TRACE_HEADER_FORMAT:
-            if hasattr(this_trace_header, item):
-                setattr(new_trace_header, item,
-                        getattr(this_trace_header, item))
-        starttime = trace.stats.starttime
-        # Set the date of the Trace if it is not UTCDateTime(0).
-        if starttime == UTCDateTime(0):
-            new_trace.header.year_data_recorded = 0
-            new_trace.header.day_of_year = 0
-            new_trace.header.hour_of_day = 0
-            new_trace.header.minute_of_hour = 0
-            new_trace.header.second_of_minute = 0
-        else:
-            new_trace.header.year_data_recorded = starttime.year
-            new_trace.header.day_of_year = starttime.julday
-            new_trace.header.hour_of_day = starttime.hour
-            new_trace.header.minute_of_hour = starttime.minute
-            new_trace.header.second_of_minute = starttime.second
-        # Set the sampling rate.
-        new_trace.header.sample_interval_in_ms_for_this_trace = \
-            int(trace.stats.delta * 1E6)
+    # Pack all fields of the trace headers at once. Ignore all additional
+    # attributes.
+    headers = _pack_trace_headers(
+        [trace.stats.segy.trace_header for trace in stream], byteorder)
+    _set_trace_header_times(headers, stream)
+    # Set the sampling rate.
+    headers['sample_interval_in_ms_for_this_trace'] = np.array(
+        [trace.stats.delta for trace in stream]) * 1E6
+    # Add all traces.
+    for trace, header in zip(stream, headers):
+        new_trace = SEGYTrace()
+        new_trace.data = trace.data
+        new_trace.header = SEGYTraceHeader(header.tobytes(), endian=byteorder)
         # Set the data encoding and the endianness.
         new_trace.data_encoding = data_encoding
         new_trace.endian = byteorder
@@ -394,6 +379,31 @@ def _write_segy(stream, filename, data_encoding=None, byteorder=None,
     segy_file.write(filename, data_encoding=data_encoding, endian=byteorder)
 
 
+def _set_trace_header_times(headers, stream):
+    """
+    Sets the date and time fields of packed trace headers to the start times
+    of the traces.
+
+    Start times of UTCDateTime(0) are interpreted as not set and all fields
+    are set to zero.
+    """
+    ns = np.array([trace.stats.starttime._ns for trace in stream],
+                  dtype=np.int64)
+    times = ns.astype('datetime64[ns]')
+    years = times.astype('datetime64[Y]')
+    days = times.astype('datetime64[D]')
+    seconds = (times - days).astype('timedelta64[s]').astype(np.int64)
+    not_set = ns == 0
+    for key, values in (
+            ('year_data_recorded', years.astype(np.int64) + 1970),
+            ('day_of_year', (days - years).astype(np.int64) + 1),
+            ('hour_of_day', seconds // 3600),
+            ('minute_of_hour', seconds // 60 % 60),
+            ('second_of_minute', seconds % 60)):
+        values[not_set] = 0
+        headers[key] = values
+
+
 def _is_su(filename):
     """
     Checks whether or not the given file is a Seismic Unix (SU) file.
@@ -574,41 +584,23 @@ def _write_su(stream, filename, byteorder=None, **kwargs):  # @UnusedVariable
 
     # Loop over all Traces and create a SEGY File object.
     su_file = SUFile()
+    # Use headers saved in stats if they exist and pack all their fields at
+    # once. Ignore all additional attributes.
+    headers = _pack_trace_headers(
+        [trace.stats.su.trace_header if hasattr(trace.stats, 'su') and
+         hasattr(trace.stats.su, 'trace_header') else AttribDict()
+         for trace in stream], byteorder)
+    # Set some special attributes, e.g. the sample count and other stuff.
+    headers['number_of_samples_in_this_trace'] = \
+        [trace.stats.npts for trace in stream]
+    headers['sample_interval_in_ms_for_this_trace'] = np.round(np.array(
+        [trace.stats.delta for trace in stream]) * 1E6)
+    _set_trace_header_times(headers, stream)
     # Add all traces.
-    for trace in stream:
+    for trace, header in zip(stream, headers):
         new_trace = SEGYTrace()
         new_trace.data = trace.data
-        # Use header saved in stats if one exists.
-        if hasattr(trace.stats, 'su') and \
-           hasattr(trace.stats.su, 'trace_header'):
-            this_trace_header = trace.stats.su.trace_header
-        else:
-            this_trace_header = AttribDict()
-        new_trace_header = new_trace.header
-        # Again loop over all field of the trace header and if they exists, set
-        # them. Ignore all additional attributes.
-        for _, item, _, _ in TRACE_HEADER_FORMAT:
-            if hasattr(this_trace_header, item):
-                setattr(new_trace_header, item,
-                        getattr(this_trace_header, item))
-        starttime = trace.stats.starttime
-        # Set some special attributes, e.g. the sample count and other stuff.
-        new_trace_header.number_of_samples_in_this_trace = trace.stats.npts
-        new_trace_header.sample_interval_in_ms_for_this_trace = \
-            int(round((trace.stats.delta * 1E6)))
-        # Set the date of the Trace if it is not UTCDateTime(0).
-        if starttime == UTCDateTime(0):
-            new_trace.header.year_data_recorded = 0
-            new_trace.header.day_of_year = 0
-            new_trace.header.hour_of_day = 0
-            new_trace.header.minute_of_hour = 0
-            new_trace.header.second_of_minute = 0
-        else:
-            new_trace.header.year_data_recorded = starttime.year
-            new_trace.header.day_of_year = starttime.julday
-            new_trace.header.hour_of_day = starttime.hour
-            new_trace.header.minute_of_hour = starttime.minute
-            new_trace.header.second_of_minute = starttime.second
+        new_trace.header = SEGYTraceHeader(header.tobytes(), endian=byteorder)
         # Set the data encoding and the endianness.
         new_trace.endian = byteorder
         # Add the trace to the SEGYFile object.
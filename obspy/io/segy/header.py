@@ -167,6 +167,33 @@ TRACE_HEADER_FORMAT = [
 TRACE_HEADER_KEYS = [_i[1] for _i in TRACE_HEADER_FORMAT]
 
 
+def trace_header_dtype(endian='>'):
+    """
+    Returns a NumPy structured dtype describing the 240 byte trace header.
+
+    The fields are named and laid out according to
+    :const:`TRACE_HEADER_FORMAT` so that a buffer of packed trace headers can
+    be viewed as or decoded into an array with one record per trace.
+
+    :type endian: str
+    :param endian: Byte order of the packed header values, either ``'>'`` or
+        ``'<'``.
+    """
+    formats = []
+    for length, _, special_format, _ in TRACE_HEADER_FORMAT:
+        if special_format:
+            formats.append(endian + special_format)
+        elif length == 8:
+            # The unassigned field is kept as raw bytes.
+            formats.append('V8')
+        else:
+            formats.append('%si%i' % (endian, length))
+    return np.dtype({'names': [str(_i[1]) for _i in TRACE_HEADER_FORMAT],
+                     'formats': [str(_i) for _i in formats],
+                     'offsets': [_i[3] for _i in TRACE_HEADER_FORMAT],
+                     'itemsize': 240})
+
+
 # Functions that unpack the chosen data format. The keys correspond to the
 # number given for each format by the SEG Y format reference.
 DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS = {
@@ -20,7 +20,6 @@ import sys
 import numpy as np
 
 
-LOG2 = 0.3010299956639812
 # Get the system byte order.
 BYTEORDER = sys.byteorder
 if BYTEORDER == 'little':
@@ -33,92 +32,56 @@ class WrongDtypeException(Exception):
     pass
 
 
+def ieee2ibm(data):
+    """
+    Converts IEEE floating point numbers to 32 bit IBM floating points.
+
+    Works on arrays of any shape, e.g. on whole gathers of traces at once.
+    The values are rounded to single precision first and the fraction is
+    truncated.
+
+    :type data: :class:`numpy.ndarray`
+    :param data: Floating point numbers.
+    :rtype: :class:`numpy.ndarray` of ``uint32``
+    :return: The IBM floating point numbers as native 32 bit words of the
+        same shape.
+    """
+    data = np.require(data, np.float32)
+    bits = data.view(np.uint32)
+    # Decompose into data = fraction * 2 ** (exponent - 24) with a 24 bit
+    # fraction including the implicit leading bit.
+    exponent = ((bits >> 23) & 0xff).astype(np.int32) - 126
+    fraction = (bits & 0x007fffff) | 0x00800000
+    # Subnormal numbers have no implicit leading bit.
+    subnormal = (exponent == -126) & ((bits & 0x007fffff) != 0)
+    if subnormal.any():
+        mantissa, exponent[subnormal] = np.frexp(
+            data[subnormal].astype(np.float64))
+        fraction[subnormal] = np.ldexp(np.abs(mantissa), 24)
+    # IBM floats use base 16 exponents with a 24 bit fraction in [1/16, 1),
+    # the fraction is truncated.
+    ibm_exponent = (exponent + 3) >> 2
+    fraction >>= (4 * ibm_exponent - exponent).astype(np.uint32)
+    words = (ibm_exponent + 64).astype(np.uint32) << 24
+    words |= fraction
+    words |= bits & 0x80000000
+    words[(bits & 0x7fffffff) == 0] = 0
+    return words
+
+
 def pack_4byte_ibm(file, data, endian='>'):
     """
-    Packs 4 byte IBM floating points. This will only work if the host system
-    internally uses little endian byte orders.
+    Packs 4 byte IBM floating points.
     """
     # Check the dtype and raise exception otherwise!
     if data.dtype != np.float64 and data.dtype != np.float32:
         raise WrongDtypeException
-    # Calculate the values. The theory is explained in
-    # https://www.codeproject.com/KB/applications/libnumber.aspx
-
-    # Calculate the signs.
-    signs = np.empty(len(data), dtype=np.uint8)
-    temp_signs = np.sign(data)
-    # Negative numbers are encoded as sign bit 1, positive ones as bit 0.
-    signs[temp_signs == 1] = 0
-    signs[temp_signs == -1] = 128
-
-    # Make absolute values.
-    data = np.abs(data)
-
-    # Store the zeros and add an offset for numerical stability,
-    # they will be set to zero later on again
-    zeros = np.where(data == 0.0)
-    data[zeros] += 1e-32
-
-    # Calculate the exponent for the IBM data format.
-    exponent = ((np.log10(data) / LOG2) * 0.25 + 65).astype(np.uint32)
-
-    # Now calculate the fraction using single precision.
-    fraction = np.require(
-        data, np.float32) / (16.0 ** (np.require(exponent, np.float32) - 64))
-
-    # Normalization.
-    while True:
-        # Find numbers smaller than 1/16 but not zero.
-        non_normalized = np.where(np.where(fraction, fraction, 1) < 0.0625)[0]
-        if len(non_normalized) == 0:
-            break
-        fraction[non_normalized] *= 16
-        exponent[non_normalized] -= 1
-
-    # If the fraction is one, change it to 1/16 and increase the exponent by
-    # one.
-    ones = np.where(fraction == 1.0)
-    fraction[ones] = 0.0625
-    exponent[ones] += 1
-
-    # Times 2^24 to be able to get a long.
-    fraction *= 16777216.0
-    # Convert to unsigned long.
-    fraction = np.require(fraction, np.uint64)
-
-    # Use 8 bit integers to be able to store every byte separately.
-    new_data = np.zeros(4 * len(data), np.uint8)
-
-    # The first bit is the sign and the following 7 are the exponent.
-    byte_0 = np.require(signs + exponent, np.uint8)
-    # All following 24 bit are the fraction.
-    byte_1 = np.require(np.right_shift(np.bitwise_and(fraction, 0x00ff0000),
-                                       16), np.uint8)
-    byte_2 = np.require(np.right_shift(np.bitwise_and(fraction, 0x0000ff00),
-                                       8), np.uint8)
-    byte_3 = np.require(np.bitwise_and(fraction, 0x000000ff), np.uint8)
-
-    # Depending on the endianness store the data different.
-    # big endian.
-    if endian == '>':
-        new_data[0::4] = byte_0
-        new_data[1::4] = byte_1
-        new_data[2::4] = byte_2
-        new_data[3::4] = byte_3
-    # little endian>
-    elif endian == '<':
-        new_data[0::4] = byte_3
-        new_data[1::4] = byte_2
-        new_data[2::4] = byte_1
-        new_data[3::4] = byte_0
-    # Should not happen.
-    else:
-        raise Exception
-    # Write the zeros again.
-    new_data.dtype = np.uint32
-    new_data[zeros] = 0
+    data = ieee2ibm(data)
+    # Swap the byte order if necessary.
+    if BYTEORDER != endian:
+        data = data.byteswap()
     # Write to file.
-    file.write(new_data.tostring())
+    file.write(data.tostring())
 
 
 def pack_4byte_integer(file, data, endian='>'):
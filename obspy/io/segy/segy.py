@@ -23,16 +23,26 @@ import numpy as np
 
 from obspy import Trace, UTCDateTime
 from obspy.core import AttribDict
+from obspy.core.compatibility import from_buffer
 
 from .header import (BINARY_FILE_HEADER_FORMAT,
+                     DATA_SAMPLE_FORMAT_CODE_DTYPE,
                      DATA_SAMPLE_FORMAT_PACK_FUNCTIONS,
                      DATA_SAMPLE_FORMAT_SAMPLE_SIZE,
                      DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS, ENDIAN,
-                     TRACE_HEADER_FORMAT, TRACE_HEADER_KEYS)
+                     TRACE_HEADER_FORMAT, TRACE_HEADER_KEYS,
+                     trace_header_dtype)
 from .unpack import OnTheFlyDataUnpacker
 from .util import unpack_header_value
 
 
+# All trace header values of an empty trace header.
+_EMPTY_TRACE_HEADER = dict.fromkeys(TRACE_HEADER_KEYS, 0)
+_TRACE_HEADER_KEY_SET = frozenset(TRACE_HEADER_KEYS)
+# Approximate number of bytes written at once when writing traces.
+_WRITE_CHUNK_SIZE = 2 ** 25
+
+
 class SEGYError(Exception):
     """
     Base SEGY exception class.
@@ -268,7 +278,9 @@ class SEGYFile(object):
         # Write certain fields in the binary header if they are not set. Most
         # fields will be written using the data from the first trace. It is
         # usually better to set the header manually!
-        if self.binary_file_header.number_of_data_traces_per_ensemble <= 0:
+        # The field is only two bytes long, leave it unset for larger files.
+        if self.binary_file_header.number_of_data_traces_per_ensemble <= 0 \
+                and len(self.traces) <= 32767:
             self.binary_file_header.number_of_data_traces_per_ensemble = \
                 len(self.traces)
         if self.binary_file_header.sample_interval_in_microseconds <= 0:
@@ -294,8 +306,8 @@ class SEGYFile(object):
         # Write the binary header.
         self.binary_file_header.write(file, endian=endian)
         # Write all traces.
-        for trace in self.traces:
-            trace.write(file, data_encoding=data_encoding, endian=endian)
+        _write_traces(file, self.traces, data_encoding=data_encoding,
+                      endian=endian)
 
     def _write_textual_header(self, file):
         """
@@ -913,8 +925,116 @@ class SEGYTraceHeader(object):
         Init the trace header with zeros.
         """
         # First set all fields to zero.
-        for field in TRACE_HEADER_FORMAT:
-            setattr(self, field[1], 0)
+        self.__dict__.update(_EMPTY_TRACE_HEADER)
+
+
+def _pack_trace_headers(headers, endian='>'):
+    """
+    Packs trace headers into a structured array with one record per trace.
+
+    The headers can be :class:`SEGYTraceHeader` objects, lazy trace header
+    dictionaries or any other object with (some of) the trace header keys as
+    attributes. Headers that are still packed are copied all at once, only
+    values that have been unpacked or set are packed individually.
+
+    :type headers: list
+    :param headers: The trace headers.
+    :type endian: str
+    :param endian: Byte order of the packed headers.
+    :rtype: :class:`numpy.ndarray`
+    :return: Array with :func:`~obspy.io.segy.header.trace_header_dtype`.
+    """
+    packed = np.zeros(len(headers), dtype=trace_header_dtype(endian))
+    still_packed = {}
+    columns = {}
+    for _i, header in enumerate(headers):
+        try:
+            attributes = vars(header)
+        except TypeError:
+            attributes = header
+        raw = attributes.get('unpacked_header')
+        if raw is not None:
+            indices, values = still_packed.setdefault(attributes['endian'],
+                                                      ([], []))
+            indices.append(_i)
+            values.append(raw)
+        for key, value in attributes.items():
+            if key not in _TRACE_HEADER_KEY_SET:
+                continue
+            # All values are zero initially.
+            if raw is None and (value == 0 or value is None):
+                continue
+            indices, values = columns.setdefault(key, ([], []))
+            indices.append(_i)
+            values.append(value)
+    for raw_endian, (indices, values) in still_packed.items():
+        packed[indices] = from_buffer(b''.join(values),
+                                      dtype=trace_header_dtype(raw_endian))
+    for key, (indices, values) in columns.items():
+        if key == 'unassigned':
+            # An empty field will have a zero.
+            for _i, value in zip(indices, values):
+                packed[key][_i] = np.void(value or b'\x00' * 8)
+            continue
+        values = np.array(values)
+        info = np.iinfo(packed.dtype[key])
+        if values.dtype.kind not in 'iub' or (
+                len(values) and (values.min() < info.min or
+                                 values.max() > info.max)):
+            msg = ("Trace header value of '%s' can not be packed as %i byte "
+                   "integer: %s")
+            raise SEGYWritingError(msg % (key, info.bits // 8, values))
+        packed[key][indices] = values
+    return packed
+
+
+def _write_traces(file, traces, data_encoding=None, endian=None):
+    """
+    Writes SEGYTrace objects to a file like object.
+
+    All trace headers are packed at once and traces of the same length and
+    dtype are packed and written as whole gathers. If data_encoding or endian
+    is set, these values will be enforced.
+    """
+    if not traces:
+        return
+    encodings = set(data_encoding or tr.data_encoding for tr in traces)
+    endians = set(endian or tr.endian for tr in traces)
+    endians.update(endian or tr.header.endian for tr in traces)
+    if len(encodings) != 1 or len(endians) != 1:
+        # Mixed encodings or byte orders are written trace by trace.
+        for trace in traces:
+            trace.write(file, data_encoding=data_encoding, endian=endian)
+        return
+    data_encoding = encodings.pop()
+    endian = endians.pop()
+    for trace in traces:
+        if trace.data is None:
+            msg = "No data in the SEGYTrace."
+            raise SEGYWritingError(msg)
+        # Set the data length in the header before writing it.
+        trace.header.number_of_samples_in_this_trace = len(trace.data)
+    headers = _pack_trace_headers([tr.header for tr in traces], endian)
+    pack_function = DATA_SAMPLE_FORMAT_PACK_FUNCTIONS[data_encoding]
+    if len(set((len(tr.data), tr.data.dtype) for tr in traces)) != 1:
+        for header, trace in zip(headers, traces):
+            file.write(header.tobytes())
+            pack_function(file, trace.data, endian=endian)
+        return
+    trace_size = 240 + len(traces[0].data) * \
+        DATA_SAMPLE_FORMAT_SAMPLE_SIZE[data_encoding]
+    chunk_size = max(1, _WRITE_CHUNK_SIZE // trace_size)
+    for start in range(0, len(traces), chunk_size):
+        chunk = traces[start:start + chunk_size]
+        buf = io.BytesIO()
+        pack_function(buf, np.array([tr.data for tr in chunk]),
+                      endian=endian)
+        records = np.empty((len(chunk), trace_size), dtype=np.uint8)
+        records[:, :240] = headers[start:start + chunk_size].view(
+            np.uint8).reshape(-1, 240)
+        records[:, 240:] = from_buffer(buf.getvalue(), dtype=np.uint8)\
+            .reshape(len(chunk), -1)
+        file.write(records.tobytes())
 
 
 def _read_segy(file, endian=None, textual_header_encoding=None,
@@ -1283,8 +1403,7 @@ class SUFile(object):
         If endian is set it will be enforced.
         """
         # Write all traces.
-        for trace in self.traces:
-            trace.write(file, data_encoding=5, endian=endian)
+        _write_traces(file, self.traces, data_encoding=5, endian=endian)
 
 
 def _read_su(file, endian=None, unpack_headers=False, headonly=False):
@@ -1441,3 +1560,266 @@ def autodetect_endian_and_sanity_check_su(file):
             the ObsPy developers so they can implement additional tests.
             """.strip()
         raise Exception(msg)
+
+
+class MemmapSEGYFile(object):
+    """
+    Memory mapped, random access view of a SEG Y file.
+
+    All trace headers are decoded at once into a NumPy structured array
+    (:attr:`headers`, one record per trace with the fields named as in
+    :const:`~obspy.io.segy.header.TRACE_HEADER_FORMAT`) while the trace data
+    is only accessed when requested. 2 and 4 byte integer and IEEE floating
+    point data is returned as a zero-copy view on the memory map, IBM floating
+    point data is converted for the requested trace only.
+
+    >>> from obspy.core.util import get_example_file
+    >>> from obspy.io.segy.segy import MemmapSEGYFile
+    >>> filename = get_example_file("00001034.sgy_first_trace")
+    >>> segy = MemmapSEGYFile(filename)
+    >>> print(segy)
+    1 traces in the memory mapped SEG Y file.
+    >>> print(segy.headers['number_of_samples_in_this_trace'])
+    [2001]
+    >>> segy.find(trace_sequence_number_within_line=1)
+    array([0])
+    >>> print(segy[0])  # doctest: +ELLIPSIS
+    Seq. No. in line:    1 | 2009-06-22T14:47:37.000000Z - ... 2001 samples
+    """
+    def __init__(self, file, endian=None, textual_header_encoding=None):
+        """
+        :param file: Filename, open file object or BytesIO of the SEG Y
+            file.
+        :param endian: The endianness of the file. If None, autodetection will
+            be used.
+        :param textual_header_encoding: The encoding of the textual header.
+            Either 'EBCDIC', 'ASCII' or None. If it is None, autodetection
+            will be attempted.
+        """
+        if hasattr(file, 'read'):
+            self._read_file_headers(file, endian, textual_header_encoding)
+        else:
+            with open(file, 'rb') as fh:
+                self._read_file_headers(fh, endian, textual_header_encoding)
+        if isinstance(file, io.BytesIO):
+            self._mmap = from_buffer(file.getvalue(), dtype=np.uint8)
+        else:
+            self._mmap = np.memmap(file, dtype=np.uint8, mode='r')
+        self._index_traces(self._data_offset)
+
+    def _read_file_headers(self, file, endian, textual_header_encoding):
+        """
+        Reads the textual and binary file headers.
+        """
+        segy = SEGYFile(file, endian=endian,
+                        textual_header_encoding=textual_header_encoding,
+                        read_traces=False)
+        self.endian = segy.endian
+        self.data_encoding = segy.data_encoding
+        self.textual_file_header = segy.textual_file_header
+        self.textual_header_encoding = segy.textual_header_encoding
+        self.binary_file_header = segy.binary_file_header
+        self._data_offset = 3600
+
+    def __str__(self):
+        """
+        Prints some information about the memory mapped SEG Y file.
+        """
+        return '%i traces in the memory mapped SEG Y file.' % len(self)
+
+    def _repr_pretty_(self, p, cycle):
+        p.text(str(self))
+
+    def __len__(self):
+        return len(self.headers)
+
+    def __iter__(self):
+        for _i in range(len(self)):
+            yield self[_i]
+
+    def __getitem__(self, index):
+        """
+        Returns the trace with the given index as an ObsPy Trace.
+        """
+        return self.get_trace(index)
+
+    def _index_traces(self, offset):
+        """
+        Determines the positions of all traces and decodes their headers.
+
+        Files in which all traces have the same length are viewed as a single
+        array of records, otherwise the traces are located one by one.
+        """
+        raw = self._mmap
+        header_dtype = trace_header_dtype(self.endian)
+        sample_size = DATA_SAMPLE_FORMAT_SAMPLE_SIZE[self.data_encoding]
+        npts_offset = TRACE_HEADER_FORMAT[
+            TRACE_HEADER_KEYS.index('number_of_samples_in_this_trace')][3]
+        npts_fmt = ('%sH' % self.endian).encode('ascii', 'strict')
+        size = len(raw) - offset
+        # Fast path for fixed length traces.
+        if size >= 240:
+            npts = unpack(npts_fmt, raw[offset + npts_offset:
+                                        offset + npts_offset + 2])[0]
+            trace_size = 240 + npts * sample_size
+            if npts > 0 and size % trace_size == 0:
+                records = raw[offset:].reshape(-1, trace_size)
+                headers = records[:, :240]
+                headers = np.ascontiguousarray(headers).view(header_dtype)
+                headers = headers.reshape(-1)
+                if np.all(headers['number_of_samples_in_this_trace'] ==
+                          npts):
+                    self._set_headers(headers)
+                    self.offsets = offset + 240 + \
+                        np.arange(len(headers), dtype=np.int64) * trace_size
+                    self.npts = np.full(len(headers), npts, dtype=np.int64)
+                    return
+        # Otherwise walk through the file trace by trace.
+        offsets = []
+        npts_list = []
+        pos = offset
+        filesize = len(raw)
+        while filesize - pos >= 240:
+            npts = unpack(npts_fmt, raw[pos + npts_offset:
+                                        pos + npts_offset + 2])[0]
+            data_needed = npts * sample_size
+            if npts < 1 or data_needed > filesize - pos - 240:
+                msg = """
+                      Too little data left in the file to unpack it according
+                      to its trace header. This is most likely either due to a
+                      wrong byte order or a corrupt file.
+                      """.strip()
+                raise SEGYTraceReadingError(msg)
+            offsets.append(pos + 240)
+            npts_list.append(npts)
+            pos += 240 + data_needed
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.npts = np.array(npts_list, dtype=np.int64)
+        index = (self.offsets - 240)[:, None] + np.arange(240)
+        self._set_headers(raw[index].view(header_dtype).reshape(-1))
+
+    def _set_headers(self, packed_headers):
+        """
+        Keeps the packed trace headers and decodes them to native byte order.
+        """
+        self._packed_headers = np.asarray(packed_headers)
+        self.headers = self._packed_headers.astype(
+            packed_headers.dtype.newbyteorder('='))
+
+    def find(self, **kwargs):
+        """
+        Returns the indices of all traces whose trace header values match the
+        given ones.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        mask = np.ones(len(self), dtype=np.bool_)
+        for key, value in kwargs.items():
+            if key not in TRACE_HEADER_KEYS:
+                msg = "Unknown trace header key '%s'." % key
+                raise ValueError(msg)
+            mask &= self.headers[key] == value
+        return np.flatnonzero(mask)
+
+    def get_data(self, index):
+        """
+        Returns the data of the trace with the given index.
+
+        For integer and IEEE floating point encoded data this is a read-only
+        view on the memory mapped file in the byte order of the file. IBM
+        floating point data is converted to a new array.
+        """
+        offset = int(self.offsets[index])
+        npts = int(self.npts[index])
+        sample_size = DATA_SAMPLE_FORMAT_SAMPLE_SIZE[self.data_encoding]
+        buf = self._mmap[offset:offset + npts * sample_size]
+        if self.data_encoding in (2, 3, 5):
+            dtype = np.dtype(DATA_SAMPLE_FORMAT_CODE_DTYPE[
+                self.data_encoding]).newbyteorder(self.endian)
+            return buf.view(dtype)
+        return DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS[self.data_encoding](
+            io.BytesIO(buf.tobytes()), npts, endian=self.endian)
+
+    def _get_segy_trace(self, index, headonly=False):
+        """
+        Returns a SEGYTrace for the trace with the given index.
+        """
+        trace = SEGYTrace(data_encoding=self.data_encoding,
+                          endian=self.endian)
+        trace.header = SEGYTraceHeader(
+            self._packed_headers[index].tobytes(), endian=self.endian)
+        trace.npts = int(self.npts[index])
+        if headonly:
+            del trace.data
+        else:
+            data = self.get_data(index)
+            # ObsPy traces need native byte order.
+            if not data.dtype.isnative:
+                data = data.astype(data.dtype.newbyteorder('='))
+            trace.data = data
+        return trace
+
+    def get_trace(self, index, headonly=False):
+        """
+        Returns the trace with the given index as an ObsPy Trace.
+
+        :type headonly: bool
+        :param headonly: Do not read the data of the trace.
+        """
+        tr = self._get_segy_trace(index, headonly=headonly).to_obspy_trace(
+            headonly=headonly)
+        tr.stats.segy.textual_file_header = self.textual_file_header
+        tr.stats.segy.binary_file_header = self.binary_file_header
+        tr.stats.segy.textual_file_header_encoding = \
+            self.textual_header_encoding.upper()
+        tr.stats.segy.data_encoding = self.data_encoding
+        tr.stats.segy.endian = self.endian
+        tr.stats._format = "SEGY"
+        return tr
+
+
+class MemmapSUFile(MemmapSEGYFile):
+    """
+    Memory mapped, random access view of a Seismic Unix (SU) file.
+
+    See :class:`MemmapSEGYFile`, SU files are always IEEE floating point
+    encoded and have no file wide headers.
+    """
+    def __init__(self, file, endian=None):
+        """
+        :param file: Filename, open file object or BytesIO of the SU file.
+        :param endian: The endianness of the file. If None, autodetection will
+            be used.
+        """
+        super(MemmapSUFile, self).__init__(file, endian=endian)
+
+    def _read_file_headers(self, file, endian, textual_header_encoding):
+        """
+        Determines the endianness of the file.
+        """
+        su = SUFile(file, endian=endian, read_traces=False)
+        self.endian = su.endian
+        self.data_encoding = 5
+        self._data_offset = 0
+
+    def __str__(self):
+        """
+        Prints some information about the memory mapped SU file.
+        """
+        return '%i traces in the memory mapped SU file.' % len(self)
+
+    def get_trace(self, index, headonly=False):
+        """
+        Returns the trace with the given index as an ObsPy Trace.
+
+        :type headonly: bool
+        :param headonly: Do not read the data of the trace.
+        """
+        tr = self._get_segy_trace(index, headonly=headonly).to_obspy_trace(
+            headonly=headonly)
+        tr.stats.su = tr.stats.segy
+        del tr.stats.segy
+        tr.stats.su.data_encoding = self.data_encoding
+        tr.stats.su.endian = self.endian
+        tr.stats._format = "SU"
+        return tr
@@ -14,13 +14,16 @@ import warnings
 import numpy as np
 
 import obspy
-from obspy.core.compatibility import from_buffer
+from obspy.core.compatibility import from_buffer, mock
 from obspy.core.util import NamedTemporaryFile, AttribDict
 from obspy.io.segy.header import (DATA_SAMPLE_FORMAT_PACK_FUNCTIONS,
                                   DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS)
-from obspy.io.segy.segy import (SEGYBinaryFileHeader, SEGYFile,
-                                SEGYTraceHeader, _read_segy, iread_segy,
+from obspy.io.segy.pack import ieee2ibm
+from obspy.io.segy.segy import (MemmapSEGYFile, SEGYBinaryFileHeader,
+                                SEGYFile, SEGYTraceHeader, SEGYWritingError,
+                                _read_segy, iread_segy,
                                 SEGYInvalidTextualHeaderWarning)
+from obspy.io.segy.unpack import ibm2ieee
 from obspy.io.segy.tests.header import DTYPES, FILES
 
 from . import _patch_header
@@ -268,6 +271,109 @@ class SEGYTestCase(unittest.TestCase):
             # Test both.
             np.testing.assert_array_equal(new_data, data)
 
+    def test_ibm_conversion_of_gathers(self):
+        """
+        IBM <-> IEEE conversion works on arrays of any shape and is exact for
+        values representable in both formats.
+        """
+        # Exactly representable values including subnormal IEEE numbers.
+        data = np.array([0.0, -0.0, 1.0, -1.0, 0.5, 1.0 / 16, 1.0 / 32,
+                         16.0 ** 9, -(16.0 ** -20), 2.0 ** -149, 1e-40,
+                         3.0, -1234.5], dtype=np.float32)
+        ibm = ieee2ibm(data)
+        self.assertEqual(ibm.dtype, np.uint32)
+        self.assertEqual(ibm[1], 0)
+        self.assertEqual(ibm[2], 0x41100000)
+        self.assertEqual(ibm[3], 0xC1100000)
+        np.testing.assert_array_equal(ibm2ieee(ibm), data)
+        # Same result for gathers and in any byte order as for the file
+        # packing and unpacking functions.
+        np.random.seed(42)
+        gather = (np.random.randn(20, 300) * 1e3).astype(np.float32)
+        ibm = ieee2ibm(gather)
+        self.assertEqual(ibm.shape, gather.shape)
+        for endian in ('<', '>'):
+            with io.BytesIO() as buf:
+                DATA_SAMPLE_FORMAT_PACK_FUNCTIONS[1](buf, gather[3], endian)
+                packed = buf.getvalue()
+            self.assertEqual(ibm[3].astype(endian + 'u4').tobytes(), packed)
+            converted = ibm2ieee(ibm.astype(endian + 'u4'))
+            self.assertEqual(converted.shape, gather.shape)
+            np.testing.assert_array_equal(
+                converted[3], DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS[1](
+                    io.BytesIO(packed), 300, endian))
+        self.assertTrue(rms(gather, ibm2ieee(ibm)) < 1E-6)
+
+    def test_writing_many_traces(self):
+        """
+        Traces are packed in chunks and headers all at once, which must not
+        change the written files.
+        """
+        np.random.seed(0)
+        st = obspy.Stream()
+        for _i in range(40):
+            tr = obspy.Trace(np.random.randn(50).astype(np.float32))
+            tr.stats.delta = 0.004
+            tr.stats.starttime = obspy.UTCDateTime(1969, 12, 31, 23) + \
+                _i * 1000.5
+            tr.stats.segy = AttribDict()
+            if _i % 2:
+                tr.stats.segy.trace_header = AttribDict(
+                    {'ensemble_number': _i, 'source_coordinate_x': -10 ** 6})
+            else:
+                tr.stats.segy.trace_header = SEGYTraceHeader()
+                tr.stats.segy.trace_header.receiver_group_elevation = _i
+            st.append(tr)
+        with io.BytesIO() as buf:
+            st.write(buf, format='SEGY', data_encoding=1)
+            buf.seek(0, 0)
+            data = buf.getvalue()
+            st2 = obspy.read(buf, format='SEGY')
+        # Compare to writing trace by trace.
+        segy = _read_segy(io.BytesIO(data))
+        with io.BytesIO() as buf:
+            segy._write_textual_header(buf)
+            segy.binary_file_header.write(buf)
+            for trace in segy.traces:
+                trace.write(buf)
+            self.assertEqual(buf.getvalue(), data)
+        for _i, (tr, tr2) in enumerate(zip(st, st2)):
+            self.assertEqual(tr.stats.starttime.replace(microsecond=0),
+                             tr2.stats.starttime)
+            header = tr2.stats.segy.trace_header
+            self.assertEqual(header.number_of_samples_in_this_trace, 50)
+            self.assertEqual(header.sample_interval_in_ms_for_this_trace,
+                             4000)
+            if _i % 2:
+                self.assertEqual(header.ensemble_number, _i)
+                self.assertEqual(header.source_coordinate_x, -10 ** 6)
+            else:
+                self.assertEqual(header.receiver_group_elevation, _i)
+        # Chunking does not change anything either.
+        with mock.patch('obspy.io.segy.segy._WRITE_CHUNK_SIZE', 1000):
+            with io.BytesIO() as buf:
+                st.write(buf, format='SEGY', data_encoding=1)
+                self.assertEqual(buf.getvalue(), data)
+        # Values that do not fit are not silently truncated.
+        st[0].stats.segy.trace_header.receiver_group_elevation = 2 ** 40
+        with io.BytesIO() as buf:
+            self.assertRaises(SEGYWritingError, st.write, buf,
+                              format='SEGY', data_encoding=1)
+        # More than 32767 traces are written without setting the two byte
+        # number of traces per ensemble.
+        tr = obspy.Trace(np.zeros(1, dtype=np.float32))
+        tr.stats.delta = 0.01
+        st = obspy.Stream([tr] * 32768)
+        with io.BytesIO() as buf:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                st.write(buf, format='SEGY')
+            buf.seek(0, 0)
+            segy = _read_segy(buf)
+        self.assertEqual(len(segy.traces), 32768)
+        self.assertEqual(
+            segy.binary_file_header.number_of_data_traces_per_ensemble, 0)
+
     def test_read_and_write_binary_file_header(self):
         """
         Reading and writing should not change the binary file header.
@@ -762,6 +868,72 @@ class SEGYTestCase(unittest.TestCase):
         self.assertEqual(revision_number, "C39 SEG Y REV1")
         self.assertEqual(end_header_mark, "ABCDEFGHIJKLMNOPQRSTUV")
 
+    def test_memmap_segy_file(self):
+        """
+        Tests random access to SEG Y files with MemmapSEGYFile.
+        """
+        # All test files against the normal reading routine.
+        for file in self.files:
+            filename = os.path.join(self.path, file)
+            st = obspy.read(filename, format="SEGY")
+            segy = MemmapSEGYFile(filename)
+            self.assertEqual(len(segy), len(st))
+            self.assertEqual(segy.data_encoding,
+                             self.files[file]['data_sample_enc'])
+            self.assertEqual(segy.endian, self.files[file]['endian'])
+            tr = segy[0]
+            np.testing.assert_array_equal(tr.data, st[0].data)
+            self.assertEqual(tr.data.dtype, st[0].data.dtype)
+            self.assertEqual(tr.stats.starttime, st[0].stats.starttime)
+            self.assertEqual(tr.stats.delta, st[0].stats.delta)
+            for key in ('trace_sequence_number_within_line',
+                        'number_of_samples_in_this_trace',
+                        'sample_interval_in_ms_for_this_trace',
+                        'year_data_recorded', 'day_of_year'):
+                self.assertEqual(segy.headers[key][0],
+                                 st[0].stats.segy.trace_header[key])
+            self.assertEqual(segy.get_trace(0, headonly=True).stats.npts,
+                             st[0].stats.npts)
+        # Fixed and variable length traces with multiple data encodings.
+        for data_encoding, dtype in ((1, np.float32), (2, np.int32),
+                                     (5, np.float32)):
+            for variable_length in (False, True):
+                st = obspy.Stream()
+                for _i in range(20):
+                    npts = 50 + (_i % 3 if variable_length else 0)
+                    tr = obspy.Trace(
+                        (np.random.randn(npts) * 100).astype(dtype))
+                    tr.stats.delta = 0.01
+                    tr.stats.segy = AttribDict()
+                    tr.stats.segy.trace_header = SEGYTraceHeader()
+                    tr.stats.segy.trace_header.ensemble_number = _i // 5
+                    st.append(tr)
+                with io.BytesIO() as buf:
+                    st.write(buf, format="SEGY",
+                             data_encoding=data_encoding)
+                    buf.seek(0, 0)
+                    st2 = obspy.read(buf, format="SEGY")
+                    buf.seek(0, 0)
+                    segy = MemmapSEGYFile(buf)
+                self.assertEqual(len(segy), 20)
+                np.testing.assert_array_equal(segy.find(ensemble_number=2),
+                                              np.arange(10, 15))
+                for _i, tr in enumerate(st2):
+                    np.testing.assert_array_equal(segy[_i].data, tr.data)
+                    np.testing.assert_array_equal(segy.get_data(_i),
+                                                  tr.data)
+        # Zero-copy views for IEEE floats.
+        with NamedTemporaryFile() as tf:
+            st.write(tf.name, format="SEGY", data_encoding=5)
+            segy = MemmapSEGYFile(tf.name)
+            data = segy.get_data(3)
+            self.assertFalse(data.flags.owndata)
+            self.assertFalse(data.flags.writeable)
+            np.testing.assert_array_equal(data, st[3].data)
+            del segy, data
+        self.assertRaises(ValueError, MemmapSEGYFile(
+            os.path.join(self.path, '1.sgy_first_trace')).find, foo=1)
+
 
 def rms(x, y):
     """
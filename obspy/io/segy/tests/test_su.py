@@ -14,7 +14,8 @@ import numpy as np
 
 import obspy
 from obspy.core.util import NamedTemporaryFile
-from obspy.io.segy.segy import SEGYTraceReadingError, _read_su, iread_su
+from obspy.io.segy.segy import (MemmapSUFile, SEGYTraceReadingError,
+                                _read_su, iread_su)
 
 
 class SUTestCase(unittest.TestCase):
@@ -139,6 +140,32 @@ class SUTestCase(unittest.TestCase):
 
         self.assertEqual(st.traces, ist)
 
+    def test_memmap_su_file(self):
+        """
+        Tests random access to SU files with MemmapSUFile.
+        """
+        filename = os.path.join(self.path, '1.su_first_trace')
+        st = obspy.read(filename, format="SU")
+        su = MemmapSUFile(filename)
+        self.assertEqual(len(su), 1)
+        self.assertEqual(su.endian, '<')
+        tr = su[0]
+        np.testing.assert_array_equal(tr.data, st[0].data)
+        self.assertEqual(tr.stats.starttime, st[0].stats.starttime)
+        self.assertEqual(tr.stats.su.endian, '<')
+        self.assertEqual(tr.stats._format, 'SU')
+        # Multiple traces written in both byte orders.
+        st = obspy.Stream([obspy.Trace(np.random.randn(100).astype(
+            np.float32), header={'delta': 0.01}) for _ in range(5)])
+        for endian in ('<', '>'):
+            with io.BytesIO() as buf:
+                st.write(buf, format="SU", byteorder=endian)
+                buf.seek(0, 0)
+                su = MemmapSUFile(buf, endian=endian)
+            self.assertEqual(len(su), 5)
+            for _i, tr in enumerate(su):
+                np.testing.assert_array_equal(tr.data, st[_i].data)
+
 
 def suite():
     return unittest.makeSuite(SUTestCase, 'test')
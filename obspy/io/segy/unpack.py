@@ -42,6 +42,24 @@ clibsegy.ibm2ieee.argtypes = [
 clibsegy.ibm2ieee.restype = C.c_void_p
 
 
+def ibm2ieee(data):
+    """
+    Converts 32 bit IBM floating points to IEEE floating points.
+
+    Works on arrays of any shape, e.g. on whole gathers of traces at once.
+
+    :type data: :class:`numpy.ndarray`
+    :param data: The IBM floating point numbers as 32 bit words, e.g. with a
+        ``uint32`` or ``>u4`` dtype.
+    :rtype: :class:`numpy.ndarray` of ``float32``
+    :return: The IEEE floating point numbers with the same shape.
+    """
+    # Always work on a native copy as the conversion is done inplace.
+    result = np.array(data, dtype=np.uint32, order='C').view(np.float32)
+    clibsegy.ibm2ieee(result.reshape(-1), result.size)
+    return result
+
+
 def unpack_4byte_ibm(file, count, endian='>'):
     """
     Unpacks 4 byte IBM floating points.
@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, print_function,
 from future.builtins import *  # NOQA
 from future.utils import native_str
 
+import struct
 import warnings
 
 import numpy as np
@@ -53,6 +54,49 @@ def _is_win(filename, century="20"):  # @UnusedVariable
     return True
 
 
+def _ranges(starts, lengths):
+    """
+    Concatenated ``np.arange(start, start + length)`` for all given pairs.
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    ends = np.cumsum(lengths)
+    return np.arange(ends[-1] if len(ends) else 0, dtype=np.int64) + \
+        np.repeat(np.asarray(starts, dtype=np.int64) - ends + lengths,
+                  lengths)
+
+
+def _decode_differences(buff, offsets, ndiffs, datawide):
+    """
+    Decodes the sample differences of many channel blocks of the same width.
+
+    :type buff: :class:`numpy.ndarray`
+    :param buff: Whole WIN file as ``uint8`` array.
+    :param offsets: Offsets of the first difference of all blocks.
+    :param ndiffs: Number of differences in all blocks.
+    :type datawide: int
+    :param datawide: Sample width in bytes, ``0`` for 4 bit.
+    :rtype: :class:`numpy.ndarray`
+    :returns: The differences of all blocks concatenated.
+    """
+    if datawide == 0:
+        # two 4 bit differences per byte, high nibble first, the last nibble
+        # is unused for an even number of differences
+        nbytes = (ndiffs + 1) // 2
+        sdata = buff[_ranges(offsets, nbytes)].view(np.int8)
+        nibbles = np.empty((len(sdata), 2), dtype=np.int8)
+        nibbles[:, 0] = sdata >> 4
+        nibbles[:, 1] = np.left_shift(sdata, 4) >> 4
+        starts = 2 * (np.cumsum(nbytes) - nbytes)
+        return nibbles.ravel()[_ranges(starts, ndiffs)]
+    sdata = buff[_ranges(offsets, ndiffs * datawide)]
+    if datawide == 3:
+        # pad to big endian 4 byte integers and shift back to keep the sign
+        padded = np.zeros((len(sdata) // 3, 4), dtype=np.uint8)
+        padded[:, :3] = sdata.reshape((-1, 3))
+        return padded.view(native_str('>i4')).ravel() >> 8
+    return sdata.view(native_str('>i%d' % datawide))
+
+
 def _read_win(filename, century="20", **kwargs):  # @UnusedVariable
     """
     Reads a WIN file and returns a Stream object.
@@ -68,114 +112,99 @@ def _read_win(filename, century="20", **kwargs):  # @UnusedVariable
     :rtype: :class:`~obspy.core.stream.Stream`
     :returns: Stream object containing header and data.
     """
-    output = {}
+    channels = {}
     srates = {}
+    # channel, sample width, number of samples, first sample and offset of
+    # the first sample difference of all one second channel blocks
+    blocks = []
 
     # read win file
     with open(filename, "rb") as fpin:
-        fpin.seek(0, 2)
-        sz = fpin.tell()
-        fpin.seek(0)
-        leng = 0
-        status0 = 0
-        start = 0
-        while leng < sz:
-            pklen = fpin.read(4)
-            if len(pklen) < 4:
-                break
-            leng = 4
-            truelen = from_buffer(pklen, native_str('>i'))[0]
-            if truelen == 0:
-                break
-            buff = fpin.read(6)
-            leng += 6
-
-            yy = "%s%02x" % (century, ord(buff[0:1]))
-            mm = "%x" % ord(buff[1:2])
-            dd = "%x" % ord(buff[2:3])
-            hh = "%x" % ord(buff[3:4])
-            mi = "%x" % ord(buff[4:5])
-            sec = "%x" % ord(buff[5:6])
-
-            date = UTCDateTime(int(yy), int(mm), int(dd), int(hh), int(mi),
-                               int(sec))
-            if start == 0:
-                start = date
-            if status0 == 0:
-                sdata = None
-            while leng < truelen:
-                buff = fpin.read(4)
-                leng += 4
-                flag = '%02x' % ord(buff[0:1])
-                chanum = '%02x' % ord(buff[1:2])
-                chanum = "%02s%02s" % (flag, chanum)
-                datawide = int('%x' % (ord(buff[2:3]) >> 4))
-                srate = ord(buff[3:4])
+        buff = bytearray(fpin.read())
+    sz = len(buff)
+    pos = 0
+    leng = 0
+    start = 0
+    while leng < sz:
+        if sz - pos < 4:
+            break
+        leng = 4
+        truelen = struct.unpack_from(native_str('>i'), buff, pos)[0]
+        if truelen == 0:
+            break
+        yy = "%s%02x" % (century, buff[pos + 4])
+        mm = "%x" % buff[pos + 5]
+        dd = "%x" % buff[pos + 6]
+        hh = "%x" % buff[pos + 7]
+        mi = "%x" % buff[pos + 8]
+        sec = "%x" % buff[pos + 9]
+        leng += 6
+
+        date = UTCDateTime(int(yy), int(mm), int(dd), int(hh), int(mi),
+                           int(sec))
+        if start == 0:
+            start = date
+        while leng < truelen:
+            flag, chanum, datawide, srate = buff[pos + leng:pos + leng + 4]
+            chanum = "%02x%02x" % (flag, chanum)
+            datawide >>= 4
+            if datawide == 0:
+                xlen = srate // 2
+            elif datawide <= 4:
                 xlen = (srate - 1) * datawide
-                if datawide == 0:
-                    xlen = srate // 2
-                    datawide = 0.5
-
-                idata00 = fpin.read(4)
-                leng += 4
-                idata22 = from_buffer(idata00, native_str('>i'))[0]
-
-                if chanum in output:
-                    output[chanum].append(idata22)
-                else:
-                    output[chanum] = [idata22, ]
-                    srates[chanum] = srate
-                sdata = fpin.read(xlen)
-                leng += xlen
-
-                if len(sdata) < xlen:
-                    fpin.seek(-(xlen - len(sdata)), 1)
-                    sdata += fpin.read(xlen - len(sdata))
-                    msg = "This shouldn't happen, it's weird..."
-                    warnings.warn(msg)
-
-                if datawide == 0.5:
-                    for i in range(xlen):
-                        idata2 = output[chanum][-1] + \
-                            from_buffer(sdata[i:i + 1], np.int8)[0] >> 4
-                        output[chanum].append(idata2)
-                        idata2 = idata2 +\
-                            (from_buffer(sdata[i:i + 1],
-                                         np.int8)[0] << 4) >> 4
-                        output[chanum].append(idata2)
-                elif datawide == 1:
-                    for i in range((xlen // datawide)):
-                        idata2 = output[chanum][-1] +\
-                            from_buffer(sdata[i:i + 1], np.int8)[0]
-                        output[chanum].append(idata2)
-                elif datawide == 2:
-                    for i in range((xlen // datawide)):
-                        idata2 = output[chanum][-1] +\
-                            from_buffer(sdata[2 * i:2 * (i + 1)],
-                                        native_str('>h'))[0]
-                        output[chanum].append(idata2)
-                elif datawide == 3:
-                    for i in range((xlen // datawide)):
-                        idata2 = output[chanum][-1] +\
-                            from_buffer(sdata[3 * i:3 * (i + 1)] + b' ',
-                                        native_str('>i'))[0] >> 8
-                        output[chanum].append(idata2)
-                elif datawide == 4:
-                    for i in range((xlen // datawide)):
-                        idata2 = output[chanum][-1] +\
-                            from_buffer(sdata[4 * i:4 * (i + 1)],
-                                        native_str('>i'))[0]
-                        output[chanum].append(idata2)
-                else:
-                    msg = "DATAWIDE is %s " % datawide + \
-                          "but only values of 0.5, 1, 2, 3 or 4 are supported."
-                    raise NotImplementedError(msg)
+            else:
+                msg = "DATAWIDE is %s " % datawide + \
+                      "but only values of 0.5, 1, 2, 3 or 4 are supported."
+                raise NotImplementedError(msg)
+            idata22 = struct.unpack_from(native_str('>i'), buff,
+                                         pos + leng + 4)[0]
+            leng += 8
+
+            if chanum not in channels:
+                channels[chanum] = len(channels)
+                srates[chanum] = srate
+            blocks.append((channels[chanum], datawide, max(srate, 1),
+                           idata22, pos + leng))
+            leng += xlen
+
+            if pos + leng > sz:
+                buff.extend(b"\x00" * (pos + leng - len(buff)))
+                msg = "This shouldn't happen, it's weird..."
+                warnings.warn(msg)
+        pos += leng
+
+    if not blocks:
+        return Stream()
+    # sort the blocks by channel, keeping their order in time
+    blocks = np.array(blocks, dtype=np.int64)
+    blocks = blocks[np.argsort(blocks[:, 0], kind="mergesort")]
+    chans, widths, npts, firsts, offsets = blocks.T
+    buff = np.frombuffer(buff, dtype=np.uint8)
+
+    # all samples of all blocks as first sample followed by the differences
+    starts = np.cumsum(npts) - npts
+    data = np.empty(npts.sum(), dtype=np.int64)
+    data[starts] = firsts
+    for datawide in np.unique(widths):
+        sel = widths == datawide
+        ndiffs = npts[sel] - 1
+        data[_ranges(starts[sel] + 1, ndiffs)] = _decode_differences(
+            buff, offsets[sel], ndiffs, datawide)
+    # integrate within each block
+    np.cumsum(data, out=data)
+    before = np.empty_like(starts)
+    before[0] = 0
+    before[1:] = data[starts[1:] - 1]
+    data -= np.repeat(before, npts)
+    data = data.astype(np.int32)
 
     traces = []
-    for i in output.keys():
-        t = Trace(data=np.array(output[i]))
-        t.stats.channel = str(i)
-        t.stats.sampling_rate = float(srates[i])
+    lengths = np.bincount(chans, weights=npts).astype(np.int64)
+    ends = np.cumsum(lengths)
+    for i, chan in sorted((_v, _k) for _k, _v in channels.items()):
+        t = Trace(data=data[ends[i] - lengths[i]:ends[i]])
+        t.stats.channel = str(chan)
+        t.stats.sampling_rate = float(srates[chan])
         t.stats.starttime = start
         traces.append(t)
     return Stream(traces=traces)
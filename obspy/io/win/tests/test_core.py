@@ -7,10 +7,16 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
 
+from future.utils import native_str
+
 import os
+import struct
 import unittest
 
+import numpy as np
+
 from obspy import read
+from obspy.core.util import NamedTemporaryFile
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.io.win.core import _read_win
 
@@ -63,6 +69,56 @@ class CoreTestCase(unittest.TestCase):
         self.assertAlmostEqual(st[0].stats.sampling_rate, 100.0)
         self.assertEqual(st[0].stats.channel, 'a100')
 
+    def test_read_all_sample_widths(self):
+        """
+        Read channel blocks with 4 bit, 1, 2, 3 and 4 byte sample
+        differences.
+        """
+        np.random.seed(815)
+        widths = [0, 0, 1, 2, 3, 4]
+        srates = [100, 25, 20, 50, 40, 200]
+        limits = [8, 8, 2 ** 7, 2 ** 15, 2 ** 23, 2 ** 27]
+        expected = [[] for _ in widths]
+        seconds = []
+        for sec in range(3):
+            blocks = []
+            for i, (width, srate, limit) in enumerate(
+                    zip(widths, srates, limits)):
+                diffs = np.random.randint(-limit, limit, srate - 1)
+                first = np.random.randint(-2 ** 20, 2 ** 20)
+                expected[i].append(
+                    first + np.concatenate([[0], np.cumsum(diffs)]))
+                blocks.append(struct.pack(native_str('>BBBBi'), 1, i,
+                                          width << 4, srate, first))
+                if width == 0:
+                    nibbles = np.append(diffs, 0) & 0xf
+                    blocks.append(((nibbles[0:-1:2] << 4) |
+                                   nibbles[1::2]).astype(np.uint8).tobytes())
+                elif width == 3:
+                    blocks.append(np.ascontiguousarray(
+                        diffs.astype(native_str('>i4')).view(np.uint8)
+                        .reshape((-1, 4))[:, 1:]).tobytes())
+                else:
+                    blocks.append(diffs.astype(
+                        native_str('>i%d' % width)).tobytes())
+            body = bytes(bytearray([0x18, 0x01, 0x02, 0x03, 0x04, sec]))
+            body += b''.join(blocks)
+            seconds.append(struct.pack(native_str('>i'), len(body) + 4))
+            seconds.append(body)
+        with NamedTemporaryFile() as tf:
+            tf.write(b''.join(seconds))
+            tf.flush()
+            st = read(tf.name, format='WIN')
+        self.assertEqual(len(st), len(widths))
+        for i, tr in enumerate(st):
+            self.assertEqual(tr.stats.channel, '01%02x' % i)
+            self.assertEqual(tr.stats.sampling_rate, srates[i])
+            self.assertEqual(tr.stats.starttime,
+                             UTCDateTime(2018, 1, 2, 3, 4))
+            self.assertEqual(tr.data.dtype, np.int32)
+            np.testing.assert_array_equal(tr.data,
+                                          np.concatenate(expected[i]))
+
 
 def suite():
     return unittest.makeSuite(CoreTestCase, 'test')
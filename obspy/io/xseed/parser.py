@@ -74,6 +74,44 @@ INDEX_FIELDS = {30: 'data_format_identifier_code',
                 35: 'beam_lookup_code'}
 
 
+def _channel_matches(blk50, blk52, net, sta, loc, cha, datetime=None):
+    """
+    Checks if the channel given by blockettes 50 and 52 matches the given
+    SEED id components and datetime. ``None`` matches any network, station
+    and location code.
+    """
+    if net is not None and blk50.network_code != net:
+        return False
+    if sta is not None and blk50.station_call_letters != sta:
+        return False
+    if loc is not None and blk52.location_identifier != loc:
+        return False
+    if blk52.channel_identifier != cha:
+        return False
+    if datetime is not None:
+        if blk52.start_date > datetime:
+            return False
+        if blk52.end_date and blk52.end_date < datetime:
+            return False
+    return True
+
+
+class _LazyStation(object):
+    """
+    Not yet parsed station control header of a SEED volume.
+
+    Holds the merged raw record data of the station together with its
+    parsed blockette 50 and, for each channel, the start and end offsets
+    within the raw data and the parsed blockette 52.
+    """
+    __slots__ = ('data', 'blockette50', 'channels')
+
+    def __init__(self, data, blockette50, channels):
+        self.data = data
+        self.blockette50 = blockette50
+        self.channels = channels
+
+
 class Parser(object):
     """
     Class parsing dataless and full SEED, X-SEED, and RESP files.
@@ -89,7 +127,8 @@ class Parser(object):
         http://ds.iris.edu/ds/nodes/dmc/data/formats/resp/
 
     """
-    def __init__(self, data=None, debug=False, strict=False, compact=False):
+    def __init__(self, data=None, debug=False, strict=False, compact=False,
+                 lazy=False):
         """
         Initializes the SEED parser.
 
@@ -105,6 +144,14 @@ class Parser(object):
         :param compact: SEED volume will contain compact data strings. Missing
             time strings will be filled with 00:00:00.0000 if this option is
             disabled.
+        :type lazy: bool
+        :param lazy: Only index the station control headers of SEED volumes
+            instead of parsing all of their blockettes. Blockettes 50 and 52
+            are parsed right away, everything else (e.g. the response
+            blockettes) is parsed on demand. :meth:`get_coordinates`,
+            :meth:`get_inventory` and :meth:`get_paz` only parse the
+            requested channels, accessing :attr:`stations` parses all
+            remaining stations. Has no effect for XSEED and RESP files.
         """
         self.record_length = 4096
         self.version = 2.4
@@ -112,6 +159,7 @@ class Parser(object):
         self.debug = debug
         self.strict = strict
         self.compact = compact
+        self.lazy = lazy
         self._format = None
         # All parsed data is organized in volume, abbreviations and a list of
         # stations.
@@ -122,11 +170,30 @@ class Parser(object):
         if data:
             self.read(data)
 
+    @property
+    def stations(self):
+        """
+        List of stations, each a list of all station control blockettes.
+
+        In lazy mode all stations that have not been parsed yet are parsed
+        when accessing this attribute.
+        """
+        stations = self._stations
+        for _i, station in enumerate(stations):
+            if isinstance(station, _LazyStation):
+                stations[_i] = self._parse_blockette_list(
+                    io.BytesIO(station.data), 'S')
+        return stations
+
+    @stations.setter
+    def stations(self, value):
+        self._stations = value
+
     def __str__(self):
         """
         """
         try:
-            if len(self.stations) == 0:
+            if len(self._stations) == 0:
                 return 'No data'
         except Exception:
             return 'No data'
@@ -174,7 +241,7 @@ class Parser(object):
 
         if getattr(self, "_format", None):
             warnings.warn("Clearing parser before every subsequent read()")
-            self.__init__()
+            self.__init__(lazy=self.lazy)
         # try to transform everything into BytesIO object
         if isinstance(data, (str, native_str)):
             if re.search(r"://", data) is not None:
@@ -475,12 +542,17 @@ class Parser(object):
             cha = seed_id
             net = sta = loc = None
         # create a copy of station list
-        stations = list(self.stations)
+        stations = list(self._stations)
         # filter blockettes list by given SEED id
         station_flag = False
         channel_flag = False
         blockettes = []
         for station in stations:
+            if isinstance(station, _LazyStation):
+                # only parse the blockettes of matching channels
+                blockettes.extend(self._select_lazy_station(
+                    station, net, sta, loc, cha, datetime))
+                continue
             for blk in station:
                 if blk.id == 50:
                     station_flag = False
@@ -517,6 +589,42 @@ class Parser(object):
             raise SEEDParserException(msg % (seed_id))
         return blockettes
 
+    def _select_lazy_station(self, station, net, sta, loc, cha,
+                             datetime=None):
+        """
+        Selects all blockettes of a not yet parsed station related to given
+        SEED id and datetime.
+
+        Only the blockettes of matching channels are parsed. They are not
+        stored in the parser.
+        """
+        blockettes = []
+        blk50 = station.blockette50
+        for start, end, blk52 in station.channels:
+            if not _channel_matches(blk50, blk52, net, sta, loc, cha,
+                                    datetime):
+                continue
+            blockettes.append(blk50)
+            blockettes.extend(self._parse_blockette_list(
+                io.BytesIO(station.data[start:end]), 'S', register=False))
+        return blockettes
+
+    def _iter_station_and_channel_blockettes(self):
+        """
+        Iterates over all blockettes 50 and 52 in order of the stations.
+
+        Does not parse the stations of a lazy parser.
+        """
+        for station in self._stations:
+            if isinstance(station, _LazyStation):
+                yield station.blockette50
+                for _, _, blk52 in station.channels:
+                    yield blk52
+                continue
+            for blk in station:
+                if blk.id in (50, 52):
+                    yield blk
+
     def get_paz(self, seed_id, datetime=None):
         """
         Return PAZ.
@@ -618,7 +726,12 @@ class Parser(object):
         :return: Dictionary containing coordinates (latitude, longitude,
             elevation, local_depth, dip, azimuth)
         """
-        blockettes = self._select(seed_id, datetime)
+        if self._format == 'SEED':
+            # Only blockettes 50 and 52 are needed, no need to select and
+            # (in lazy mode) parse any response blockettes.
+            blockettes = self._find_channel_blockettes(seed_id, datetime)
+        else:
+            blockettes = self._select(seed_id, datetime)
         data = {}
         for blkt in blockettes:
             if blkt.id == 52:
@@ -631,6 +744,32 @@ class Parser(object):
                 break
         return data
 
+    def _find_channel_blockettes(self, seed_id, datetime=None):
+        """
+        Returns blockettes 50 and 52 of the channel with given SEED id and
+        datetime.
+        """
+        if '.' in seed_id:
+            net, sta, loc, cha = seed_id.split('.')
+        else:
+            cha = seed_id
+            net = sta = loc = None
+        found = []
+        blk50 = None
+        for blk in self._iter_station_and_channel_blockettes():
+            if blk.id == 50:
+                blk50 = blk
+            elif blk50 is not None and _channel_matches(
+                    blk50, blk, net, sta, loc, cha, datetime):
+                found.append([blk50, blk])
+        if not found:
+            msg = 'No channel found with the given SEED id: %s'
+            raise SEEDParserException(msg % (seed_id))
+        elif len(found) > 1:
+            msg = 'More than one channel found with the given SEED id: %s'
+            raise SEEDParserException(msg % (seed_id))
+        return found[0]
+
     def write_resp(self, folder, zipped=False):
         """
         Writes for each channel a RESP file within a given folder.
@@ -1895,48 +2034,47 @@ class Parser(object):
         info = {"networks": [], "stations": [], "channels": []}
         current_network = None
         current_station = None
-        for station in self.stations:
-            for blkt in station:
-                if blkt.id == 50:
-                    current_network = blkt.network_code.strip()
-                    network_id = blkt.network_identifier_code
-                    if isinstance(network_id, (str, native_str)):
-                        new_id = ""
-                        for _i in network_id:
-                            if _i.isdigit():
-                                new_id += _i
-                        network_id = int(new_id)
-                    network_name = self._get_abbreviation(network_id)
-                    cur_nw = {"network_code": current_network,
-                              "network_name": network_name}
-                    if cur_nw not in info["networks"]:
-                        info["networks"].append(cur_nw)
-                    current_station = blkt.station_call_letters.strip()
-                    cur_stat = {"station_id": "%s.%s" % (current_network,
-                                                         current_station),
-                                "station_name": blkt.site_name}
-                    if cur_stat not in info["stations"]:
-                        info["stations"].append(cur_stat)
-                    continue
-                if blkt.id == 52:
-                    if current_network is None or current_station is None:
-                        raise Exception("Something went wrong")
-                    chan_info = {}
-                    channel = blkt.channel_identifier.strip()
-                    location = blkt.location_identifier.strip()
-                    chan_info["channel_id"] = "%s.%s.%s.%s" % (
-                        current_network, current_station, location, channel)
-                    chan_info["sampling_rate"] = blkt.sample_rate
-                    chan_info["instrument"] = \
-                        self._get_abbreviation(blkt.instrument_identifier)
-                    chan_info["start_date"] = blkt.start_date
-                    chan_info["end_date"] = blkt.end_date
-                    chan_info["latitude"] = blkt.latitude
-                    chan_info["longitude"] = blkt.longitude
-                    chan_info["elevation_in_m"] = blkt.elevation
-                    chan_info["local_depth_in_m"] = blkt.local_depth
-                    info["channels"].append(chan_info)
-                    continue
+        for blkt in self._iter_station_and_channel_blockettes():
+            if blkt.id == 50:
+                current_network = blkt.network_code.strip()
+                network_id = blkt.network_identifier_code
+                if isinstance(network_id, (str, native_str)):
+                    new_id = ""
+                    for _i in network_id:
+                        if _i.isdigit():
+                            new_id += _i
+                    network_id = int(new_id)
+                network_name = self._get_abbreviation(network_id)
+                cur_nw = {"network_code": current_network,
+                          "network_name": network_name}
+                if cur_nw not in info["networks"]:
+                    info["networks"].append(cur_nw)
+                current_station = blkt.station_call_letters.strip()
+                cur_stat = {"station_id": "%s.%s" % (current_network,
+                                                     current_station),
+                            "station_name": blkt.site_name}
+                if cur_stat not in info["stations"]:
+                    info["stations"].append(cur_stat)
+                continue
+            if blkt.id == 52:
+                if current_network is None or current_station is None:
+                    raise Exception("Something went wrong")
+                chan_info = {}
+                channel = blkt.channel_identifier.strip()
+                location = blkt.location_identifier.strip()
+                chan_info["channel_id"] = "%s.%s.%s.%s" % (
+                    current_network, current_station, location, channel)
+                chan_info["sampling_rate"] = blkt.sample_rate
+                chan_info["instrument"] = \
+                    self._get_abbreviation(blkt.instrument_identifier)
+                chan_info["start_date"] = blkt.start_date
+                chan_info["end_date"] = blkt.end_date
+                chan_info["latitude"] = blkt.latitude
+                chan_info["longitude"] = blkt.longitude
+                chan_info["elevation_in_m"] = blkt.elevation
+                chan_info["local_depth_in_m"] = blkt.local_depth
+                info["channels"].append(chan_info)
+                continue
         return info
 
     def _get_abbreviation(self, identifier_code):
@@ -2178,12 +2316,17 @@ class Parser(object):
             self.volume = [i for i in self.temp['volume']
                            if i.id not in [11, 12]]
             self.abbreviations = self.temp['abbreviations']
-            self.stations.extend(self.temp['stations'])
+            self._stations.extend(self.temp['stations'])
             del self.temp
         else:
             msg = 'Merging is an experimental feature and still contains ' + \
                   'a lot of errors!'
             warnings.warn(msg, UserWarning)
+            # Merging needs all station blockettes.
+            self.temp['stations'] = [
+                self._parse_blockette_list(io.BytesIO(_i.data), 'S')
+                if isinstance(_i, _LazyStation) else _i
+                for _i in self.temp['stations']]
             # XXX: Sanity check for multiple Blockettes. Remove duplicates.
             # self._removeDuplicateAbbreviations()
             # Check the abbreviations.
@@ -2255,11 +2398,15 @@ class Parser(object):
         # is passed.
         if record_type not in HEADERS:
             return
-        # Set standard values.
-        blockette_length = 0
-        blockette_id = -1
         # Find out what kind of record is being parsed.
         if record_type == 'S':
+            if self.lazy:
+                # Only index the station, parse the rest on demand.
+                station = self._index_station(data)
+                if station is not None:
+                    self.temp['stations'].append(station)
+                    return
+                data.seek(0)
             # Create new station blockettes list.
             self.temp['stations'].append([])
             root_attribute = self.temp['stations'][-1]
@@ -2276,6 +2423,28 @@ class Parser(object):
                       'Headers found!'
                 warnings.warn(msg, UserWarning)
             root_attribute = self.temp['abbreviations']
+        root_attribute.extend(self._parse_blockette_list(data, record_type))
+        # check if everything is parsed
+        _pos = data.tell()
+        data.seek(0, os.SEEK_END)
+        _len = data.tell()
+        data.seek(_pos)
+        if _pos != _len:
+            warnings.warn("There exist unparsed elements!")
+
+    def _parse_blockette_list(self, data, record_type, register=True):
+        """
+        Parses all blockettes of given merged SEED record data and returns
+        them as a list.
+
+        :type data: io.BytesIO
+        :type register: bool
+        :param register: Whether to add the parsed blockettes to the
+            ``blockettes`` dictionary of the parser.
+        """
+        blockettes = []
+        blockette_length = 0
+        blockette_id = -1
         # Loop over all blockettes in data.
         while blockette_id != 0:
             # remove spaces between blockettes
@@ -2300,19 +2469,74 @@ class Parser(object):
                                                 version=self.version,
                                                 record_type=record_type)
                 blockette_obj.parse_seed(data, blockette_length)
-                root_attribute.append(blockette_obj)
-                self.blockettes.setdefault(blockette_id,
-                                           []).append(blockette_obj)
+                blockettes.append(blockette_obj)
+                if register:
+                    self.blockettes.setdefault(blockette_id,
+                                               []).append(blockette_obj)
             elif blockette_id != 0:
                 msg = "Unknown blockette type %d found" % blockette_id
                 raise SEEDParserException(msg)
-        # check if everything is parsed
-        _pos = data.tell()
-        data.seek(0, os.SEEK_END)
-        _len = data.tell()
-        data.seek(_pos)
-        if _pos != _len:
-            warnings.warn("There exist unparsed elements!")
+        return blockettes
+
+    def _index_station(self, data):
+        """
+        Indexes a merged station control header without parsing all of its
+        blockettes.
+
+        Only blockettes 50 and 52 are parsed, for all other blockettes just
+        their position is determined. Returns ``None`` if the data does not
+        start with a blockette 50.
+
+        :type data: io.BytesIO
+        :rtype: :class:`_LazyStation`
+        """
+        raw = data.getvalue()
+        blk50 = None
+        channels = []
+        while True:
+            # remove spaces between blockettes
+            while data.read(1) == b' ':
+                continue
+            start = data.tell() - 1
+            data.seek(start)
+            try:
+                blockette_id = int(data.read(3))
+                blockette_length = int(data.read(4))
+            except Exception:
+                break
+            if blockette_id == 0:
+                break
+            if blockette_id not in HEADER_INFO['S']['blockettes']:
+                msg = "Unknown blockette type %d found" % blockette_id
+                raise SEEDParserException(msg)
+            if blk50 is None and blockette_id != 50:
+                return None
+            if blockette_id in (50, 52):
+                data.seek(start)
+                blockette_class = getattr(blockette,
+                                          'Blockette%03d' % blockette_id)
+                blockette_obj = blockette_class(debug=self.debug,
+                                                strict=self.strict,
+                                                compact=self.compact,
+                                                version=self.version,
+                                                record_type='S')
+                blockette_obj.parse_seed(data, blockette_length)
+                if blockette_id == 50:
+                    if blk50 is not None:
+                        return None
+                    blk50 = blockette_obj
+                else:
+                    channels.append([start, None, blockette_obj])
+            data.seek(start + blockette_length)
+        if blk50 is None:
+            return None
+        # Each channel extends up to the next blockette 52.
+        for _i, channel in enumerate(channels):
+            if _i + 1 < len(channels):
+                channel[1] = channels[_i + 1][0]
+            else:
+                channel[1] = len(raw)
+        return _LazyStation(raw, blk50, [tuple(_i) for _i in channels])
 
     def _create_blockettes_11_and_12(self, blockette12=False):
         """
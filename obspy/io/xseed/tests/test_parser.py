@@ -497,6 +497,47 @@ class ParserTestCase(unittest.TestCase):
         paz = sp.get_coordinates("II.COCO.10.BH2", UTCDateTime("2010-11-11"))
         self.assertEqual(sorted(paz.items()), sorted(result.items()))
 
+    def test_lazy_parsing(self):
+        """
+        Lazy parsers only parse requested channels but otherwise behave
+        like fully parsed ones.
+        """
+        filename = os.path.join(self.path, 'CL.AIO.dataless')
+        eager = Parser(filename)
+        lazy = Parser(filename, lazy=True)
+        self.assertTrue(lazy.lazy)
+        self.assertTrue(all(isinstance(_i, obspy.io.xseed.parser._LazyStation)
+                            for _i in lazy._stations))
+        self.assertNotIn(53, lazy.blockettes)
+        inv = eager.get_inventory()
+        self.assertEqual(lazy.get_inventory(), inv)
+        for channel in inv["channels"]:
+            seed_id = channel["channel_id"]
+            dt = channel["start_date"]
+            self.assertEqual(lazy.get_coordinates(seed_id, dt),
+                             eager.get_coordinates(seed_id, dt))
+            self.assertEqual(lazy.get_paz(seed_id, dt),
+                             eager.get_paz(seed_id, dt))
+            self.assertEqual(
+                [_i.get_seed() for _i in lazy._select(seed_id, dt)],
+                [_i.get_seed() for _i in eager._select(seed_id, dt)])
+        # none of the above parses any station completely
+        self.assertTrue(all(isinstance(_i, obspy.io.xseed.parser._LazyStation)
+                            for _i in lazy._stations))
+        with self.assertRaises(SEEDParserException):
+            lazy.get_coordinates("XX.AIO..BHZ")
+        # accessing the stations parses everything
+        self.assertEqual(
+            [[_i.get_seed() for _i in sta] for sta in lazy.stations],
+            [[_i.get_seed() for _i in sta] for sta in eager.stations])
+        self.assertEqual(sorted(lazy.blockettes), sorted(eager.blockettes))
+        self.assertEqual(lazy.get_seed(), eager.get_seed())
+        # lazy mode survives clearing the parser on subsequent reads
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            lazy.read(filename)
+        self.assertTrue(lazy.lazy)
+
     def test_select_does_not_change_the_parser_format(self):
         """
         Test that using the _select() method of the Parser object does
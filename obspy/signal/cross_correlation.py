@@ -23,15 +23,23 @@ from future.utils import native_str
 
 import ctypes as C
 from distutils.version import LooseVersion
+from multiprocessing.pool import ThreadPool
 import warnings
 
 import numpy as np
 import scipy
+from scipy.ndimage import maximum_filter1d
 
 from obspy import Stream, Trace
 from obspy.core.util.misc import MatplotlibBackend
 from obspy.signal.headers import clibsignal
 from obspy.signal.invsim import cosine_taper
+from obspy.signal.util import _irfft, next_pow_2
+
+try:
+    from scipy.fftpack import next_fast_len
+except ImportError:  # SciPy < 0.18
+    next_fast_len = next_pow_2
 
 
 def _pad_zeros(a, num, num2=None):
@@ -849,6 +857,229 @@ def templates_max_similarity(st, time, streams_templates):
         return 0
 
 
+def _find_peaks(data, height, distance):
+    """
+    Indices of the samples of data which are at least height and the maximum
+    within distance samples, of equal maxima only the first one.
+    """
+    peaks = np.flatnonzero(data >= height)
+    if not len(peaks):
+        return peaks
+    maxima = maximum_filter1d(data, 2 * distance + 1, mode='constant',
+                              cval=-np.inf)
+    peaks = peaks[data[peaks] == maxima[peaks]]
+    # plateaus of equal maxima
+    keep = np.ones(len(peaks), dtype=bool)
+    last = None
+    for i, peak in enumerate(peaks):
+        if last is not None and peak - last <= distance:
+            keep[i] = False
+        else:
+            last = peak
+    return peaks[keep]
+
+
+def correlation_detector(stream, templates, heights, distance,
+                         template_times=None, template_names=None,
+                         block_size=16, threads=None):
+    """
+    Detect events in continuous data by cross-correlation with templates
+    (matched filter).
+
+    Every template is correlated with the continuous data of all its
+    channels (normalized like :func:`correlate_template` with the default
+    ``demean=True, normalize='full'``). The correlations of the channels are
+    shifted by the moveout of the template traces, i.e. their start times
+    relative to the template time, and averaged to the network similarity.
+    Detections are the maxima of the similarity exceeding ``heights``.
+
+    The data of every channel is Fourier transformed once and the
+    normalization is computed once per channel and template length. The
+    templates are correlated in blocks of ``block_size`` templates, with
+    ``threads`` the blocks are processed by a pool of threads. Memory usage
+    grows with the number of samples of all channels and with the block
+    size, for day-long data at high sampling rates consider calling this
+    function for shorter, overlapping pieces of the data.
+
+    :type stream: :class:`~obspy.core.stream.Stream`
+    :param stream: Continuous data, one trace per channel with a common
+        sampling rate. Masked samples (gaps) are treated as samples of the
+        mean value and do not correlate.
+    :type templates: list of :class:`~obspy.core.stream.Stream`
+    :param templates: Templates with traces of some or all channels of
+        ``stream``. Traces of channels not in ``stream`` are ignored.
+    :type heights: float or list of float
+    :param heights: Minimal similarity of a detection, for all templates or
+        for every template.
+    :param float distance: Minimal distance of detections of the same
+        template in seconds.
+    :type template_times: list of :class:`~obspy.core.utcdatetime.UTCDateTime`
+    :param template_times: Reference time of every template, e.g. the origin
+        time of the template event. Defaults to the earliest start time of
+        the template traces. Detection times refer to this time.
+    :param template_names: Names of the templates added to the detections.
+    :param int block_size: Number of templates correlated at once.
+    :param int threads: If given, correlate blocks of templates with a pool
+        of that many threads.
+    :return: Detections sorted by time, dictionaries with the keys
+        ``'time'``, ``'similarity'``, ``'template_id'`` (the index of the
+        template) and, if ``template_names`` are given, ``'template_name'``.
+
+    .. rubric:: Example
+
+    >>> from obspy import read, UTCDateTime
+    >>> st = read()
+    >>> t = UTCDateTime('2009-08-24T00:20:07.7')
+    >>> template = st.slice(t, t + 2.5)
+    >>> detections = correlation_detector(st, [template], 0.5, 10)
+    >>> for detection in detections:  # doctest: +ELLIPSIS
+    ...     print(detection['time'], round(detection['similarity'], 3))
+    2009-08-24T00:20:07.700000Z 1.0
+    """
+    ids = [tr.id for tr in stream]
+    if len(set(ids)) != len(ids):
+        msg = 'Stream must contain only one trace per channel, merge it first.'
+        raise ValueError(msg)
+    if not len(stream):
+        return []
+    sampling_rate = stream[0].stats.sampling_rate
+    for tr in list(stream) + [tr for tmpl in templates for tr in tmpl]:
+        if tr.stats.sampling_rate != sampling_rate:
+            msg = 'All traces must have the same sampling rate.'
+            raise ValueError(msg)
+    if np.ndim(heights) == 0:
+        heights = [heights] * len(templates)
+    if template_times is None:
+        template_times = [min(tr.stats.starttime for tr in tmpl)
+                          if len(tmpl) else None for tmpl in templates]
+    distance = max(1, int(round(distance * sampling_rate)))
+
+    # continuous data, offset in samples relative to the earliest trace
+    reftime = min(tr.stats.starttime for tr in stream)
+    channels = {}
+    for tr in stream:
+        data = tr.data.astype(np.float64)
+        data = np.ma.filled(data - data.mean(), 0.)
+        offset = int(round((tr.stats.starttime - reftime) * sampling_rate))
+        channels[tr.id] = (offset, data)
+
+    # template traces: channel, shift relative to template time, data
+    # normalized to unit energy, and the window of template times for which
+    # all channels have correlation values
+    entries = []
+    for i, tmpl in enumerate(templates):
+        traces = []
+        for tr in tmpl:
+            if tr.id not in channels:
+                continue
+            offset, data = channels[tr.id]
+            tdata = np.asarray(tr.data, dtype=np.float64)
+            tdata = tdata - tdata.mean()
+            tnorm = np.sum(tdata ** 2) ** 0.5
+            if len(tdata) > len(data) or tnorm <= np.finfo(float).eps:
+                continue
+            shift = int(round((tr.stats.starttime - template_times[i]) *
+                              sampling_rate))
+            traces.append((tr.id, offset - shift, tdata / tnorm))
+        if not traces:
+            msg = ('Skipping template %d: No common SEED IDs with data or no '
+                   'usable data.')
+            warnings.warn(msg % i)
+            continue
+        start = max(first for _, first, _ in traces)
+        end = min(first + len(channels[id_][1]) - len(tdata)
+                  for id_, first, tdata in traces)
+        if end >= start:
+            entries.append((i, traces, start, end))
+
+    # Fourier transforms of overlapping segments of the data (overlap-save
+    # method with segments of about eight times the longest template) and
+    # normalization of the correlations, once per channel and template length
+    longest = {}
+    for _, traces, _, _ in entries:
+        for id_, _, tdata in traces:
+            longest[id_] = max(longest.get(id_, 0), len(tdata))
+    spectra = {}
+    for id_, lent in longest.items():
+        data = channels[id_][1]
+        nfft = int(next_fast_len(8 * lent))
+        step = nfft - lent + 1
+        nseg = -(-len(data) // step)
+        padded = np.zeros((nseg - 1) * step + nfft)
+        padded[:len(data)] = data
+        segments = np.lib.stride_tricks.as_strided(
+            padded, shape=(nseg, nfft),
+            strides=(step * padded.itemsize, padded.itemsize))
+        spectra[id_] = (nfft, step, np.fft.rfft(segments, axis=1))
+    norms = {}
+    for _, traces, _, _ in entries:
+        for id_, _, tdata in traces:
+            lent = len(tdata)
+            if (id_, lent) in norms:
+                continue
+            padded = np.concatenate([[0.], channels[id_][1]])
+            norm = _window_sum(padded ** 2, lent)
+            norm -= _window_sum(padded, lent) ** 2 / lent
+            mask = norm <= np.finfo(float).eps
+            norm[mask] = 1.
+            norm = 1. / np.sqrt(norm)
+            norm[mask] = 0.
+            norms[id_, lent] = norm
+
+    def _detect(block):
+        stacks = [np.zeros(end - start + 1) for _, _, start, end in block]
+        by_channel = {}
+        for j, (_, traces, _, _) in enumerate(block):
+            for id_, first, tdata in traces:
+                by_channel.setdefault(id_, []).append((j, first, tdata))
+        for id_, items in by_channel.items():
+            nfft, step, spectrum = spectra[id_]
+            tdata = np.zeros((len(items), nfft))
+            for k, (_, _, tdata_) in enumerate(items):
+                tdata[k, :len(tdata_)] = tdata_
+            tspectra = np.fft.rfft(tdata, axis=1).conj()
+            product = np.empty_like(spectrum)
+            for (j, first, tdata_), tspectrum in zip(items, tspectra):
+                start = block[j][2] - first
+                stop = start + len(stacks[j])
+                # correlate only the segments needed for the stack
+                first_seg = start // step
+                segments = slice(first_seg, -(-stop // step))
+                np.multiply(spectrum[segments], tspectrum,
+                            out=product[segments])
+                cc = _irfft(product[segments], nfft)
+                cc = cc[:, :step].ravel()[start - first_seg * step:
+                                          stop - first_seg * step]
+                cc *= norms[id_, len(tdata_)][start:stop]
+                stacks[j] += cc
+        detections = []
+        for (i, traces, start, _), stack in zip(block, stacks):
+            stack /= len(traces)
+            for peak in _find_peaks(stack, heights[i], distance):
+                detection = {
+                    'time': reftime + (start + peak) / sampling_rate,
+                    'similarity': stack[peak], 'template_id': i}
+                if template_names is not None:
+                    detection['template_name'] = template_names[i]
+                detections.append(detection)
+        return detections
+
+    blocks = [entries[i:i + block_size]
+              for i in range(0, len(entries), block_size)]
+    if threads and threads > 1 and len(blocks) > 1:
+        pool = ThreadPool(min(threads, len(blocks)))
+        try:
+            results = pool.map(_detect, blocks)
+        finally:
+            pool.close()
+    else:
+        results = [_detect(block) for block in blocks]
+    detections = [detection for result in results for detection in result]
+    detections.sort(key=lambda detection: (detection['time'],
+                                           detection['template_id']))
+    return detections
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+"""
+Cross-correlation and stacking of ambient seismic noise.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import native_str
+
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+from scipy.signal import detrend, hilbert
+
+from obspy.signal.invsim import cosine_taper
+from obspy.signal.util import _irfft, next_pow_2
+
+try:
+    from scipy.fftpack import next_fast_len
+except ImportError:  # SciPy < 0.18
+    next_fast_len = next_pow_2
+
+
+NPZ_FORMAT_VERSION = 1
+
+
+class NoiseCorrelation(object):
+    """
+    Stacked cross-correlations of ambient noise of all pairs of channels.
+
+    The continuous data added with :meth:`add` is cut into windows of
+    ``window_length`` seconds on a fixed time grid, so that the windows of
+    all channels, and of data added later on, line up. For every window the
+    data of each channel is detrended, optionally one-bit normalized, tapered
+    and Fourier transformed once, optionally followed by spectral whitening.
+    The spectra are then correlated for all pairs of channels with data in
+    that window, in vectorized blocks of ``block_size`` pairs.
+
+    The correlations, normalized by the energy of the processed windows, are
+    stacked right away. Only the running sums of the stacks are kept, memory
+    usage does not grow with the amount of data added, e.g. for stacking
+    several months of data day by day. For phase weighted stacks
+    [Schimmel1997]_ the sum of the instantaneous phases of the correlations is
+    kept as well.
+
+    The correlation of a pair ``(id1, id2)`` (with ``id1 < id2``) has the
+    same lag convention as :func:`~obspy.signal.cross_correlation.correlate`,
+    i.e. a signal arriving at ``id2`` before ``id1`` results in a maximum at
+    a positive lag.
+
+    :param float window_length: Length of the correlated windows in seconds.
+    :param float max_lag: Maximal lag of the correlations in seconds.
+    :param float overlap: Overlap of the windows, ``0.5`` for 50 %.
+    :param bool onebit: Whether to one-bit normalize the windows (keep only
+        the sign of the samples).
+    :type whiten: tuple of four floats
+    :param whiten: If given, the amplitude spectrum of every window is
+        normalized to one between the second and third of these frequencies
+        and tapered to zero towards the first and fourth frequency (spectral
+        whitening).
+    :param float taper_fraction: Decimal percentage of the cosine taper
+        applied to the windows, see
+        :func:`~obspy.signal.invsim.cosine_taper`.
+    :param bool phase_stack: Whether to keep the sums needed for phase
+        weighted stacks.
+    :param int block_size: Number of pairs correlated at once.
+    :param int threads: If given, correlate blocks of pairs with a pool of
+        that many threads.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> st = read()
+    >>> nc = NoiseCorrelation(window_length=10, max_lag=2, onebit=True)
+    >>> nc.add(st)
+    >>> pairs, stacks = nc.get_stacks()
+    >>> print(pairs[0])
+    ('BW.RJOB..EHE', 'BW.RJOB..EHN')
+    >>> print(stacks.shape, nc.counts.tolist())
+    (3, 401) [4, 4, 4]
+    """
+    def __init__(self, window_length, max_lag, overlap=0.5, onebit=False,
+                 whiten=None, taper_fraction=0.05, phase_stack=True,
+                 block_size=64, threads=None):
+        if not 0 <= overlap < 1:
+            msg = 'overlap must be between 0 and 1 (exclusive).'
+            raise ValueError(msg)
+        if max_lag >= window_length:
+            msg = 'max_lag must be smaller than window_length.'
+            raise ValueError(msg)
+        if whiten is not None and len(whiten) != 4:
+            msg = 'whiten must be given as four corner frequencies.'
+            raise ValueError(msg)
+        self.window_length = float(window_length)
+        self.max_lag = float(max_lag)
+        self.overlap = float(overlap)
+        self.onebit = bool(onebit)
+        self.whiten = None if whiten is None else tuple(map(float, whiten))
+        self.taper_fraction = float(taper_fraction)
+        self.phase_stack = bool(phase_stack)
+        self.block_size = block_size
+        self.threads = threads
+        self.sampling_rate = None
+        self._pairs = []
+        self._pair_rows = {}
+        self._linear = None
+        self._phase = None
+        self._counts = None
+
+    @property
+    def step(self):
+        """
+        Time between the start of consecutive windows in seconds.
+        """
+        return self.window_length * (1 - self.overlap)
+
+    @property
+    def lags(self):
+        """
+        Lags of the samples of the stacks in seconds.
+        """
+        nlag = self._setup()[2]
+        return np.arange(-nlag, nlag + 1) / self.sampling_rate
+
+    @property
+    def pairs(self):
+        """
+        SEED IDs of the correlated pairs of channels.
+        """
+        return list(self._pairs)
+
+    @property
+    def counts(self):
+        """
+        Number of stacked windows for every pair.
+        """
+        if self._counts is None:
+            return np.zeros(0, dtype=np.int64)
+        return self._counts[:len(self._pairs)].copy()
+
+    def _setup(self):
+        """
+        Returns samples per window, number of points of the Fourier
+        transforms and maximal lag in samples.
+        """
+        if self.sampling_rate is None:
+            msg = 'No data added yet.'
+            raise ValueError(msg)
+        npts = int(round(self.window_length * self.sampling_rate))
+        nlag = int(round(self.max_lag * self.sampling_rate))
+        # long enough to avoid wrap around up to the maximal lag
+        nfft = int(next_fast_len(npts + nlag))
+        return npts, nfft, nlag
+
+    def _windows(self, stream):
+        """
+        Returns the samples of all complete windows of the stream, as a
+        dictionary mapping the index of the window on the time grid to a
+        dictionary of SEED IDs and samples.
+        """
+        npts = self._setup()[0]
+        sr = self.sampling_rate
+        step_ns = int(round(self.step * 1e9))
+        dt_ns = 1e9 / sr
+        windows = {}
+        for tr in stream:
+            if len(tr.data) < npts:
+                continue
+            start_ns = tr.stats.starttime.ns
+            data = tr.data
+            mask = np.ma.getmaskarray(data)
+            if mask.any():
+                gaps = np.concatenate([[0], np.cumsum(mask)])
+            else:
+                gaps = None
+            data = np.ma.getdata(data)
+            # windows starting within half a sample after the first and
+            # before the last possible sample
+            first = -(-int(start_ns - dt_ns / 2) // step_ns)
+            last = int(start_ns + (len(data) - npts + 0.5) * dt_ns) // step_ns
+            for k in range(first, last + 1):
+                i0 = int(round((k * step_ns - start_ns) / dt_ns))
+                if i0 < 0 or i0 + npts > len(data):
+                    continue
+                if gaps is not None and gaps[i0 + npts] - gaps[i0]:
+                    continue
+                window = windows.setdefault(k, {})
+                # overlapping traces of one channel, keep the first
+                window.setdefault(tr.id, data[i0:i0 + npts])
+        return windows
+
+    def _spectra(self, data):
+        """
+        Processes the windows of all channels (rows of ``data``) and returns
+        their spectra and energies.
+        """
+        npts, nfft, _ = self._setup()
+        data = detrend(data, axis=1)
+        if self.onebit:
+            data = np.sign(data)
+        data *= cosine_taper(npts, self.taper_fraction)
+        spectra = np.fft.rfft(data, nfft, axis=1)
+        if self.whiten is not None:
+            amplitude = np.abs(spectra)
+            amplitude[amplitude == 0] = 1.
+            freqs = np.fft.rfftfreq(nfft, 1 / self.sampling_rate)
+            taper = cosine_taper(len(freqs), freqs=freqs, flimit=self.whiten)
+            spectra *= taper / amplitude
+        # energy of the processed windows (Parseval's theorem), i.e. the
+        # correlations at zero lag
+        weights = np.full(spectra.shape[1], 2.)
+        weights[0] = 1.
+        if nfft % 2 == 0:
+            weights[-1] = 1.
+        energy = np.dot(spectra.real ** 2 + spectra.imag ** 2, weights) / nfft
+        return spectra, energy
+
+    def _rows(self, pairs):
+        """
+        Returns the rows of the stacks of the pairs, new pairs get new rows.
+        """
+        nlag = self._setup()[2]
+        new = [pair for pair in pairs if pair not in self._pair_rows]
+        for pair in new:
+            self._pair_rows[pair] = len(self._pairs)
+            self._pairs.append(pair)
+        size = 0 if self._counts is None else len(self._counts)
+        if len(self._pairs) > size:
+            # grow geometrically to keep appending new pairs cheap
+            grow = max(len(self._pairs), 2 * size) - size
+            shape = (grow, 2 * nlag + 1)
+            if self._counts is None:
+                self._linear = np.zeros(shape)
+                self._counts = np.zeros(grow, dtype=np.int64)
+                if self.phase_stack:
+                    self._phase = np.zeros(shape, dtype=np.complex128)
+            else:
+                self._linear = np.concatenate([self._linear, np.zeros(shape)])
+                self._counts = np.concatenate(
+                    [self._counts, np.zeros(grow, dtype=np.int64)])
+                if self.phase_stack:
+                    self._phase = np.concatenate(
+                        [self._phase, np.zeros(shape, dtype=np.complex128)])
+        return np.array([self._pair_rows[pair] for pair in pairs],
+                        dtype=np.int64)
+
+    def add(self, stream):
+        """
+        Correlates and stacks all windows of the stream.
+
+        :type stream: :class:`~obspy.core.stream.Stream`
+        :param stream: Continuous data of the channels, all with the same
+            sampling rate. Windows with gaps or masked samples are skipped.
+            Data of the same windows should not be added twice.
+        """
+        for tr in stream:
+            if self.sampling_rate is None:
+                self.sampling_rate = float(tr.stats.sampling_rate)
+            elif tr.stats.sampling_rate != self.sampling_rate:
+                msg = 'All traces must have a sampling rate of %s Hz.'
+                raise ValueError(msg % self.sampling_rate)
+        if self.sampling_rate is None:
+            return
+        npts, nfft, nlag = self._setup()
+        # columns of the correlations for lags -nlag, ..., nlag
+        columns = np.concatenate([np.arange(nfft - nlag, nfft),
+                                  np.arange(nlag + 1)])
+        # the analytic signals are computed with a fast FFT length
+        nhilbert = int(next_fast_len(2 * nlag + 1))
+        pool = None
+        if self.threads and self.threads > 1:
+            pool = ThreadPool(self.threads)
+        try:
+            windows = self._windows(stream)
+            for k in sorted(windows):
+                ids = sorted(windows[k])
+                if len(ids) < 2:
+                    continue
+                data = np.array([windows[k][id_] for id_ in ids],
+                                dtype=np.float64)
+                spectra, energy = self._spectra(data)
+                conjugates = spectra.conj()
+                # skip dead channels
+                valid = np.flatnonzero(energy > np.finfo(float).tiny)
+                if len(valid) < 2:
+                    continue
+                first, second = np.triu_indices(len(valid), 1)
+                first, second = valid[first], valid[second]
+                rows = self._rows([(ids[i], ids[j])
+                                   for i, j in zip(first, second)])
+
+                def _correlate(start):
+                    block = slice(start, start + self.block_size)
+                    i, j = first[block], second[block]
+                    product = spectra[i] * conjugates[j]
+                    cc = _irfft(product, nfft)[:, columns]
+                    cc /= np.sqrt(energy[i] * energy[j])[:, None]
+                    self._linear[rows[block]] += cc
+                    if self._phase is not None:
+                        analytic = hilbert(cc, nhilbert, axis=1)
+                        analytic = analytic[:, :len(columns)]
+                        # much faster than np.abs for complex arrays
+                        amplitude = analytic.real ** 2
+                        amplitude += analytic.imag ** 2
+                        np.sqrt(amplitude, out=amplitude)
+                        amplitude[amplitude == 0] = 1.
+                        analytic /= amplitude
+                        self._phase[rows[block]] += analytic
+
+                starts = range(0, len(rows), self.block_size)
+                if pool is not None and len(starts) > 1:
+                    pool.map(_correlate, starts)
+                else:
+                    for start in starts:
+                        _correlate(start)
+                self._counts[rows] += 1
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    def get_stacks(self, method='linear', power=2):
+        """
+        Returns the stacked correlations of all pairs.
+
+        :param str method: ``'linear'`` for the mean of the correlations or
+            ``'pws'`` for phase weighted stacks [Schimmel1997]_, i.e. the
+            mean weighted with the coherence of the instantaneous phases to
+            the power of ``power``.
+        :param float power: Power of the phase weighting.
+        :return: SEED IDs of the pairs and the stacks of the pairs (one row
+            per pair, the lags of the columns are given by :attr:`lags`).
+            Pairs without stacked windows have stacks of zeros.
+        """
+        if method not in ('linear', 'pws'):
+            msg = "method must be 'linear' or 'pws'."
+            raise ValueError(msg)
+        if method == 'pws' and not self.phase_stack:
+            msg = 'Phase weighted stacks need phase_stack=True.'
+            raise ValueError(msg)
+        pairs = self.pairs
+        if not pairs:
+            return pairs, np.zeros((0, 2 * self._setup()[2] + 1))
+        counts = np.maximum(self._counts[:len(pairs)], 1)[:, None]
+        stacks = self._linear[:len(pairs)] / counts
+        if method == 'pws':
+            stacks *= np.abs(self._phase[:len(pairs)] / counts) ** power
+        return pairs, stacks
+
+    def save_npz(self, filename):
+        """
+        Saves the stacks and parameters to a compressed numpy binary file.
+
+        The stacking can be continued after loading the file with
+        :meth:`load_npz`, e.g. to add the data of one day at a time.
+
+        :param str filename: Name of the numpy binary file.
+        """
+        npairs = len(self._pairs)
+        out = {
+            'npz_format_version': np.array(NPZ_FORMAT_VERSION),
+            'parameters': np.array([
+                self.window_length, self.max_lag, self.overlap,
+                self.onebit, self.taper_fraction, self.phase_stack,
+                np.nan if self.sampling_rate is None else self.sampling_rate]),
+            'whiten': np.array(self.whiten or [], dtype=np.float64),
+            'pairs': np.array(self._pairs, dtype=native_str('U')).reshape(
+                npairs, 2)}
+        if npairs:
+            out['linear'] = self._linear[:npairs]
+            out['counts'] = self._counts[:npairs]
+            if self._phase is not None:
+                out['phase'] = self._phase[:npairs]
+        np.savez_compressed(filename, **out)
+
+    @staticmethod
+    def load_npz(filename, block_size=64, threads=None):
+        """
+        Loads stacks and parameters saved with :meth:`save_npz`.
+
+        :param str filename: Name of the numpy binary file.
+        :param int block_size: Number of pairs correlated at once.
+        :param int threads: If given, correlate blocks of pairs with a pool
+            of that many threads.
+        :rtype: :class:`NoiseCorrelation`
+        """
+        with np.load(filename) as data:
+            version = int(data['npz_format_version'])
+            if version > NPZ_FORMAT_VERSION:
+                msg = 'NPZ format version %d is not supported.' % version
+                raise NotImplementedError(msg)
+            (window_length, max_lag, overlap, onebit, taper_fraction,
+             phase_stack, sampling_rate) = data['parameters'].tolist()
+            whiten = data['whiten'].tolist() or None
+            nc = NoiseCorrelation(
+                window_length, max_lag, overlap=overlap, onebit=bool(onebit),
+                whiten=whiten, taper_fraction=taper_fraction,
+                phase_stack=bool(phase_stack), block_size=block_size,
+                threads=threads)
+            if not np.isnan(sampling_rate):
+                nc.sampling_rate = sampling_rate
+            pairs = [(str(id1), str(id2)) for id1, id2 in data['pairs']]
+            if pairs:
+                nc._rows(pairs)
+                nc._linear[:] = data['linear']
+                nc._counts[:] = data['counts']
+                if nc._phase is not None:
+                    nc._phase[:] = data['phase']
+        return nc
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -12,11 +12,12 @@ import os
 import unittest
 import warnings
 
-from obspy import UTCDateTime, read
+from obspy import Stream, Trace, UTCDateTime, read
 from obspy.core.util.deprecation_helpers import ObsPyDeprecationWarning
 from obspy.core.util.libnames import _load_cdll
 from obspy.core.util.testing import ImageComparison
 from obspy.signal.cross_correlation import (correlate, correlate_template,
+                                            correlation_detector,
                                             xcorr_pick_correction,
                                             xcorr_3c, xcorr_max, xcorr,
                                             _xcorr_padzeros, _xcorr_slice)
@@ -499,6 +500,78 @@ class CrossCorrelationTestCase(unittest.TestCase):
                                          normalize=normalize)
                 np.testing.assert_allclose(cc3, cc4)
 
+    def test_correlation_detector(self):
+        """
+        Network similarity of correlation_detector compared to stacked
+        correlations of correlate_template, with moveouts between the
+        channels, different start times of the channels and a gap.
+        """
+        np.random.seed(42)
+        sr = 20.0
+        t0 = UTCDateTime(2020, 1, 1)
+        wave = np.random.randn(3, 100) * np.hanning(100)
+        moveouts = [0, 1.5, 3.2]
+        st = Stream()
+        for c in range(3):
+            data = np.random.randn(6000) * 0.3
+            offset = c * 0.15
+            for tev, amp in ((50., 1.), (200., 0.8)):
+                i = int(round((tev + moveouts[c] - offset) * sr))
+                data[i:i + 100] += wave[c] * amp
+            st.append(Trace(data, header={'station': 'S%d' % c,
+                                          'sampling_rate': sr,
+                                          'starttime': t0 + offset}))
+        st[2].data = np.ma.masked_array(st[2].data)
+        st[2].data[4000:4100] = np.ma.masked
+        templates = []
+        times = [t0 + 50, t0 + 120]
+        for time in times:
+            templates.append(Stream([
+                tr.slice(time + m, time + m + 4.95)
+                for tr, m in zip(st, moveouts)]))
+        # second template: only two channels with different lengths
+        templates[1] = templates[1][:2]
+        templates[1][1].data = templates[1][1].data[:60]
+
+        expected = []
+        for j, tmpl in enumerate(templates):
+            ccs = []
+            for tr in tmpl:
+                data = st.select(id=tr.id)[0]
+                cc = correlate_template(
+                    np.ma.filled(data.data - data.data.mean(), 0), tr.data)
+                first = int(round((data.stats.starttime - t0) * sr)) - \
+                    int(round((tr.stats.starttime - times[j]) * sr))
+                ccs.append((first, cc))
+            start = max(first for first, _ in ccs)
+            end = min(first + len(cc) for first, cc in ccs)
+            stack = sum(cc[start - first:end - first]
+                        for first, cc in ccs) / len(ccs)
+            for i in np.flatnonzero(stack >= 0.2):
+                window = stack[max(0, i - 100):i + 101]
+                if stack[i] == window.max():
+                    expected.append((t0 + (start + i) / sr, stack[i], j))
+        expected.sort(key=lambda x: (x[0], x[2]))
+        self.assertGreater(len(expected), 10)
+
+        for kwargs in ({}, {'block_size': 1, 'threads': 2}):
+            detections = correlation_detector(
+                st, templates, 0.2, 5, template_times=times,
+                template_names=['a', 'b'], **kwargs)
+            self.assertEqual(len(detections), len(expected))
+            for detection, (time, similarity, j) in zip(detections,
+                                                        expected):
+                self.assertEqual(detection['time'], time)
+                self.assertAlmostEqual(detection['similarity'], similarity)
+                self.assertEqual(detection['template_id'], j)
+                self.assertEqual(detection['template_name'], 'ab'[j])
+        # both events are found by the first template
+        detections = correlation_detector(st, templates[:1], 0.7, 5,
+                                          template_times=times[:1])
+        self.assertEqual([d['time'] for d in detections],
+                         [t0 + 50, t0 + 200])
+        self.assertAlmostEqual(detections[0]['similarity'], 1.0)
+
 
 def suite():
     return unittest.makeSuite(CrossCorrelationTestCase, 'test')
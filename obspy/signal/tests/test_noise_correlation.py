@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+The noise correlation test suite.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import unittest
+
+import numpy as np
+from scipy.signal import detrend
+
+from obspy import Stream, Trace, UTCDateTime
+from obspy.core.util import NamedTemporaryFile
+from obspy.signal.cross_correlation import correlate
+from obspy.signal.invsim import cosine_taper
+from obspy.signal.noise_correlation import NoiseCorrelation
+
+
+class NoiseCorrelationTestCase(unittest.TestCase):
+    """
+    Test cases for the noise correlation.
+    """
+    def setUp(self):
+        # noise recorded with different delays at four stations, the first
+        # one with a gap
+        np.random.seed(42)
+        noise = np.random.randn(6100)
+        self.t0 = UTCDateTime(2018, 1, 1)
+        self.stream = Stream()
+        for i, delay in enumerate((0, 7, -3, 12)):
+            data = np.roll(noise, delay)[50:-50] + 0.1 * np.random.randn(6000)
+            if i == 0:
+                data = np.ma.masked_array(data)
+                data[3010:3020] = np.ma.masked
+            self.stream.append(Trace(data=data, header={
+                'station': 'ST%d' % i, 'sampling_rate': 10.,
+                'starttime': self.t0 + 0.02}))
+
+    def _expected(self, stream, window_length, max_lag, overlap, onebit):
+        """
+        Linear stacks computed window by window with correlate.
+        """
+        npts = int(window_length * 10)
+        nlag = int(max_lag * 10)
+        step = int(window_length * (1 - overlap) * 10)
+        taper = cosine_taper(npts, 0.05)
+        stacks = {}
+        for k in range(0, 6000, step):
+            start = self.t0 + k / 10.
+            windows = {}
+            for tr in stream:
+                i0 = int(round((start - tr.stats.starttime) * 10))
+                if i0 < 0 or i0 + npts > len(tr.data) or \
+                        np.ma.is_masked(tr.data[i0:i0 + npts]):
+                    continue
+                data = detrend(np.ma.getdata(tr.data)[i0:i0 + npts])
+                if onebit:
+                    data = np.sign(data)
+                windows[tr.id] = data * taper
+            for id1 in windows:
+                for id2 in windows:
+                    if id1 < id2:
+                        cc = correlate(windows[id1], windows[id2], nlag,
+                                       demean=False, method='direct')
+                        stacks.setdefault((id1, id2), []).append(cc)
+        return {pair: np.mean(ccs, axis=0) for pair, ccs in stacks.items()}
+
+    def test_linear_stack(self):
+        """
+        Linear stacks are the means of the correlations of all windows.
+        """
+        for overlap, onebit, block_size, threads in (
+                (0.5, False, 64, None), (0., True, 2, 3), (0.75, True, 1, 2)):
+            nc = NoiseCorrelation(60, 3, overlap=overlap, onebit=onebit,
+                                  block_size=block_size, threads=threads)
+            nc.add(self.stream)
+            expected = self._expected(self.stream, 60, 3, overlap, onebit)
+            pairs, stacks = nc.get_stacks()
+            self.assertEqual(sorted(pairs), sorted(expected))
+            for pair, stack in zip(pairs, stacks):
+                np.testing.assert_allclose(stack, expected[pair], atol=1e-10)
+            np.testing.assert_allclose(nc.lags, np.linspace(-3, 3, 61))
+            # the window with the gap is missing for the first station
+            counts = dict(zip(pairs, nc.counts))
+            self.assertEqual(counts['.ST1..', '.ST2..'] -
+                             counts['.ST0..', '.ST1..'],
+                             {0.: 1, 0.5: 2, 0.75: 4}[overlap])
+            # delays between the stations
+            for pair, stack in zip(pairs, stacks):
+                delays = [int(id_[3]) for id_ in pair]
+                delays = [(0, 7, -3, 12)[i] for i in delays]
+                self.assertEqual(np.argmax(stack) - 30,
+                                 delays[0] - delays[1])
+
+    def test_incremental_stacking(self):
+        """
+        Stacking piece by piece, also after saving and loading, is the same as
+        stacking all data at once.
+        """
+        nc = NoiseCorrelation(60, 3, overlap=0, onebit=True,
+                              whiten=(0.1, 0.2, 3, 4))
+        nc.add(self.stream)
+        _, linear = nc.get_stacks()
+        _, pws = nc.get_stacks('pws')
+        nc2 = NoiseCorrelation(60, 3, overlap=0, onebit=True,
+                               whiten=(0.1, 0.2, 3, 4))
+        nc2.add(self.stream.slice(endtime=self.t0 + 300))
+        with NamedTemporaryFile(suffix='.npz') as tf:
+            nc2.save_npz(tf.name)
+            nc2 = NoiseCorrelation.load_npz(tf.name)
+        nc2.add(self.stream.slice(starttime=self.t0 + 300))
+        self.assertEqual(nc2.pairs, nc.pairs)
+        np.testing.assert_array_equal(nc2.counts, nc.counts)
+        np.testing.assert_allclose(nc2.get_stacks()[1], linear, atol=1e-12)
+        np.testing.assert_allclose(nc2.get_stacks('pws')[1], pws, atol=1e-12)
+        # phase weighting only suppresses incoherent parts of the stacks
+        self.assertTrue(np.all(np.abs(pws) <= np.abs(linear) + 1e-12))
+        np.testing.assert_allclose(
+            np.abs(pws).max(axis=1), np.abs(linear).max(axis=1), rtol=0.1)
+
+    def test_phase_weighted_stack_of_one_window(self):
+        """
+        The phase weighted stack of a single window is its correlation.
+        """
+        nc = NoiseCorrelation(60, 3)
+        nc.add(self.stream.slice(self.t0 + 60, self.t0 + 120))
+        self.assertEqual(nc.counts.tolist(), [1] * 6)
+        np.testing.assert_allclose(nc.get_stacks('pws')[1],
+                                   nc.get_stacks()[1])
+        nc = NoiseCorrelation(60, 3, phase_stack=False)
+        nc.add(self.stream)
+        self.assertRaises(ValueError, nc.get_stacks, 'pws')
+
+
+def suite():
+    return unittest.makeSuite(NoiseCorrelationTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
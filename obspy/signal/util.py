@@ -297,6 +297,24 @@ def _npts2nfft(npts, smart=True):
     return nfft
 
 
+def _irfft(spectrum, n):
+    """
+    Inverse real FFT along the last axis of a two-dimensional spectrum, like
+    :func:`numpy.fft.irfft` with ``n`` points.
+
+    scipy's inverse real FFT is much faster than numpy's, the complex
+    spectrum is rearranged to its packed real format for it. The C contiguous
+    complex128 ``spectrum`` with ``n // 2 + 1`` columns is overwritten.
+
+    >>> x = np.random.randn(3, 10)
+    >>> np.allclose(_irfft(np.fft.rfft(x, axis=1), 10), x)
+    True
+    """
+    packed = spectrum.view(np.float64)
+    packed[:, 1] = packed[:, 0]
+    return fftpack.irfft(packed[:, 1:n + 1], axis=1, overwrite_x=True)
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -167,6 +167,7 @@ ENTRY_POINTS = {
         'GCF = obspy.io.gcf.core',
         'REFTEK130 = obspy.io.reftek.core',
         'RG16 = obspy.io.rg16.core',
+        'OBSPYNPZ = obspy.io.npz.core',
         ],
     'obspy.plugin.waveform.TSPAIR': [
         'isFormat = obspy.io.ascii.core:_is_tspair',
@@ -284,7 +285,12 @@ ENTRY_POINTS = {
     'obspy.plugin.waveform.RG16': [
         'isFormat = obspy.io.rg16.core:_is_rg16',
         'readFormat = obspy.io.rg16.core:_read_rg16',
-    ],
+        ],
+    'obspy.plugin.waveform.OBSPYNPZ': [
+        'isFormat = obspy.io.npz.core:_is_obspynpz',
+        'readFormat = obspy.io.npz.core:_read_obspynpz',
+        'writeFormat = obspy.io.npz.core:_write_obspynpz',
+        ],
     'obspy.plugin.event': [
         'QUAKEML = obspy.io.quakeml.core',
         'SC3ML = obspy.io.seiscomp.event',